@@ -0,0 +1,96 @@
+"""Measures how the KITTI export throughput scales with the number of workers.
+
+Usage:
+    python -m benchmarks.parallel_export --frames 100000 --workers 1 2 4 8
+"""
+
+import random
+from argparse import ArgumentParser
+from os import cpu_count, path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import List
+
+from tracklet_parser.tracklet import Tracklet
+from tracklet_parser.tracklet_parser import TrackletParser
+
+OBJECT_TYPES: List[str] = ["Car", "Pedestrian", "Cyclist", "Van", "Truck"]
+
+
+def create_tracklets(
+    frames: int, boxes_per_frame: int, seed: int = 0
+) -> List[Tracklet]:
+    """Creates a synthetic dataset of random tracklets.
+
+    Arguments:
+        frames (int): The number of frames.
+        boxes_per_frame (int): The number of boxes per frame.
+        seed (int): The seed of the random number generator.
+
+    Returns:
+        List[Tracklet]: The tracklets sorted by frame number
+    """
+    generator = random.Random(seed)
+    tracklets: List[Tracklet] = []
+    for frame_number in range(frames):
+        for _ in range(boxes_per_frame):
+            tracklet = Tracklet()
+            tracklet.frame_number = frame_number
+            tracklet.type = generator.choice(OBJECT_TYPES)
+            tracklet.truncated = generator.random()
+            tracklet.occluded = generator.randint(0, 3)
+            for key in ["height", "width", "length"]:
+                tracklet.put_dimension(key, generator.uniform(0.5, 5.0))
+            for key in ["x", "y", "z"]:
+                tracklet.put_location(key, generator.uniform(-50.0, 50.0))
+            tracklet.rotation_z = generator.uniform(-3.14, 3.14)
+            tracklets.append(tracklet)
+    return tracklets
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=100_000)
+    parser.add_argument("--boxes-per-frame", type=int, default=4)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, cpu_count() or 1}),
+    )
+    parser.add_argument(
+        "--executors", nargs="+", default=["thread", "process"]
+    )
+    arguments = parser.parse_args()
+
+    tracklets = create_tracklets(arguments.frames, arguments.boxes_per_frame)
+    frame_list_dir = TemporaryDirectory()
+    frame_list = path.join(frame_list_dir.name, "frame_list.txt")
+    with open(frame_list, "w", encoding="utf-8") as frame_list_file:
+        frame_list_file.writelines(
+            f"{frame_number} point_cloud_{frame_number:06d}\n"
+            for frame_number in range(arguments.frames)
+        )
+
+    print(f"{'executor':>8} {'workers':>7} {'seconds':>8} {'frames/s':>10}")
+    for executor in arguments.executors:
+        for workers in arguments.workers:
+            with TemporaryDirectory() as output_dir:
+                start = perf_counter()
+                report = TrackletParser.convert_tracklets_to_kitti(
+                    tracklets,
+                    frame_list,
+                    output_dir,
+                    workers=workers,
+                    executor=executor,
+                )
+                elapsed = perf_counter() - start
+            print(
+                f"{executor:>8} {workers:>7} {elapsed:>8.2f}"
+                f" {report.files_written / elapsed:>10.0f}"
+            )
+    frame_list_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
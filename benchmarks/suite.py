@@ -0,0 +1,191 @@
+"""Times the parsing, frame list loading and export stages on a synthetic
+CVAT export and writes the results to a JSON file.
+
+Every stage is timed `--repeat` times and then run once more under
+tracemalloc to measure its peak memory, so the timings are not slowed
+down by the allocation tracing.
+
+Usage:
+    python -m benchmarks.suite --frames 10000 --tracks 2000 --poses-per-track 50 --output benchmark.json
+"""
+
+import json
+import platform
+import tracemalloc
+from argparse import ArgumentParser
+from importlib.metadata import PackageNotFoundError, version
+from os import path
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+from benchmarks.synthetic_export import write_synthetic_export
+from tracklet_parser.tracklet_parser import TrackletParser
+
+
+def measure(stage: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """Times a stage and measures its peak memory.
+
+    Arguments:
+        stage (Callable[[], Any]): The stage to run.
+        repeat (int): The number of timed runs.
+
+    Returns:
+        Dict[str, Any]: The run times in seconds, their best and median and the peak traced memory in bytes
+    """
+    seconds: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        stage()
+        seconds.append(perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        stage()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "seconds": seconds,
+        "best_seconds": min(seconds),
+        "median_seconds": median(seconds),
+        "peak_bytes": peak_bytes,
+    }
+
+
+def run_suite(
+    frames: int,
+    tracks: int,
+    poses_per_track: int,
+    repeat: int = 3,
+    workers: int = 1,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Runs all benchmark stages on a freshly generated export.
+
+    Arguments:
+        frames (int): The number of frames of the recording.
+        tracks (int): The number of tracks.
+        poses_per_track (int): The number of poses per track.
+        repeat (int): The number of timed runs per stage.
+        workers (int): The number of workers of the export.
+        seed (int): The seed of the random number generator.
+
+    Returns:
+        Dict[str, Any]: The machine-readable benchmark results
+    """
+    with TemporaryDirectory() as temp_dir:
+        tracklet_xml, frame_list, boxes = write_synthetic_export(
+            path.join(temp_dir, "export"),
+            frames,
+            tracks,
+            poses_per_track,
+            seed,
+        )
+        tracklets = TrackletParser.parse_tracklet_xml(tracklet_xml)
+        output_dir = path.join(temp_dir, "labels")
+
+        stages = {
+            "parse_tracklet_xml": measure(
+                lambda: TrackletParser.parse_tracklet_xml(tracklet_xml),
+                repeat,
+            ),
+            "parse_tracklet_xml_fast": measure(
+                lambda: TrackletParser.parse_tracklet_xml(
+                    tracklet_xml, backend="fast"
+                ),
+                repeat,
+            ),
+            "parse_tracklet_xml_projected": measure(
+                lambda: TrackletParser.parse_tracklet_xml(
+                    tracklet_xml,
+                    backend="fast",
+                    fields=["type", "frame_number", "location"],
+                ),
+                repeat,
+            ),
+            "parse_tracklet_xml_sharded": measure(
+                lambda: TrackletParser.parse_tracklet_xml(
+                    tracklet_xml, workers=workers
+                ),
+                repeat,
+            ),
+            "load_frame_list": measure(
+                lambda: TrackletParser._load_frame_list(frame_list), repeat
+            ),
+            "convert_tracklets_to_kitti": measure(
+                lambda: TrackletParser.convert_tracklets_to_kitti(
+                    tracklets, frame_list, output_dir, workers=workers
+                ),
+                repeat,
+            ),
+        }
+        xml_bytes = path.getsize(tracklet_xml)
+
+    for stage in stages.values():
+        stage["boxes_per_second"] = boxes / stage["best_seconds"]
+    return {
+        "package_version": _package_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "frames": frames,
+            "tracks": tracks,
+            "poses_per_track": poses_per_track,
+            "repeat": repeat,
+            "workers": workers,
+            "seed": seed,
+        },
+        "boxes": boxes,
+        "xml_bytes": xml_bytes,
+        "stages": stages,
+    }
+
+
+def _package_version() -> str:
+    """Get the installed version of the package.
+
+    Returns:
+        str: The version, or "unknown" if the package is not installed
+    """
+    try:
+        return version("tracklet_parser")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=10_000)
+    parser.add_argument("--tracks", type=int, default=2_000)
+    parser.add_argument("--poses-per-track", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark.json")
+    arguments = parser.parse_args()
+
+    results = run_suite(
+        arguments.frames,
+        arguments.tracks,
+        arguments.poses_per_track,
+        arguments.repeat,
+        arguments.workers,
+        arguments.seed,
+    )
+    with open(arguments.output, "w", encoding="utf-8") as json_file:
+        json.dump(results, json_file, indent=2)
+
+    print(f"{'stage':<28} {'best s':>8} {'peak MiB':>9} {'boxes/s':>10}")
+    for name, stage in results["stages"].items():
+        print(
+            f"{name:<28} {stage['best_seconds']:>8.3f}"
+            f" {stage['peak_bytes'] / 2**20:>9.1f}"
+            f" {stage['boxes_per_second']:>10.0f}"
+        )
+    print(f"Results written to {arguments.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""Generates synthetic CVAT exports of configurable size.
+
+Usage:
+    python -m benchmarks.synthetic_export path/to/export --frames 10000 --tracks 2000 --poses-per-track 50
+"""
+
+import random
+from argparse import ArgumentParser
+from os import makedirs, path
+from typing import List, Tuple
+
+OBJECT_TYPES: List[str] = ["Car", "Pedestrian", "Cyclist", "Van", "Truck"]
+# Boost serialization describes every class on its first occurrence
+_FIRST_TRACK: str = ' class_id="1" tracking_level="0" version="1"'
+_FIRST_POSES: str = ' class_id="2" tracking_level="0" version="0"'
+_FIRST_POSE: str = ' class_id="3" tracking_level="0" version="2"'
+
+
+def write_tracklet_xml(
+    tracklet_xml: str,
+    frames: int,
+    tracks: int,
+    poses_per_track: int,
+    seed: int = 0,
+) -> int:
+    """Writes a tracklet XML file in the boost serialization layout of CVAT.
+
+    Every track starts at a random frame and covers up to `poses_per_track`
+    consecutive frames within `[0, frames)`. Like in real exports, the
+    first track, its poses and its first pose carry the class attributes of
+    boost serialization.
+
+    Arguments:
+        tracklet_xml (str): The path to the tracklet XML file.
+        frames (int): The number of frames of the recording.
+        tracks (int): The number of tracks.
+        poses_per_track (int): The number of poses per track.
+        seed (int): The seed of the random number generator.
+
+    Returns:
+        int: The number of boxes, i.e. poses, written
+    """
+    generator = random.Random(seed)
+    poses_per_track = max(1, min(poses_per_track, frames))
+    boxes = 0
+    with open(tracklet_xml, "w", encoding="utf-8") as xml_file:
+        xml_file.write(
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes" ?>\n'
+            "<!DOCTYPE boost_serialization>\n"
+            '<boost_serialization signature="serialization::archive"'
+            ' version="9">\n'
+            '<tracklets class_id="0" tracking_level="0" version="0">\n'
+            f"  <count>{tracks}</count>\n"
+            "  <item_version>1</item_version>\n"
+        )
+        for track in range(tracks):
+            first_frame = generator.randrange(frames - poses_per_track + 1)
+            height, width, length = (
+                generator.uniform(0.5, 5.0) for _ in range(3)
+            )
+            x = generator.uniform(-50.0, 50.0)
+            y = generator.uniform(-50.0, 50.0)
+            rotation = generator.uniform(-3.14, 3.14)
+            xml_file.write(
+                f"  <item{_FIRST_TRACK if track == 0 else ''}>\n"
+                f"    <objectType>{generator.choice(OBJECT_TYPES)}"
+                "</objectType>\n"
+                f"    <h>{height:.6f}</h>\n"
+                f"    <w>{width:.6f}</w>\n"
+                f"    <l>{length:.6f}</l>\n"
+                f"    <first_frame>{first_frame}</first_frame>\n"
+                f"    <poses{_FIRST_POSES if track == 0 else ''}>\n"
+                f"      <count>{poses_per_track}</count>\n"
+                "      <item_version>2</item_version>\n"
+            )
+            for pose in range(poses_per_track):
+                x += generator.uniform(-0.5, 0.5)
+                y += generator.uniform(-0.5, 0.5)
+                rotation += generator.uniform(-0.05, 0.05)
+                xml_file.write(
+                    f"      <item{_FIRST_POSE if track == pose == 0 else ''}>\n"
+                    f"        <tx>{x:.6f}</tx>\n"
+                    f"        <ty>{y:.6f}</ty>\n"
+                    f"        <tz>{-1.7 + height / 2:.6f}</tz>\n"
+                    "        <rx>0.000000</rx>\n"
+                    "        <ry>0.000000</ry>\n"
+                    f"        <rz>{rotation:.6f}</rz>\n"
+                    "        <state>1</state>\n"
+                    f"        <occlusion>{generator.randint(0, 3)}"
+                    "</occlusion>\n"
+                    "        <occlusion_kf>1</occlusion_kf>\n"
+                    f"        <truncation>{generator.random():.6f}"
+                    "</truncation>\n"
+                    "        <amt_occlusion>-1</amt_occlusion>\n"
+                    "        <amt_occlusion_kf>-1</amt_occlusion_kf>\n"
+                    "        <amt_border_l>-1</amt_border_l>\n"
+                    "        <amt_border_r>-1</amt_border_r>\n"
+                    "        <amt_border_kf>-1</amt_border_kf>\n"
+                    "      </item>\n"
+                )
+            boxes += poses_per_track
+            xml_file.write(
+                "    </poses>\n    <finished>1</finished>\n  </item>\n"
+            )
+        xml_file.write("</tracklets>\n</boost_serialization>\n")
+    return boxes
+
+
+def write_frame_list(frame_list: str, frames: int) -> None:
+    """Writes a CVAT frame list naming every frame after its point cloud.
+
+    Arguments:
+        frame_list (str): The path to the frame list.
+        frames (int): The number of frames.
+    """
+    with open(frame_list, "w", encoding="utf-8") as frame_list_file:
+        frame_list_file.writelines(
+            f"{frame_number} point_cloud_{frame_number:06d}\n"
+            for frame_number in range(frames)
+        )
+
+
+def write_synthetic_export(
+    export_dir: str,
+    frames: int,
+    tracks: int,
+    poses_per_track: int,
+    seed: int = 0,
+) -> Tuple[str, str, int]:
+    """Writes a synthetic CVAT export with a tracklet XML file and a frame
+    list.
+
+    Arguments:
+        export_dir (str): The export directory, which is created if missing.
+        frames (int): The number of frames of the recording.
+        tracks (int): The number of tracks.
+        poses_per_track (int): The number of poses per track.
+        seed (int): The seed of the random number generator.
+
+    Returns:
+        Tuple[str, str, int]: The paths to the tracklet XML file and the frame list and the number of boxes
+    """
+    makedirs(export_dir, exist_ok=True)
+    tracklet_xml = path.join(export_dir, "tracklet_labels.xml")
+    frame_list = path.join(export_dir, "frame_list.txt")
+    boxes = write_tracklet_xml(
+        tracklet_xml, frames, tracks, poses_per_track, seed
+    )
+    write_frame_list(frame_list, frames)
+    return tracklet_xml, frame_list, boxes
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("export_dir")
+    parser.add_argument("--frames", type=int, default=10_000)
+    parser.add_argument("--tracks", type=int, default=2_000)
+    parser.add_argument("--poses-per-track", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    tracklet_xml, frame_list, boxes = write_synthetic_export(
+        arguments.export_dir,
+        arguments.frames,
+        arguments.tracks,
+        arguments.poses_per_track,
+        arguments.seed,
+    )
+    print(f"Wrote {boxes} boxes to {tracklet_xml} and {frame_list}")
+
+
+if __name__ == "__main__":
+    main()
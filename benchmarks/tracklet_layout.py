@@ -0,0 +1,120 @@
+"""Compares the memory per Tracklet instance and the KITTI formatting
+throughput of the dictionary based layout with the slotted layout.
+
+Usage:
+    python -m benchmarks.tracklet_layout --instances 100000
+"""
+
+import tracemalloc
+from argparse import ArgumentParser
+from copy import deepcopy
+from time import perf_counter
+from typing import Callable, Dict, List
+
+from tracklet_parser.tracklet import Tracklet
+from tracklet_parser.tracklet_parser import TrackletParser
+
+
+class LegacyTracklet:
+    """The dictionary based layout with copying accessors of version
+    1.1.0."""
+
+    def __init__(self):
+        self._frame_number = -1
+        self._type = ""
+        self._truncated = 0.0
+        self._occluded = 0
+        self._alpha = 0.0
+        self._bbox = {"left": 0.0, "top": 0.0, "right": 0.0, "bottom": 0.0}
+        self._dimensions = {"height": 0.0, "width": 0.0, "length": 0.0}
+        self._location = {"x": 0.0, "y": 0.0, "z": 0.0}
+        self._rotation_z = 0.0
+
+    @property
+    def bbox(self) -> Dict[str, float]:
+        return deepcopy(self._bbox)
+
+    @property
+    def dimensions(self) -> Dict[str, float]:
+        return deepcopy(self._dimensions)
+
+    @property
+    def location(self) -> Dict[str, float]:
+        return deepcopy(self._location)
+
+    def put_dimension(self, key: str, value: float):
+        self._dimensions[key] = value
+
+    def put_location(self, key: str, value: float):
+        self._location[key] = value
+
+
+def format_legacy(tracklet: LegacyTracklet) -> str:
+    """Formats a tracklet like `_map_tracklet_to_KITTI` of version 1.1.0."""
+    information = [
+        tracklet._type,
+        tracklet._truncated,
+        tracklet._occluded,
+        tracklet._alpha,
+        tracklet.bbox["left"],
+        tracklet.bbox["top"],
+        tracklet.bbox["right"],
+        tracklet.bbox["bottom"],
+        tracklet.dimensions["height"],
+        tracklet.dimensions["width"],
+        tracklet.dimensions["length"],
+        tracklet.location["x"],
+        tracklet.location["y"],
+        tracklet.location["z"],
+        tracklet._rotation_z,
+    ]
+    return " ".join(map(str, information))
+
+
+def create(factory: Callable, instances: int) -> List:
+    """Creates tracklets with distinct dimensions and locations."""
+    tracklets = []
+    for index in range(instances):
+        tracklet = factory()
+        for key in ["height", "width", "length"]:
+            tracklet.put_dimension(key, index * 0.5)
+        for key in ["x", "y", "z"]:
+            tracklet.put_location(key, index * 0.25)
+        tracklets.append(tracklet)
+    return tracklets
+
+
+def measure(name: str, factory: Callable, formatter: Callable, instances: int):
+    """Prints the memory per instance and the formatting throughput."""
+    tracemalloc.start()
+    tracklets = create(factory, instances)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = perf_counter()
+    for tracklet in tracklets:
+        formatter(tracklet)
+    elapsed = perf_counter() - start
+    print(
+        f"{name:>8} {memory / instances:>14.0f}"
+        f" {instances / elapsed:>15.0f}"
+    )
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--instances", type=int, default=100_000)
+    arguments = parser.parse_args()
+
+    print(f"{'layout':>8} {'bytes/instance':>14} {'labels/s':>15}")
+    measure("dict", LegacyTracklet, format_legacy, arguments.instances)
+    measure(
+        "slots",
+        Tracklet,
+        TrackletParser._map_tracklet_to_KITTI,
+        arguments.instances,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+import json
+import os
+import shutil
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from tracklet_parser.batch import (
+    BatchJob,
+    JobSummary,
+    discover_jobs,
+    load_manifest,
+    run_batch,
+    run_job,
+)
+from tracklet_parser.cli import main
+
+
+def _crash_job(job: BatchJob, validate: bool = False) -> JobSummary:
+    """Helper function killing the worker of jobs of crashing exports."""
+    if "crash" in job.tracklet_xml:
+        os._exit(1)
+    return run_job(job, validate)
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        resources = os.path.join(os.path.dirname(__file__), "resources")
+        self.temp_dir = TemporaryDirectory()
+        self.exports_dir = os.path.join(self.temp_dir.name, "exports")
+        self.output_root = os.path.join(self.temp_dir.name, "labels")
+
+        # One valid and one broken export
+        valid_dir = os.path.join(self.exports_dir, "task_1")
+        broken_dir = os.path.join(self.exports_dir, "task_2")
+        os.makedirs(valid_dir)
+        os.makedirs(broken_dir)
+        shutil.copy(
+            os.path.join(resources, "example_tracklet_labels.xml"),
+            os.path.join(valid_dir, "tracklet_labels.xml"),
+        )
+        shutil.copy(
+            os.path.join(resources, "example_frame_list.txt"),
+            os.path.join(valid_dir, "frame_list.txt"),
+        )
+        with open(
+            os.path.join(broken_dir, "tracklet_labels.xml"), "w"
+        ) as broken_file:
+            broken_file.write("<boost_serialization><tracklets>")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_discover_jobs(self):
+        """Test creating jobs from a glob pattern."""
+        jobs = discover_jobs(
+            os.path.join(self.exports_dir, "*", "tracklet_labels.xml"),
+            self.output_root,
+        )
+        self.assertEqual(
+            [job.output_dir for job in jobs],
+            [
+                os.path.join(self.output_root, "task_1"),
+                os.path.join(self.output_root, "task_2"),
+            ],
+        )
+        self.assertTrue(jobs[0].frame_list.endswith("frame_list.txt"))
+
+    def test_load_manifest(self):
+        """Test loading jobs from a manifest with relative paths."""
+        manifest = os.path.join(self.temp_dir.name, "manifest.json")
+        with open(manifest, "w") as manifest_file:
+            json.dump(
+                [
+                    {
+                        "tracklet_xml": "exports/task_1/tracklet_labels.xml",
+                        "frame_list": "exports/task_1/frame_list.txt",
+                        "output_dir": "labels/task_1",
+                    }
+                ],
+                manifest_file,
+            )
+        jobs = load_manifest(manifest)
+        self.assertEqual(
+            jobs[0].output_dir, os.path.join(self.output_root, "task_1")
+        )
+
+        with open(manifest, "w") as manifest_file:
+            json.dump([{"tracklet_xml": "tracklet_labels.xml"}], manifest_file)
+        with self.assertRaises(ValueError):
+            load_manifest(manifest)
+
+    def test_run_batch_isolates_errors(self):
+        """Test that a broken export does not abort the batch."""
+        jobs = discover_jobs(
+            os.path.join(self.exports_dir, "*", "tracklet_labels.xml"),
+            self.output_root,
+        )
+        summaries = run_batch(jobs, workers=2, max_in_flight=1)
+        self.assertIsNone(summaries[0].error)
+        self.assertEqual(summaries[0].boxes, 3)
+        self.assertEqual(summaries[0].files_written, 3)
+        self.assertIn("ParseError", summaries[1].error)
+
+    def test_run_batch_broken_pool(self):
+        """Test that a job killing its worker does not abort the batch."""
+        valid_dir = os.path.join(self.exports_dir, "task_1")
+        jobs = [
+            BatchJob(
+                os.path.join(valid_dir, "tracklet_labels.xml"),
+                os.path.join(valid_dir, "frame_list.txt"),
+                os.path.join(self.output_root, f"task_{index}"),
+            )
+            for index in range(4)
+        ]
+        jobs[1].tracklet_xml = "crash.xml"
+        with patch("tracklet_parser.batch.run_job", _crash_job):
+            summaries = run_batch(jobs, workers=2)
+        self.assertIn("BrokenProcessPool", summaries[1].error)
+        for index in (0, 2, 3):
+            self.assertIsNone(summaries[index].error)
+            self.assertEqual(summaries[index].files_written, 3)
+
+    def test_run_batch_validate(self):
+        """Test that exports failing validation are not written."""
+        frame_list = os.path.join(self.exports_dir, "task_1", "frame_list.txt")
+        with open(frame_list, "w") as frame_list_file:
+            frame_list_file.write("42 point_cloud_042\n")
+        jobs = discover_jobs(
+            os.path.join(self.exports_dir, "task_1", "tracklet_labels.xml"),
+            self.output_root,
+        )
+        (summary,) = run_batch(jobs, workers=1, validate=True)
+        self.assertIn("ValidationError", summary.error)
+        self.assertEqual(summary.validation.missing_frames, [100, 200])
+        self.assertFalse(os.path.exists(jobs[0].output_dir))
+
+    def test_run_batch_empty(self):
+        """Test running a batch without jobs."""
+        self.assertEqual(run_batch([], workers=1), [])
+
+    def test_cli_batch(self):
+        """Test the batch subcommand and its summary file."""
+        summary_file = os.path.join(self.temp_dir.name, "summary.json")
+        exit_code = main(
+            [
+                "batch",
+                "--glob",
+                os.path.join(self.exports_dir, "*", "tracklet_labels.xml"),
+                "--output-root",
+                self.output_root,
+                "--workers",
+                "1",
+                "--summary",
+                summary_file,
+            ]
+        )
+        self.assertEqual(exit_code, 1)
+        with open(summary_file) as json_file:
+            summary = json.load(json_file)
+        self.assertEqual(len(summary), 2)
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(self.output_root, "task_1"))),
+            [
+                "point_cloud_042.txt",
+                "point_cloud_100.txt",
+                "point_cloud_200.txt",
+            ],
+        )
+
+    def test_cli_batch_invalid_jobs(self):
+        """Test that an invalid manifest is reported without a traceback."""
+        manifest = os.path.join(self.temp_dir.name, "manifest.json")
+        with open(manifest, "w") as manifest_file:
+            json.dump([{"tracklet_xml": "tracklet_labels.xml"}], manifest_file)
+        with redirect_stderr(StringIO()) as stderr:
+            exit_code = main(["batch", "--manifest", manifest])
+        self.assertEqual(exit_code, 1)
+        self.assertIn("incomplete", stderr.getvalue())
+
+    def test_invalid_workers(self):
+        """Test that less than one worker or job in flight is rejected."""
+        for workers, max_in_flight in [(0, None), (-2, None), (None, 0)]:
+            with self.subTest(workers=workers, max_in_flight=max_in_flight):
+                with self.assertRaises(ValueError):
+                    run_batch([], workers, max_in_flight)
+        with redirect_stderr(StringIO()) as stderr:
+            exit_code = main(
+                [
+                    "batch",
+                    "--glob",
+                    os.path.join(self.temp_dir.name, "*.xml"),
+                    "--output-root",
+                    self.temp_dir.name,
+                    "--workers",
+                    "-2",
+                ]
+            )
+        self.assertEqual(exit_code, 1)
+        self.assertIn("invalid number of workers", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import json
+import os
+import shutil
+import struct
+import unittest
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import numpy as np
+
+from tracklet_parser.cache import CACHE_SUFFIX
+from tracklet_parser.tracklet_parser import TrackletParser
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = TemporaryDirectory()
+        self.tracklet_xml = os.path.join(
+            self.temporary_directory.name, "tracklet_labels.xml"
+        )
+        shutil.copyfile(
+            os.path.join(
+                os.path.dirname(__file__),
+                "resources",
+                "example_tracklet_labels.xml",
+            ),
+            self.tracklet_xml,
+        )
+        self.cache_file = f"{self.tracklet_xml}{CACHE_SUFFIX}"
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def _parse_cached(self, expect_parse: bool):
+        with mock.patch.object(
+            TrackletParser,
+            "iter_tracks",
+            wraps=TrackletParser.iter_tracks,
+        ) as iter_tracks:
+            table = TrackletParser.parse_tracklet_table(
+                self.tracklet_xml, cache=True
+            )
+        self.assertEqual(iter_tracks.called, expect_parse)
+        return table
+
+    def _edit_header(self, edit):
+        """Helper method to edit the JSON header of the cache in place."""
+        with open(self.cache_file, "r+b") as cache_file:
+            data = cache_file.read()
+            (header_size,) = struct.unpack_from("<Q", data, 8)
+            header = json.loads(data[16 : 16 + header_size])
+            edit(header)
+            encoded_header = json.dumps(header).encode("utf-8")
+            cache_file.seek(16)
+            cache_file.write(encoded_header.ljust(header_size))
+
+    def test_cache_roundtrip(self):
+        """Test that a cached table equals the parsed table."""
+        expected = TrackletParser.parse_tracklet_table(self.tracklet_xml)
+        self._parse_cached(expect_parse=True)
+        self.assertTrue(os.path.exists(self.cache_file))
+
+        cached = self._parse_cached(expect_parse=False)
+        self.assertEqual(cached.types, expected.types)
+        for name in type(expected).COLUMNS:
+            np.testing.assert_array_equal(
+                getattr(cached, name), getattr(expected, name)
+            )
+        self.assertEqual(
+            [tracklet.frame_number for tracklet in cached.to_tracklets()],
+            [
+                tracklet.frame_number
+                for tracklet in TrackletParser.parse_tracklet_xml(
+                    self.tracklet_xml, cache=True
+                )
+            ],
+        )
+
+    def test_touched_file_is_validated_by_hash(self):
+        """Test that a changed modification time alone keeps the cache."""
+        self._parse_cached(expect_parse=True)
+        status = os.stat(self.tracklet_xml)
+        os.utime(
+            self.tracklet_xml,
+            ns=(status.st_atime_ns, status.st_mtime_ns + 10**9),
+        )
+        self._parse_cached(expect_parse=False)
+
+    def test_modified_file_invalidates_cache(self):
+        """Test that editing the XML file triggers a new parse."""
+        self._parse_cached(expect_parse=True)
+        with open(self.tracklet_xml, "r") as xml_file:
+            content = xml_file.read()
+        with open(self.tracklet_xml, "w") as xml_file:
+            xml_file.write(content.replace("Car", "Van", 1))
+
+        table = self._parse_cached(expect_parse=True)
+        self.assertIn("Van", table.types)
+        self._parse_cached(expect_parse=False)
+
+    def test_corrupt_cache_is_ignored(self):
+        """Test that an unreadable cache file is replaced."""
+        with open(self.cache_file, "wb") as cache_file:
+            cache_file.write(b"garbage")
+
+        with self.assertLogs("tracklet_parser.cache", level="WARNING"):
+            table = self._parse_cached(expect_parse=True)
+        self.assertGreater(len(table), 0)
+        self._parse_cached(expect_parse=False)
+
+    def test_incompatible_header_is_ignored(self):
+        """Test that caches of another version or with an incomplete header
+        are replaced instead of raising."""
+        self._parse_cached(expect_parse=True)
+        for edit in (
+            lambda header: header.update(version=2),
+            lambda header: header.pop("source"),
+            lambda header: header["source"].pop("sha256"),
+        ):
+            self._edit_header(edit)
+            with self.subTest(edit=edit):
+                with self.assertLogs("tracklet_parser.cache", level="WARNING"):
+                    self._parse_cached(expect_parse=True)
+                self._parse_cached(expect_parse=False)
+
+    def test_missing_file(self):
+        """Test that a missing XML file is reported with the cache enabled."""
+        with self.assertRaises(FileNotFoundError):
+            TrackletParser.parse_tracklet_table(
+                os.path.join(self.temporary_directory.name, "missing.xml"),
+                cache=True,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
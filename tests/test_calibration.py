@@ -0,0 +1,128 @@
+import math
+import os
+import unittest
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from tracklet_parser.calibration import Calibration
+from tracklet_parser.tracklet_table import TrackletTable
+
+# The LiDAR x, y and z axes point forward, left and up, the camera x, y and
+# z axes right, down and forward
+_LIDAR_TO_CAMERA = [[0, -1, 0, 0], [0, 0, -1, 0], [1, 0, 0, 0]]
+_PROJECTION = [[700, 0, 600, 0], [0, 700, 180, 0], [0, 0, 1, 0]]
+
+
+def _table(locations, rotations_z, dimensions) -> TrackletTable:
+    """Helper function to create a table of LiDAR boxes."""
+    count = len(locations)
+    return TrackletTable(
+        ["Car"],
+        frame_number=np.arange(count),
+        type_code=np.zeros(count),
+        truncated=np.zeros(count),
+        occluded=np.zeros(count),
+        alpha=np.zeros(count),
+        bbox=np.zeros((count, 4)),
+        dimensions=dimensions,
+        location=locations,
+        rotation_z=rotations_z,
+    )
+
+
+class TestCalibration(unittest.TestCase):
+    def setUp(self):
+        self.calibration = Calibration(
+            projection=_PROJECTION,
+            rectification=np.eye(3),
+            lidar_to_camera=_LIDAR_TO_CAMERA,
+        )
+
+    def test_to_camera(self):
+        """Test transforming LiDAR points into camera coordinates."""
+        np.testing.assert_allclose(
+            self.calibration.to_camera([[10.0, 2.0, -1.5]]),
+            [[-2.0, 1.5, 10.0]],
+        )
+
+    def test_transform_angles(self):
+        """Test converting the LiDAR yaw into rotation_y and alpha."""
+        table = _table(
+            [[10.0, 0.0, -1.7], [10.0, -10.0, -1.7]],
+            [0.0, math.pi / 2],
+            [[1.5, 1.8, 4.2]] * 2,
+        )
+        transformed = self.calibration.transform(table)
+        np.testing.assert_allclose(
+            transformed.rotation_z, [-math.pi / 2, -math.pi]
+        )
+        np.testing.assert_allclose(
+            transformed.alpha, [-math.pi / 2, 3 * math.pi / 4]
+        )
+        np.testing.assert_allclose(
+            transformed.location, [[0.0, 1.7, 10.0], [10.0, 1.7, 10.0]]
+        )
+        np.testing.assert_array_equal(transformed.dimensions, table.dimensions)
+
+    def test_transform_bbox(self):
+        """Test projecting a box facing away from the camera."""
+        table = _table([[10.0, 0.0, -1.7]], [0.0], [[1.5, 1.8, 4.2]])
+        left, top, right, bottom = self.calibration.transform(table).bbox[0]
+        nearest_depth, farthest_depth = 10.0 - 4.2 / 2, 10.0 + 4.2 / 2
+        self.assertAlmostEqual(left, 600 - 700 * 0.9 / nearest_depth)
+        self.assertAlmostEqual(right, 600 + 700 * 0.9 / nearest_depth)
+        # The top edge lies below the optical axis, closest to it far away
+        self.assertAlmostEqual(top, 180 + 700 * (1.7 - 1.5) / farthest_depth)
+        self.assertAlmostEqual(bottom, 180 + 700 * 1.7 / nearest_depth)
+
+    def test_transform_bbox_clipped_and_behind_camera(self):
+        """Test clipping boxes to the image and skipping hidden boxes."""
+        calibration = Calibration(
+            _PROJECTION, np.eye(3), _LIDAR_TO_CAMERA, image_size=(1242, 375)
+        )
+        table = _table(
+            [[3.0, 0.0, -1.7], [-10.0, 0.0, -1.7]],
+            [0.0, 0.0],
+            [[1.5, 1.8, 4.2]] * 2,
+        )
+        bbox = calibration.transform(table).bbox
+        self.assertEqual(bbox[0, 3], 374)
+        self.assertGreaterEqual(bbox[0, 0], 0)
+        np.testing.assert_array_equal(bbox[1], [0.0, 0.0, 0.0, 0.0])
+
+    def test_from_file(self):
+        """Test reading a calibration file of the KITTI benchmark."""
+        with TemporaryDirectory() as temp_dir:
+            calib_file = os.path.join(temp_dir, "calib.txt")
+            with open(calib_file, "w", encoding="utf-8") as calib_stream:
+                calib_stream.write(
+                    "P0: " + " ".join(["0"] * 12) + "\n"
+                    "P2: 700 0 600 0 0 700 180 0 0 0 1 0\n"
+                    "R0_rect: 1 0 0 0 1 0 0 0 1\n"
+                    "Tr_velo_to_cam: 0 -1 0 0 0 0 -1 0 1 0 0 0\n"
+                )
+            calibration = Calibration.from_file(calib_file, (1242, 375))
+        np.testing.assert_array_equal(calibration.projection, _PROJECTION)
+        np.testing.assert_array_equal(
+            calibration.lidar_to_camera, _LIDAR_TO_CAMERA
+        )
+        self.assertEqual(calibration.image_size, (1242, 375))
+
+    def test_from_file_missing_matrix(self):
+        """Test reading a calibration file without a projection matrix."""
+        with TemporaryDirectory() as temp_dir:
+            calib_file = os.path.join(temp_dir, "calib.txt")
+            with open(calib_file, "w", encoding="utf-8") as calib_stream:
+                calib_stream.write("R0_rect: 1 0 0 0 1 0 0 0 1\n")
+            with self.assertRaises(ValueError):
+                Calibration.from_file(calib_file)
+
+    def test_invalid_matrix(self):
+        """Test creating a calibration with a malformed matrix."""
+        with self.assertRaises(ValueError):
+            Calibration(_PROJECTION, np.eye(4), _LIDAR_TO_CAMERA)
+
+
+if __name__ == "__main__":
+    unittest.main()
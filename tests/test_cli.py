@@ -0,0 +1,165 @@
+import gzip
+import json
+import os
+import subprocess
+import sys
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+from tempfile import TemporaryDirectory
+
+from tracklet_parser.cli import main
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        resources = os.path.join(os.path.dirname(__file__), "resources")
+        self.tracklet_xml = os.path.join(
+            resources, "example_tracklet_labels.xml"
+        )
+        self.frame_list = os.path.join(resources, "example_frame_list.txt")
+        self.temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_convert(self):
+        """Test converting an export into a label directory."""
+        output_dir = os.path.join(self.temp_dir.name, "labels")
+        with redirect_stderr(StringIO()) as stderr:
+            exit_code = main(
+                [
+                    "convert",
+                    self.tracklet_xml,
+                    self.frame_list,
+                    output_dir,
+                    "--workers",
+                    "2",
+                    "--precision",
+                    "2",
+                    "--stats",
+                    os.path.join(self.temp_dir.name, "stats.json"),
+                ]
+            )
+        self.assertEqual(exit_code, 0)
+        self.assertIn("3 label files", stderr.getvalue())
+        with open(os.path.join(self.temp_dir.name, "stats.json")) as f:
+            self.assertEqual(json.load(f)["counters"]["boxes"], 3)
+        with open(os.path.join(output_dir, "point_cloud_042.txt")) as f:
+            self.assertEqual(
+                f.read(),
+                "Pedestrian 0.10 1 0.00 0.00 0.00 0.00 0.00 0.56 0.72 1.71"
+                " 0.85 -1.34 -1.61 0.00\n",
+            )
+
+    def test_convert_invalid_input(self):
+        """Test that conversion errors are reported by the exit code."""
+        with redirect_stderr(StringIO()) as stderr:
+            exit_code = main(
+                [
+                    "convert",
+                    os.path.join(self.temp_dir.name, "missing.xml"),
+                    self.frame_list,
+                    "-",
+                    "--sink",
+                    "tar",
+                ]
+            )
+        self.assertEqual(exit_code, 1)
+        self.assertIn("missing.xml", stderr.getvalue())
+
+    def test_convert_validate(self):
+        """Test that a failed validation is reported by the exit code."""
+        frame_list = os.path.join(self.temp_dir.name, "frame_list.txt")
+        with open(frame_list, "w") as frame_list_file:
+            frame_list_file.write("42 point_cloud_042\n")
+        output_dir = os.path.join(self.temp_dir.name, "labels")
+        with redirect_stderr(StringIO()) as stderr:
+            exit_code = main(
+                [
+                    "convert",
+                    self.tracklet_xml,
+                    frame_list,
+                    output_dir,
+                    "--validate",
+                ]
+            )
+        self.assertEqual(exit_code, 1)
+        self.assertIn("Validation failed", stderr.getvalue())
+        self.assertFalse(os.path.exists(output_dir))
+
+    def test_convert_pipe(self):
+        """Test piping an export from stdin to stdout."""
+        with open(self.tracklet_xml, "rb") as xml_file:
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "tracklet_parser",
+                    "convert",
+                    "-",
+                    self.frame_list,
+                    "-",
+                    "--sink",
+                    "concatenated",
+                ],
+                stdin=xml_file,
+                capture_output=True,
+                check=True,
+            )
+        labels = result.stdout.decode().splitlines()
+        self.assertEqual(len(labels), 3)
+        self.assertTrue(labels[0].startswith("Pedestrian"))
+
+    def test_convert_compressed_pipe(self):
+        """Test piping a gzip compressed export from stdin."""
+        with open(self.tracklet_xml, "rb") as xml_file:
+            data = gzip.compress(xml_file.read())
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "tracklet_parser",
+                "convert",
+                "-",
+                self.frame_list,
+                "-",
+                "--sink",
+                "concatenated",
+            ],
+            input=data,
+            capture_output=True,
+            check=True,
+        )
+        self.assertEqual(len(result.stdout.decode().splitlines()), 3)
+
+    def test_to_xml(self):
+        """Test converting label files back into a tracklet XML file."""
+        output_dir = os.path.join(self.temp_dir.name, "labels")
+        tracklet_xml = os.path.join(self.temp_dir.name, "tracklets.xml")
+        with redirect_stderr(StringIO()) as stderr:
+            main(["convert", self.tracklet_xml, self.frame_list, output_dir])
+            exit_code = main(
+                ["to-xml", output_dir, self.frame_list, tracklet_xml]
+            )
+        self.assertEqual(exit_code, 0)
+        self.assertIn("3 boxes", stderr.getvalue())
+        self.assertTrue(os.path.isfile(tracklet_xml))
+
+    def test_to_xml_missing_label_dir(self):
+        """Test that a missing label directory is reported by the exit code."""
+        with redirect_stderr(StringIO()) as stderr:
+            exit_code = main(
+                [
+                    "to-xml",
+                    os.path.join(self.temp_dir.name, "missing"),
+                    self.frame_list,
+                    "-",
+                ]
+            )
+        self.assertEqual(exit_code, 1)
+        self.assertIn("missing", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import gzip
+import lzma
+import os
+import unittest
+import zipfile
+from io import BufferedReader, BytesIO
+from tempfile import TemporaryDirectory
+
+from tracklet_parser import compression
+from tracklet_parser.compression import open_input
+from tracklet_parser.frame_list import read_frame_list
+from tracklet_parser.tracklet_parser import TrackletParser
+
+
+class TestCompression(unittest.TestCase):
+    def setUp(self):
+        resources = os.path.join(os.path.dirname(__file__), "resources")
+        with open(
+            os.path.join(resources, "example_tracklet_labels.xml"), "rb"
+        ) as xml_file:
+            self.xml_data = xml_file.read()
+        with open(
+            os.path.join(resources, "example_frame_list.txt"), "rb"
+        ) as frame_list_file:
+            self.frame_list_data = frame_list_file.read()
+        self.expected = [
+            (tracklet.frame_number, tracklet.type, tracklet.location)
+            for tracklet in TrackletParser.parse_tracklet_xml(
+                BytesIO(self.xml_data)
+            )
+        ]
+        self.temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _parse(self, tracklet_xml):
+        return [
+            (tracklet.frame_number, tracklet.type, tracklet.location)
+            for tracklet in TrackletParser.parse_tracklet_xml(tracklet_xml)
+        ]
+
+    def test_compressed_files(self):
+        """Test parsing gzip and xz compressed tracklet XML files."""
+        for suffix, open_compressed in [
+            (".gz", gzip.open),
+            (".xz", lzma.open),
+        ]:
+            tracklet_xml = os.path.join(
+                self.temp_dir.name, f"tracklet_labels.xml{suffix}"
+            )
+            with open_compressed(tracklet_xml, "wb") as compressed_file:
+                compressed_file.write(self.xml_data)
+            self.assertEqual(self._parse(tracklet_xml), self.expected)
+        self.assertEqual(len(self.expected), 3)
+
+    def test_cvat_zip_export(self):
+        """Test reading the tracklets and the frame list of a CVAT zip."""
+        archive = os.path.join(self.temp_dir.name, "export.zip")
+        with zipfile.ZipFile(archive, "w") as zip_file:
+            zip_file.writestr("tracklet_labels.xml", self.xml_data)
+            zip_file.writestr("velodyne/frame_list.txt", self.frame_list_data)
+
+        self.assertEqual(self._parse(archive), self.expected)
+        self.assertEqual(
+            read_frame_list(archive),
+            read_frame_list(BytesIO(self.frame_list_data)),
+        )
+
+        output_dir = os.path.join(self.temp_dir.name, "labels")
+        TrackletParser.convert_tracklets_to_kitti(
+            TrackletParser.parse_tracklet_table(archive), archive, output_dir
+        )
+        self.assertIn("point_cloud_042.txt", os.listdir(output_dir))
+
+    def test_zip_without_frame_list(self):
+        """Test that a missing frame list inside a zip is only a warning."""
+        archive = os.path.join(self.temp_dir.name, "export.zip")
+        with zipfile.ZipFile(archive, "w") as zip_file:
+            zip_file.writestr("tracklet_labels.xml", self.xml_data)
+
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(TrackletParser._load_frame_list(archive), {})
+        with self.assertRaises(FileNotFoundError):
+            with open_input(archive, "frame_list.txt"):
+                pass
+
+    def test_stream_is_not_closed(self):
+        """Test that binary streams are passed through without closing."""
+        stream = BytesIO(self.xml_data)
+        self.assertEqual(self._parse(stream), self.expected)
+        self.assertFalse(stream.closed)
+        with self.assertRaises(ValueError):
+            TrackletParser.parse_tracklet_table(BytesIO(), cache=True)
+
+    def test_compressed_streams(self):
+        """Test detecting compressed streams by their leading bytes."""
+        archive = BytesIO()
+        with zipfile.ZipFile(archive, "w") as zip_file:
+            zip_file.writestr("tracklet_labels.xml", self.xml_data)
+        for data in [
+            gzip.compress(self.xml_data),
+            lzma.compress(self.xml_data),
+            archive.getvalue(),
+        ]:
+            stream = BufferedReader(BytesIO(data))
+            self.assertEqual(self._parse(stream), self.expected)
+            self.assertFalse(stream.closed)
+            stream = BytesIO(data)
+            self.assertEqual(self._parse(stream), self.expected)
+            self.assertFalse(stream.closed)
+
+    @unittest.skipIf(compression.zstandard is None, "zstandard not installed")
+    def test_zstd(self):
+        """Test parsing a zstd compressed tracklet XML file."""
+        tracklet_xml = os.path.join(
+            self.temp_dir.name, "tracklet_labels.xml.zst"
+        )
+        with open(tracklet_xml, "wb") as compressed_file:
+            compressed_file.write(
+                compression.zstandard.ZstdCompressor().compress(self.xml_data)
+            )
+        self.assertEqual(self._parse(tracklet_xml), self.expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+import unittest
+from tempfile import TemporaryDirectory
+
+from tracklet_parser.frame_list import read_frame_list
+
+
+class TestFrameList(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.frame_list_path = os.path.join(
+            self.temp_dir.name, "frame_list.txt"
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_read_frame_list(self):
+        """Test reading a frame list with blank lines and whitespace."""
+        self._write_frame_list(
+            "0 frame_0000\n\n1  frame 0001 \r\n2\tframe_0002"
+        )
+        self.assertEqual(
+            read_frame_list(self.frame_list_path),
+            {0: "frame_0000", 1: "frame 0001", 2: "frame_0002"},
+        )
+
+    def test_read_frame_list_invalid(self):
+        """Test that malformed frame lists report the offending line."""
+        for content, message in [
+            ("0 frame_0000\n1\n", "Line 2"),
+            ("0 frame_0000\nx frame_0001\n", "Line 2"),
+            ("0 frame_0000\n0 frame_0001\n", "Line 2"),
+        ]:
+            self._write_frame_list(content)
+            with self.assertRaisesRegex(ValueError, message):
+                read_frame_list(self.frame_list_path)
+
+    def test_import_without_pandas(self):
+        """Test that importing the parser does not import pandas."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, tracklet_parser.tracklet_parser;"
+                "sys.exit('pandas' in sys.modules)",
+            ],
+            check=False,
+        )
+        self.assertEqual(result.returncode, 0)
+
+    def _write_frame_list(self, content: str):
+        """Helper method to write the frame list with the given content."""
+        with open(self.frame_list_path, "w", newline="") as frame_list_file:
+            frame_list_file.write(content)
+
+
+if __name__ == "__main__":
+    unittest.main()
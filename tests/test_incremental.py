@@ -0,0 +1,83 @@
+import json
+import os
+import unittest
+from tempfile import TemporaryDirectory
+
+from tracklet_parser.kitti_writer import LABEL_MANIFEST
+from tracklet_parser.tracklet_parser import TrackletParser
+
+
+class TestIncrementalConversion(unittest.TestCase):
+    def setUp(self):
+        resources = os.path.join(os.path.dirname(__file__), "resources")
+        self.frame_list_path = os.path.join(
+            resources, "example_frame_list.txt"
+        )
+        self.tracklets = TrackletParser.parse_tracklet_xml(
+            os.path.join(resources, "example_tracklet_labels.xml")
+        )
+        self.temp_dir = TemporaryDirectory()
+        self.output_dir = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _convert(self, tracklets, workers=1):
+        return TrackletParser.convert_tracklets_to_kitti(
+            tracklets,
+            self.frame_list_path,
+            self.output_dir,
+            workers=workers,
+            incremental=True,
+        )
+
+    def test_unchanged_frames_are_skipped(self):
+        """Test that a re-run without changes writes nothing."""
+        first_report = self._convert(self.tracklets)
+        self.assertEqual(first_report.files_written, 3)
+        with open(os.path.join(self.output_dir, LABEL_MANIFEST)) as manifest:
+            self.assertEqual(len(json.load(manifest)["files"]), 3)
+
+        report = self._convert(self.tracklets, workers=2)
+        self.assertEqual(report.files_written, 0)
+        self.assertEqual(report.files_skipped, 3)
+
+    def test_changed_and_removed_frames(self):
+        """Test rewriting changed frames and deleting empty frames."""
+        self._convert(self.tracklets)
+        self.tracklets[0].put_location("x", 10.0)
+        report = self._convert(self.tracklets[:2])
+        self.assertEqual(report.files_written, 1)
+        self.assertEqual(report.files_skipped, 1)
+        self.assertEqual(report.files_deleted, 1)
+        self.assertFalse(
+            os.path.exists(
+                os.path.join(self.output_dir, "point_cloud_200.txt")
+            )
+        )
+        with open(
+            os.path.join(self.output_dir, "point_cloud_042.txt")
+        ) as label_file:
+            self.assertIn(" 10.0 ", label_file.read())
+
+    def test_missing_label_file_is_restored(self):
+        """Test that label files deleted by hand are written again."""
+        self._convert(self.tracklets)
+        os.remove(os.path.join(self.output_dir, "point_cloud_100.txt"))
+        report = self._convert(self.tracklets)
+        self.assertEqual(report.files_written, 1)
+
+    def test_full_conversion_discards_manifest(self):
+        """Test that a full conversion invalidates the manifest."""
+        self._convert(self.tracklets)
+        TrackletParser.convert_tracklets_to_kitti(
+            self.tracklets, self.frame_list_path, self.output_dir
+        )
+        self.assertFalse(
+            os.path.exists(os.path.join(self.output_dir, LABEL_MANIFEST))
+        )
+        self.assertEqual(self._convert(self.tracklets).files_written, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import pstats
+import unittest
+from tempfile import TemporaryDirectory
+
+from tracklet_parser.instrumentation import Instrumentation, Stats
+from tracklet_parser.tracklet_parser import TrackletParser
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        resources = os.path.join(os.path.dirname(__file__), "resources")
+        self.tracklet_xml = os.path.join(
+            resources, "example_tracklet_labels.xml"
+        )
+        self.frame_list = os.path.join(resources, "example_frame_list.txt")
+        self.temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_parse(self):
+        """Test the stage times, counters and progress of parsing."""
+        progress = []
+        instrumentation = Instrumentation(
+            progress=lambda name, total: progress.append((name, total))
+        )
+        tracklets = TrackletParser.parse_tracklet_xml(
+            self.tracklet_xml, instrumentation=instrumentation
+        )
+        self.assertEqual(len(tracklets), 3)
+        stats = instrumentation.stats
+        self.assertEqual(stats.counters, {"tracks": 3, "boxes": 3})
+        self.assertEqual(set(stats.seconds), {"parse", "expand", "sort"})
+        self.assertIn(("tracks", 3), progress)
+        self.assertIsNone(stats.peak_memory_bytes)
+
+        table = TrackletParser.parse_tracklet_table(
+            self.tracklet_xml, instrumentation=instrumentation
+        )
+        self.assertEqual(len(table), 3)
+        self.assertEqual(stats.counters["boxes"], 6)
+
+    def test_convert(self):
+        """Test the stage times and counters of a parallel conversion."""
+        tracklets = TrackletParser.parse_tracklet_xml(self.tracklet_xml)
+        for executor in ["thread", "process"]:
+            instrumentation = Instrumentation()
+            report = TrackletParser.convert_tracklets_to_kitti(
+                tracklets,
+                self.frame_list,
+                os.path.join(self.temp_dir.name, executor),
+                workers=2,
+                executor=executor,
+                instrumentation=instrumentation,
+            )
+            stats = instrumentation.stats
+            self.assertEqual(stats.counters["files_written"], 3)
+            self.assertEqual(
+                stats.counters["bytes_written"], report.bytes_written
+            )
+            self.assertEqual(stats.counters["label_files"], 3)
+            self.assertTrue(
+                {"frame_list", "group", "format", "write"}
+                <= set(stats.seconds)
+            )
+
+    def test_profile_and_memory(self):
+        """Test the optional cProfile and tracemalloc wrappers."""
+        instrumentation = Instrumentation(profile=True, trace_memory=True)
+        TrackletParser.parse_tracklet_xml(
+            self.tracklet_xml, instrumentation=instrumentation
+        )
+        self.assertGreater(instrumentation.stats.peak_memory_bytes, 0)
+        profile = pstats.Stats(instrumentation.profiler)
+        self.assertTrue(
+            any(
+                function[2] == "_parse_track"
+                for function in profile.stats.keys()
+            )
+        )
+
+    def test_stats_merge(self):
+        """Test summing up the stats of several calls."""
+        stats = Stats({"parse": 1.0}, {"boxes": 2}, 10)
+        stats.merge(Stats({"parse": 0.5, "sort": 0.1}, {"boxes": 1}, 20))
+        self.assertEqual(
+            stats.to_dict(),
+            {
+                "seconds": {"parse": 1.5, "sort": 0.1},
+                "counters": {"boxes": 3},
+                "peak_memory_bytes": 20,
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import unittest
+
+from tracklet_parser.kitti_format import (
+    format_kitti_label,
+    format_kitti_labels,
+)
+from tracklet_parser.tracklet_parser import TrackletParser
+
+
+class TestKittiFormat(unittest.TestCase):
+    def setUp(self):
+        example_xml_path = os.path.join(
+            os.path.dirname(__file__),
+            "resources",
+            "example_tracklet_labels.xml",
+        )
+        self.tracklets = TrackletParser.parse_tracklet_xml(example_xml_path)
+        self.table = TrackletParser.parse_tracklet_table(example_xml_path)
+
+    def test_format_kitti_label(self):
+        """Test formatting a single label with and without precision."""
+        self.assertEqual(
+            format_kitti_label(self.tracklets[1]),
+            "Car 0.5 2 0.0 0.0 0.0 0.0 0.0 1.5 1.8 4.2 5.0 2.0 0.0 1.57",
+        )
+        self.assertEqual(
+            format_kitti_label(self.tracklets[1], precision=2),
+            "Car 0.50 2 0.00 0.00 0.00 0.00 0.00 1.50 1.80 4.20 5.00 2.00"
+            " 0.00 1.57",
+        )
+
+    def test_format_kitti_labels(self):
+        """Test that batches match the single label formatting."""
+        for precision in [None, 0, 2]:
+            expected = "".join(
+                format_kitti_label(tracklet, precision) + "\n"
+                for tracklet in self.tracklets
+            )
+            self.assertEqual(
+                format_kitti_labels(self.tracklets, precision), expected
+            )
+            self.assertEqual(
+                format_kitti_labels(self.table, precision), expected
+            )
+
+    def test_format_kitti_labels_empty(self):
+        """Test formatting an empty batch."""
+        self.assertEqual(format_kitti_labels([], 2), "")
+        self.assertEqual(format_kitti_labels(self.table[:0], 2), "")
+
+    def test_format_kitti_labels_invalid_precision(self):
+        """Test formatting with a negative precision."""
+        with self.assertRaises(ValueError):
+            format_kitti_labels(self.tracklets, -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
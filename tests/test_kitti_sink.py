@@ -0,0 +1,114 @@
+import os
+import tarfile
+import unittest
+import zipfile
+from tempfile import TemporaryDirectory
+
+from tracklet_parser.kitti_sink import ZipSink, read_label_index
+from tracklet_parser.tracklet_parser import TrackletParser
+
+
+class TestKittiSink(unittest.TestCase):
+    def setUp(self):
+        resources = os.path.join(os.path.dirname(__file__), "resources")
+        self.frame_list_path = os.path.join(
+            resources, "example_frame_list.txt"
+        )
+        self.tracklets = TrackletParser.parse_tracklet_xml(
+            os.path.join(resources, "example_tracklet_labels.xml")
+        )
+        self.temp_dir = TemporaryDirectory()
+        self.expected = self._convert_to_directory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _convert_to_directory(self):
+        output_dir = os.path.join(self.temp_dir.name, "labels")
+        TrackletParser.convert_tracklets_to_kitti(
+            self.tracklets, self.frame_list_path, output_dir
+        )
+        expected = {}
+        for label_file_name in os.listdir(output_dir):
+            with open(os.path.join(output_dir, label_file_name), "rb") as f:
+                expected[label_file_name] = f.read()
+        return expected
+
+    def test_tar_sink(self):
+        """Test writing all label files to a tar archive."""
+        archive = os.path.join(self.temp_dir.name, "labels.tar")
+        for workers in (1, 2):
+            report = TrackletParser.convert_tracklets_to_kitti(
+                self.tracklets,
+                self.frame_list_path,
+                archive,
+                workers=workers,
+                sink="tar",
+            )
+            self.assertEqual(report.files_written, 3)
+            with tarfile.open(archive) as tar_file:
+                self.assertEqual(
+                    {
+                        member.name: tar_file.extractfile(member).read()
+                        for member in tar_file.getmembers()
+                    },
+                    self.expected,
+                )
+
+    def test_zip_sink(self):
+        """Test writing all label files to a compressed zip archive."""
+        archive = os.path.join(self.temp_dir.name, "out", "labels.zip")
+        report = TrackletParser.convert_tracklets_to_kitti(
+            self.tracklets,
+            self.frame_list_path,
+            archive,
+            workers=2,
+            executor="process",
+            sink=ZipSink(archive, zipfile.ZIP_DEFLATED),
+        )
+        self.assertEqual(
+            report.bytes_written, sum(map(len, self.expected.values()))
+        )
+        with zipfile.ZipFile(archive) as zip_file:
+            self.assertEqual(
+                {name: zip_file.read(name) for name in zip_file.namelist()},
+                self.expected,
+            )
+
+    def test_concatenated_sink(self):
+        """Test writing a single label file with a byte offset index."""
+        label_file = os.path.join(self.temp_dir.name, "labels.txt")
+        TrackletParser.convert_tracklets_to_kitti(
+            self.tracklets,
+            self.frame_list_path,
+            label_file,
+            sink="concatenated",
+        )
+        index = read_label_index(f"{label_file}.index")
+        self.assertEqual(index.keys(), self.expected.keys())
+        with open(label_file, "rb") as concatenated_file:
+            for name, (offset, length) in index.items():
+                concatenated_file.seek(offset)
+                self.assertEqual(
+                    concatenated_file.read(length), self.expected[name]
+                )
+
+    def test_invalid_sink(self):
+        """Test rejecting unknown sinks and incremental archives."""
+        output = os.path.join(self.temp_dir.name, "labels.tar")
+        with self.assertRaises(ValueError):
+            TrackletParser.convert_tracklets_to_kitti(
+                self.tracklets, self.frame_list_path, output, sink="parquet"
+            )
+        with self.assertRaises(ValueError):
+            TrackletParser.convert_tracklets_to_kitti(
+                self.tracklets,
+                self.frame_list_path,
+                output,
+                incremental=True,
+                sink="tar",
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
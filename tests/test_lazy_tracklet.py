@@ -0,0 +1,69 @@
+import unittest
+
+from tracklet_parser.lazy_tracklet import LazyTrack
+
+
+class TestLazyTrack(unittest.TestCase):
+    def setUp(self):
+        self.track = LazyTrack(
+            "Car",
+            5,
+            [b"1.5", b"1.8", b"4.2"],
+            [
+                [b"1.0", b"2.0", b"3.0", b"0.5", b"2", b"0.0"],
+                [b"4.0", b"5.0", b"6.0", b"0.25", b"0", b"0.75"],
+            ],
+            fields=["location"],
+        )
+
+    def test_iter(self):
+        """Test iterating over the lazy tracklets of all frames."""
+        tracklets = list(self.track)
+        self.assertEqual(
+            [tracklet.frame_number for tracklet in tracklets], [5, 6]
+        )
+        self.assertEqual(tracklets[1].location, (4.0, 5.0, 6.0))
+        self.assertEqual(tracklets[0].occluded, 2)
+        self.assertEqual(tracklets[1].truncated, 0.75)
+        self.assertEqual(tracklets[1].rotation_z, 0.25)
+        self.assertEqual(tracklets[0].dimensions["length"], 4.2)
+
+    def test_column_decoded_once(self):
+        """Test that a field is decoded on first access only."""
+        self.assertNotIn("rotation_z", self.track._decoded)
+        column = self.track.column("rotation_z")
+        self.assertEqual(list(column), [0.5, 0.25])
+        self.assertIs(self.track.column("rotation_z"), column)
+
+    def test_without_poses(self):
+        """Test that a track without poses still covers its first frame."""
+        track = LazyTrack("Van", 3, ["0", "0", "0"], [])
+        (tracklet,) = track
+        self.assertEqual(tracklet.frame_number, 3)
+        self.assertEqual(tracklet.location, (0.0, 0.0, 0.0))
+        self.assertEqual(tracklet.occluded, 0)
+
+    def test_malformed_field(self):
+        """Test that a malformed field raises when it is decoded."""
+        track = LazyTrack("Car", 0, ["1", "x", "2"], [])
+        with self.assertRaises(ValueError):
+            track[0].dimensions
+        with self.assertRaises(IndexError):
+            track[1]
+
+    def test_invalid_occlusion(self):
+        """Test that fractional or out of range occlusion states are
+        rejected with their raw value, like by the eager parser."""
+        for occlusion in (b"3.7", b"-0.5", b"4", b"1.0", b"1e0"):
+            track = LazyTrack(
+                "Car", 0, [b"0"] * 3, [[b"0"] * 4 + [occlusion, b"0"]]
+            )
+            with self.subTest(occlusion=occlusion):
+                with self.assertRaisesRegex(
+                    ValueError, f"^{occlusion.decode()} is an unknown"
+                ):
+                    track[0].occluded
+
+
+if __name__ == "__main__":
+    unittest.main()
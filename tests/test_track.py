@@ -0,0 +1,87 @@
+import unittest
+from array import array
+
+from tracklet_parser.track import Track
+
+
+class TestTrack(unittest.TestCase):
+    def setUp(self):
+        self.track = Track()
+        self.track.type = "Car"
+        self.track.first_frame = 5
+        self.track.put_dimension("height", 1.5)
+        self.track.add_pose(tx=1.0, ty=2.0, tz=3.0, rz=0.5, occlusion=2)
+        self.track.add_pose(tx=4.0, truncation=0.25)
+
+    def test_getitem(self):
+        """Test creating the tracklet of a single frame on demand."""
+        tracklet = self.track[1]
+        self.assertEqual(tracklet.type, "Car")
+        self.assertEqual(tracklet.frame_number, 6)
+        self.assertEqual(tracklet.dimensions["height"], 1.5)
+        self.assertEqual(tracklet.location["x"], 4.0)
+        self.assertEqual(tracklet.truncated, 0.25)
+
+    def test_getitem_out_of_range(self):
+        """Test accessing a frame outside of the track."""
+        with self.assertRaises(IndexError):
+            self.track[2]
+
+    def test_iter(self):
+        """Test iterating over all frames of the track."""
+        tracklets = list(self.track)
+        self.assertEqual(
+            [tracklet.frame_number for tracklet in tracklets], [5, 6]
+        )
+        self.assertEqual(tracklets[0].occluded, 2)
+        self.assertEqual(tracklets[0].rotation_z, 0.5)
+
+    def test_iter_without_poses(self):
+        """Test that a track without poses still covers its first frame."""
+        track = Track()
+        track.first_frame = 3
+        self.assertEqual(track.pose_count, 0)
+        self.assertEqual([tracklet.frame_number for tracklet in track], [3])
+
+    def test_poses_read_only(self):
+        """Test that the pose array cannot be modified through its view."""
+        self.assertEqual(len(self.track.poses), 12)
+        with self.assertRaises(TypeError):
+            self.track.poses[0] = 0.0
+
+    def test_add_poses(self):
+        """Test appending the poses of several frames in bulk."""
+        self.track.add_poses(
+            memoryview(array("d", [7.0, 8.0, 9.0, 1.0, 3.0, 0.5]))
+        )
+        self.assertEqual(self.track.pose_count, 3)
+        tracklet = self.track[2]
+        self.assertEqual(tracklet.frame_number, 7)
+        self.assertEqual(tracklet.location["z"], 9.0)
+        self.assertEqual(tracklet.occluded, 3)
+        self.assertEqual(tracklet.truncated, 0.5)
+
+    def test_add_poses_incomplete_rows(self):
+        """Test that poses lacking fields are rejected."""
+        with self.assertRaises(ValueError):
+            self.track.add_poses(memoryview(array("d", [1.0, 2.0])))
+        with self.assertRaises(ValueError):
+            self.track.add_poses(memoryview(array("f", [0.0] * 6)))
+        self.assertEqual(self.track.pose_count, 2)
+
+    def test_add_pose_invalid_occlusion(self):
+        """Test that fractional or out of range occlusion states are
+        rejected instead of being truncated."""
+        for occlusion in (3.7, -0.5, 4):
+            with self.subTest(occlusion=occlusion):
+                with self.assertRaisesRegex(ValueError, f"^{occlusion} "):
+                    self.track.add_pose(occlusion=occlusion)
+        with self.assertRaises(ValueError):
+            self.track.add_poses(
+                memoryview(array("d", [0.0, 0.0, 0.0, 0.0, 1.5, 0.0]))
+            )
+        self.assertEqual(self.track.pose_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import os
+import unittest
+from typing import List, Optional
+
+from tracklet_parser.track import Track
+from tracklet_parser.track_scanner import find_track_ranges, scan_tracks
+from tracklet_parser.tracklet_parser import TrackletParser
+
+_POSE = (
+    "<item><tx>{x}</tx><ty>2.0</ty><tz>-1.5</tz><rx>0.0</rx><ry>0.0</ry>"
+    "<rz>0.25</rz><state>1</state><occlusion>2</occlusion>"
+    "<occlusion_kf>1</occlusion_kf><truncation>0.5</truncation>"
+    "<amt_occlusion>-1</amt_occlusion></item>"
+)
+
+
+def _document(poses: str, declaration: str = "") -> bytes:
+    """Helper function to create a document with a single car track."""
+    return (
+        f"{declaration}<boost_serialization><tracklets class_id='0'>"
+        "<count>1</count><item_version>1</item_version><item>"
+        "<objectType>Car</objectType><h>1.5</h><w>1.8</w><l>4.2</l>"
+        f"<first_frame>10</first_frame><poses>{poses}</poses>"
+        "<finished>1</finished></item></tracklets></boost_serialization>"
+    ).encode("utf-8")
+
+
+class TestTrackScanner(unittest.TestCase):
+    def setUp(self):
+        self.parsed_tracks: List[Track] = []
+
+    def test_scan_tracks_example(self):
+        """Test that scanning matches parsing, including comments."""
+        example_xml_path = os.path.join(
+            os.path.dirname(__file__),
+            "resources",
+            "example_tracklet_labels.xml",
+        )
+        with open(example_xml_path, "rb") as xml_file:
+            tracks = list(self._scan(xml_file.read()))
+        expected = list(TrackletParser.iter_tracks(example_xml_path))
+        self.assertEqual(self._contents(tracks), self._contents(expected))
+
+    def test_scan_tracks_kitti_poses(self):
+        """Test scanning poses in the field order of the KITTI devkit."""
+        document = _document(_POSE.format(x=1.0) + _POSE.format(x=3.5))
+        (track,) = self._scan(document)
+        self.assertEqual(track.type, "Car")
+        self.assertEqual(track.first_frame, 10)
+        self.assertEqual(track.dimensions["length"], 4.2)
+        self.assertEqual(
+            list(track.poses),
+            [1.0, 2.0, -1.5, 0.25, 2.0, 0.5, 3.5, 2.0, -1.5, 0.25, 2.0, 0.5],
+        )
+        self.assertEqual(self.parsed_tracks, [])
+
+    def test_scan_tracks_class_attributes(self):
+        """Test scanning a first track item carrying the class attributes of
+        boost serialization, as in real exports."""
+        document = _document(_POSE.format(x=1.0)).replace(
+            b"<item><objectType>",
+            b'<item class_id="1" tracking_level="0" version="1">'
+            b"<objectType>",
+        )
+        (track,) = self._scan(document)
+        self.assertEqual(track.type, "Car")
+        self.assertEqual(list(track.poses), [1.0, 2.0, -1.5, 0.25, 2.0, 0.5])
+        self.assertEqual(self.parsed_tracks, [])
+        self.assertEqual(len(find_track_ranges(document)), 1)
+
+    def test_scan_tracks_reordered_fields(self):
+        """Test scanning poses whose fields deviate from the KITTI order."""
+        pose = (
+            "<item><rz>0.25</rz><tz>-1.5</tz><ty>2.0</ty><tx>1.0</tx>"
+            "<truncation>0.5</truncation><occlusion>2</occlusion></item>"
+        )
+        (track,) = self._scan(_document(pose))
+        self.assertEqual(list(track.poses), [1.0, 2.0, -1.5, 0.25, 2.0, 0.5])
+        self.assertEqual(self.parsed_tracks, [])
+
+    def test_scan_tracks_missing_field(self):
+        """Test that a track with a pose lacking a field is parsed."""
+        pose = "<item><tx>1.0</tx><rz>0.1</rz></item>"
+        (track,) = self._scan(_document(_POSE.format(x=2.0) + pose))
+        self.assertEqual(len(self.parsed_tracks), 1)
+        self.assertEqual(track.pose_count, 2)
+        self.assertEqual(track[1].location["x"], 1.0)
+
+    def test_scan_tracks_unsupported_documents(self):
+        """Test that documents the scanner cannot handle are rejected."""
+        pose = _POSE.format(x=1.0)
+        for document in (
+            _document(pose.replace("<state>1", "<state>&#49;")),
+            _document(pose, "<?xml version='1.0' encoding='ISO-8859-1'?>"),
+            _document(pose).replace(b"tracklets", b"labels"),
+            _document(pose).replace(b"<item><objectType", b"<item><type"),
+        ):
+            with self.subTest(document=document):
+                self.assertIsNone(self._scan(document))
+
+    def test_scan_tracks_empty_tracklets(self):
+        """Test scanning a document without tracks."""
+        document = b"<boost_serialization><tracklets/></boost_serialization>"
+        self.assertEqual(list(self._scan(document)), [])
+
+    def test_find_track_ranges(self):
+        """Test locating the byte ranges of the tracks of a document."""
+        document = _document(_POSE.format(x=1.0))
+        track = document[
+            document.index(b"<item><objectType>") : document.index(
+                b"</tracklets>"
+            )
+        ]
+        document = document.replace(track, track + b"\n" + track)
+        self.assertEqual(
+            [
+                document[start:end]
+                for start, end in find_track_ranges(document)
+            ],
+            [track, track],
+        )
+
+    def test_find_track_ranges_comments(self):
+        """Test that ranges are not located around comments."""
+        document = _document(_POSE.format(x=1.0)).replace(
+            b"<count>1</count>", b"<count>1</count><!-- comment -->"
+        )
+        self.assertIsNone(find_track_ranges(document))
+        self.assertEqual(len(list(self._scan(document))), 1)
+
+    def _scan(self, document: bytes) -> Optional[List[Track]]:
+        """Helper method to scan a document, recording parsed tracks."""
+
+        def parse_track(track_element) -> Track:
+            track = TrackletParser._parse_track(track_element)
+            self.parsed_tracks.append(track)
+            return track
+
+        return scan_tracks(document, parse_track)
+
+    @staticmethod
+    def _contents(tracks: List[Track]) -> list:
+        """Helper method to compare tracks by value."""
+        return [
+            (
+                track.type,
+                track.first_frame,
+                track.dimensions,
+                list(track.poses),
+            )
+            for track in tracks
+        ]
+
+
+if __name__ == "__main__":
+    unittest.main()
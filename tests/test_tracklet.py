@@ -0,0 +1,58 @@
+import pickle
+import unittest
+
+from tracklet_parser.tracklet import BBox, Dimensions, Location, Tracklet
+
+
+class TestTracklet(unittest.TestCase):
+    def setUp(self):
+        self.tracklet = Tracklet()
+        self.tracklet.put_dimension("height", 1.5)
+        self.tracklet.put_location("y", -2.0)
+
+    def test_named_accessors(self):
+        """Test reading fields by name, attribute and position."""
+        dimensions = self.tracklet.dimensions
+        self.assertIsInstance(dimensions, Dimensions)
+        self.assertEqual(dimensions["height"], 1.5)
+        self.assertEqual(dimensions.height, 1.5)
+        self.assertEqual(dimensions[0], 1.5)
+        self.assertEqual(tuple(self.tracklet.location), (0.0, -2.0, 0.0))
+        self.assertEqual(self.tracklet.bbox, BBox(0.0, 0.0, 0.0, 0.0))
+        with self.assertRaises(KeyError):
+            dimensions["count"]
+
+    def test_accessors_do_not_copy(self):
+        """Test that repeated reads return the same immutable object."""
+        self.assertIs(self.tracklet.location, self.tracklet.location)
+        with self.assertRaises(AttributeError):
+            self.tracklet.location.x = 1.0
+
+    def test_put_unknown_key(self):
+        """Test that unknown keys are rejected."""
+        with self.assertRaises(ValueError):
+            self.tracklet.put_location("w", 1.0)
+        with self.assertRaises(ValueError):
+            self.tracklet.put_bbox("center", 1.0)
+
+    def test_setters(self):
+        """Test setting whole vectors and validated states."""
+        self.tracklet.location = (1.0, 2.0, 3.0)
+        self.assertEqual(self.tracklet.location, Location(1.0, 2.0, 3.0))
+        with self.assertRaises(TypeError):
+            self.tracklet.location = (1.0, 2.0, 3.0, 4.0)
+        with self.assertRaises(ValueError):
+            self.tracklet.truncated = 1.5
+        with self.assertRaises(ValueError):
+            self.tracklet.occluded = 4
+
+    def test_slots(self):
+        """Test the fixed attribute layout and pickling."""
+        with self.assertRaises(AttributeError):
+            self.tracklet.score = 1.0
+        restored = pickle.loads(pickle.dumps(self.tracklet))
+        self.assertEqual(restored.dimensions, self.tracklet.dimensions)
+
+
+if __name__ == "__main__":
+    unittest.main()
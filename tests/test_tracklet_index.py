@@ -0,0 +1,97 @@
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import numpy as np
+
+from tracklet_parser.track import Track
+from tracklet_parser.tracklet_index import TrackletIndex
+from tracklet_parser.tracklet_parser import TrackletParser
+from tracklet_parser.tracklet_table import TrackletTable
+
+
+class TestTrackletIndex(unittest.TestCase):
+    def setUp(self):
+        car = Track()
+        car.type = "Car"
+        car.first_frame = 10
+        for x in range(5):
+            car.add_pose(tx=float(x))
+        pedestrian = Track()
+        pedestrian.type = "Pedestrian"
+        pedestrian.first_frame = 12
+        pedestrian.add_pose(tx=-1.0)
+        self.index = TrackletIndex(
+            TrackletTable.from_tracks([car, pedestrian])
+        )
+
+    def test_frame(self):
+        """Test looking up the boxes of a single frame."""
+        boxes = self.index.frame(12)
+        self.assertEqual([box.type for box in boxes], ["Car", "Pedestrian"])
+        self.assertEqual(len(self.index.frame(12, "Pedestrian")), 1)
+        self.assertEqual(len(self.index.frame(99)), 0)
+        self.assertIn(14, self.index)
+        self.assertNotIn(15, self.index)
+
+    def test_range(self):
+        """Test looking up the boxes of a range of frames."""
+        boxes = self.index.range(11, 13)
+        np.testing.assert_array_equal(boxes.frame_number, [11, 12, 12])
+        np.testing.assert_array_equal(
+            self.index.range(0, 100, "Car").location[:, 0], range(5)
+        )
+        self.assertEqual(len(self.index.range(20, 30)), 0)
+
+    def test_from_tracklets(self):
+        """Test indexing parsed Tracklet objects."""
+        tracklets = TrackletParser.parse_tracklet_xml(
+            os.path.join(
+                os.path.dirname(__file__),
+                "resources",
+                "example_tracklet_labels.xml",
+            )
+        )
+        index = TrackletIndex(reversed(tracklets))
+        np.testing.assert_array_equal(index.frames, [42, 100, 200])
+        self.assertEqual(index.frame(100)[0].type, "Car")
+
+    def test_save_and_load(self):
+        """Test that a serialized index answers the same lookups."""
+        with TemporaryDirectory() as temp_dir:
+            index_file = os.path.join(temp_dir, "index.npz")
+            self.index.save(index_file)
+            index = TrackletIndex.load(index_file)
+        self.assertEqual(len(index), len(self.index))
+        self.assertEqual(index.table.types, self.index.table.types)
+        np.testing.assert_array_equal(
+            index.range(0, 100).location, self.index.range(0, 100).location
+        )
+
+    def test_save_and_load_without_npz_suffix(self):
+        """Test that an archive is written and read at the exact path,
+        restoring the frame offsets without sorting again."""
+        with TemporaryDirectory() as temp_dir:
+            index_file = os.path.join(temp_dir, "labels.index")
+            self.index.save(index_file)
+            self.assertEqual(os.listdir(temp_dir), ["labels.index"])
+            with patch.object(
+                TrackletTable, "sort", side_effect=AssertionError
+            ):
+                index = TrackletIndex.load(index_file)
+        np.testing.assert_array_equal(index.frames, self.index.frames)
+        self.assertEqual(
+            [box.type for box in index.frame(12)], ["Car", "Pedestrian"]
+        )
+        self.assertIn(14, index)
+
+    def test_empty(self):
+        """Test an index without boxes."""
+        index = TrackletIndex([])
+        self.assertEqual(len(index.frame(0)), 0)
+        self.assertEqual(len(index.range(0, 10)), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,21 @@
+import asyncio
 import os
+import tarfile
 import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from tempfile import TemporaryDirectory
 from typing import List
+from unittest.mock import patch
 from xml.etree.ElementTree import ParseError
 
+import numpy as np
+
+from tracklet_parser.calibration import Calibration
+from tracklet_parser.lazy_tracklet import LazyTracklet
 from tracklet_parser.tracklet import Tracklet
-from tracklet_parser.tracklet_parser import TrackletParser
+from tracklet_parser.tracklet_parser import TrackletParser, create_process_pool
+from tracklet_parser.tracklet_table import TrackletTable
+from tracklet_parser.validation import ValidationError
 
 
 class TestTrackletParser(unittest.TestCase):
@@ -93,6 +103,257 @@ class TestTrackletParser(unittest.TestCase):
         with self.assertRaises(ParseError):
             TrackletParser.parse_tracklet_xml(empty_xml_path)
 
+    def test_iter_tracklets(self):
+        """Test streaming tracklets in document order."""
+        tracklets = TrackletParser.iter_tracklets(self.example_xml_path)
+        self.assertNotIsInstance(tracklets, list)
+        self.assertEqual(
+            [tracklet.type for tracklet in tracklets],
+            ["Pedestrian", "Car", "Cyclist"],
+        )
+
+    def test_iter_tracklets_file_not_found(self):
+        """Test that a missing file is reported before iterating."""
+        with self.assertRaises(FileNotFoundError):
+            TrackletParser.iter_tracklets("non_existent_file.xml")
+
+    def test_iter_tracklets_invalid_structure(self):
+        """Test streaming an XML file with an invalid structure."""
+        invalid_xml_path = self._create_temp_file(
+            "<invalid_root><item></item></invalid_root>"
+        )
+        with self.assertRaises(ValueError):
+            list(TrackletParser.iter_tracklets(invalid_xml_path))
+
+    def test_parse_tracklet_xml_multiple_poses(self):
+        """Test expanding every pose of a track into its own tracklet."""
+        multi_pose_xml_path = self._create_temp_file(
+            "<boost_serialization><tracklets><item>"
+            "<objectType>Car</objectType><h>1.5</h><w>1.8</w><l>4.2</l>"
+            "<first_frame>10</first_frame><poses>"
+            "<count>3</count><item_version>1</item_version>"
+            "<item><tx>1.0</tx><rz>0.1</rz><occlusion>1</occlusion></item>"
+            "<item><tx>2.0</tx><rz>0.2</rz><truncation>0.5</truncation></item>"
+            "<item><tx>3.0</tx><rz>0.3</rz></item>"
+            "</poses></item></tracklets></boost_serialization>"
+        )
+        tracklets: List[Tracklet] = TrackletParser.parse_tracklet_xml(
+            multi_pose_xml_path
+        )
+        self.assertEqual(
+            [tracklet.frame_number for tracklet in tracklets], [10, 11, 12]
+        )
+        self.assertEqual(
+            [tracklet.location["x"] for tracklet in tracklets],
+            [1.0, 2.0, 3.0],
+        )
+        self.assertEqual(
+            [tracklet.rotation_z for tracklet in tracklets], [0.1, 0.2, 0.3]
+        )
+        self.assertEqual(tracklets[0].occluded, 1)
+        self.assertEqual(tracklets[1].truncated, 0.5)
+        self.assertTrue(
+            all(tracklet.dimensions["length"] == 4.2 for tracklet in tracklets)
+        )
+
+    def test_parse_tracklet_xml_fractional_occlusion(self):
+        """Test that fractional, negative or non-integer occlusion states
+        are rejected by both backends instead of being truncated."""
+        for occlusion in ("3.7", "-0.5", "1.0", "1e0"):
+            fractional_xml_path = self._create_temp_file(
+                "<boost_serialization><tracklets><item>"
+                "<objectType>Car</objectType><first_frame>0</first_frame>"
+                f"<poses><item><occlusion>{occlusion}</occlusion></item>"
+                "</poses></item></tracklets></boost_serialization>"
+            )
+            for backend in ("etree", "fast"):
+                with self.subTest(occlusion=occlusion, backend=backend):
+                    with self.assertRaises(ValueError):
+                        TrackletParser.parse_tracklet_xml(
+                            fractional_xml_path, backend=backend
+                        )
+                    with self.assertRaises(ValueError):
+                        TrackletParser.parse_tracklet_xml(
+                            fractional_xml_path,
+                            backend=backend,
+                            fields=["occluded"],
+                        )
+
+    def test_iter_tracks(self):
+        """Test streaming tracks with their compact pose arrays."""
+        tracks = list(TrackletParser.iter_tracks(self.example_xml_path))
+        self.assertEqual([track.pose_count for track in tracks], [1, 1, 0])
+        self.assertEqual([len(track) for track in tracks], [1, 1, 1])
+
+    def test_iter_tracks_fast_backend(self):
+        """Test that the fast backend yields the tracks of ElementTree."""
+        expected = TrackletParser.iter_tracks(self.example_xml_path)
+        tracks = TrackletParser.iter_tracks(
+            self.example_xml_path, backend="fast"
+        )
+        self.assertEqual(
+            [
+                (track.type, track.dimensions, list(track.poses))
+                for track in tracks
+            ],
+            [
+                (track.type, track.dimensions, list(track.poses))
+                for track in expected
+            ],
+        )
+
+    def test_parse_tracklet_xml_fast_backend_invalid_structure(self):
+        """Test that the fast backend falls back to report invalid XML."""
+        invalid_xml_path = self._create_temp_file(
+            "<invalid_root></invalid_root>"
+        )
+        with self.assertRaises(ValueError):
+            TrackletParser.parse_tracklet_xml(invalid_xml_path, backend="fast")
+
+    def test_parse_tracklet_xml_fast_backend_empty_file(self):
+        """Test that the fast backend reports an empty XML file."""
+        empty_xml_path = self._create_temp_file("")
+        with self.assertRaises(ParseError):
+            TrackletParser.parse_tracklet_xml(empty_xml_path, backend="fast")
+
+    def test_parse_tracklet_xml_workers(self):
+        """Test that parsing shards on processes matches a single process."""
+        track = (
+            "<item><objectType>{type}</objectType>"
+            "<h>1.5</h><w>1.8</w><l>4.2</l><first_frame>{first}</first_frame>"
+            "<poses><count>2</count><item_version>2</item_version>"
+            "<item><tx>{first}</tx><rz>0.1</rz></item>"
+            "<item><tx>-{first}</tx><rz>0.2</rz></item>"
+            "</poses><finished>1</finished></item>"
+        )
+        tracks_xml_path = self._create_temp_file(
+            "<boost_serialization><tracklets><count>12</count>"
+            + "".join(
+                track.format(type=object_type, first=first)
+                for first, object_type in zip(
+                    [5, 3, 9, 3, 0, 7, 5, 1, 8, 2, 6, 4],
+                    ["Car", "Van", "Pedestrian", "Cyclist"] * 3,
+                )
+            )
+            + "</tracklets></boost_serialization>"
+        )
+        for tracklet_xml in (tracks_xml_path, self.example_xml_path):
+            expected = [
+                (tracklet.frame_number, tracklet.type, tracklet.location)
+                for tracklet in TrackletParser.parse_tracklet_xml(tracklet_xml)
+            ]
+            for backend in TrackletParser._BACKENDS:
+                with self.subTest(tracklet_xml=tracklet_xml, backend=backend):
+                    tracklets = TrackletParser.parse_tracklet_xml(
+                        tracklet_xml, backend=backend, workers=2
+                    )
+                    self.assertEqual(
+                        [
+                            (
+                                tracklet.frame_number,
+                                tracklet.type,
+                                tracklet.location,
+                            )
+                            for tracklet in tracklets
+                        ],
+                        expected,
+                    )
+                    table = TrackletParser.parse_tracklet_table(
+                        tracklet_xml, backend=backend, workers=2
+                    )
+                    self.assertEqual(
+                        [
+                            (view.frame_number, view.type, view.location)
+                            for view in table
+                        ],
+                        expected,
+                    )
+
+    def test_parse_tracklet_xml_fields(self):
+        """Test that a field projection matches parsing all fields."""
+        multi_pose_xml_path = self._create_temp_file(
+            "<boost_serialization><tracklets><item>"
+            "<objectType>Car</objectType><h>1.5</h><w>1.8</w><l>4.2</l>"
+            "<first_frame>10</first_frame><poses>"
+            "<item><tx>1.0</tx><rz>0.1</rz><occlusion>1</occlusion></item>"
+            "<item><tx>2.0</tx><rz>0.2</rz><truncation>0.5</truncation></item>"
+            "</poses></item></tracklets></boost_serialization>"
+        )
+        for tracklet_xml in (multi_pose_xml_path, self.example_xml_path):
+            expected = [
+                (
+                    tracklet.frame_number,
+                    tracklet.type,
+                    tracklet.truncated,
+                    tracklet.occluded,
+                    tracklet.bbox,
+                    tracklet.dimensions,
+                    tracklet.location,
+                    tracklet.rotation_z,
+                )
+                for tracklet in TrackletParser.parse_tracklet_xml(tracklet_xml)
+            ]
+            for backend in TrackletParser._BACKENDS:
+                with self.subTest(tracklet_xml=tracklet_xml, backend=backend):
+                    tracklets = TrackletParser.parse_tracklet_xml(
+                        tracklet_xml,
+                        backend=backend,
+                        fields=["type", "frame_number", "location"],
+                    )
+                    self.assertIsInstance(tracklets[0], LazyTracklet)
+                    self.assertEqual(
+                        [
+                            (
+                                tracklet.frame_number,
+                                tracklet.type,
+                                tracklet.truncated,
+                                tracklet.occluded,
+                                tracklet.bbox,
+                                tracklet.dimensions,
+                                tracklet.location,
+                                tracklet.rotation_z,
+                            )
+                            for tracklet in tracklets
+                        ],
+                        expected,
+                    )
+
+    def test_parse_tracklet_xml_fields_deferred_validation(self):
+        """Test that unrequested fields are only validated on access."""
+        invalid_xml_path = self._create_temp_file(
+            "<boost_serialization><tracklets><item>"
+            "<objectType>Car</objectType><first_frame>0</first_frame>"
+            "<poses><item><tx>1.0</tx><truncation>2.0</truncation></item>"
+            "</poses></item></tracklets></boost_serialization>"
+        )
+        (tracklet,) = TrackletParser.parse_tracklet_xml(
+            invalid_xml_path, fields=["location"]
+        )
+        self.assertEqual(tracklet.location["x"], 1.0)
+        with self.assertRaises(ValueError):
+            tracklet.truncated
+        with self.assertRaises(ValueError):
+            TrackletParser.parse_tracklet_xml(
+                invalid_xml_path, fields=["truncated"]
+            )
+
+    def test_parse_tracklet_xml_unknown_field(self):
+        """Test that an unknown field is rejected before parsing."""
+        with self.assertRaises(ValueError):
+            TrackletParser.parse_tracklet_xml(
+                self.example_xml_path, fields=["speed"]
+            )
+
+    def test_parse_tracklet_xml_invalid_workers(self):
+        """Test that an invalid number of parsing workers is rejected."""
+        with self.assertRaises(ValueError):
+            TrackletParser.parse_tracklet_xml(self.example_xml_path, workers=0)
+
+    def test_iter_tracks_unknown_backend(self):
+        """Test that an unknown backend is rejected before iterating."""
+        with self.assertRaises(ValueError):
+            TrackletParser.iter_tracks(self.example_xml_path, backend="sax")
+
     def test_load_frame_list_empty_dict(self):
         """Test loading a non-existent frame list."""
         label_dict = TrackletParser._load_frame_list(
@@ -122,11 +383,226 @@ class TestTrackletParser(unittest.TestCase):
                 )
             )
 
+    def test_convert_tracklets_to_kitti_calibration(self):
+        """Test writing camera coordinates, alpha and 2D bounding boxes."""
+        tracklets: List[Tracklet] = TrackletParser.parse_tracklet_xml(
+            self.example_xml_path
+        )
+        calibration = Calibration(
+            projection=[[700, 0, 600, 0], [0, 700, 180, 0], [0, 0, 1, 0]],
+            rectification=np.eye(3),
+            lidar_to_camera=[[0, -1, 0, 0], [0, 0, -1, 0], [1, 0, 0, 0]],
+        )
+        TrackletParser.convert_tracklets_to_kitti(
+            tracklets,
+            self.example_frame_list_path,
+            self.example_output_dir,
+            precision=2,
+            calibration=calibration,
+        )
+
+        with open(
+            os.path.join(self.example_output_dir, "point_cloud_100.txt")
+        ) as label_file:
+            fields = label_file.read().split()
+        expected = calibration.transform(
+            TrackletTable.from_tracklets(tracklets[1:2])
+        )
+        self.assertEqual(fields[0], "Car")
+        self.assertEqual(float(fields[3]), round(expected.alpha[0], 2))
+        self.assertEqual(
+            [float(field) for field in fields[4:8]],
+            [round(value, 2) for value in expected.bbox[0]],
+        )
+        self.assertEqual(
+            [float(field) for field in fields[11:14]], [-2.0, -0.0, 5.0]
+        )
+
+    def test_convert_tracklets_to_kitti_report(self):
+        """Test the number of files and bytes reported by a conversion."""
+        tracklets: List[Tracklet] = TrackletParser.parse_tracklet_xml(
+            self.example_xml_path
+        )
+        report = TrackletParser.convert_tracklets_to_kitti(
+            tracklets, self.example_frame_list_path, self.example_output_dir
+        )
+        self.assertEqual(report.files_written, 3)
+        self.assertEqual(
+            report.bytes_written,
+            sum(
+                os.path.getsize(os.path.join(self.example_output_dir, name))
+                for name in os.listdir(self.example_output_dir)
+            ),
+        )
+
+    def test_convert_tracklets_to_kitti_groups_frames(self):
+        """Test that all tracklets of a frame end up in one label file."""
+        tracklets: List[Tracklet] = TrackletParser.parse_tracklet_xml(
+            self.example_xml_path
+        )
+        for tracklet in tracklets:
+            tracklet.frame_number = 42
+        # Existing label files are replaced instead of appended to
+        with open(
+            os.path.join(self.example_output_dir, "point_cloud_042.txt"), "w"
+        ) as label_file:
+            label_file.write("stale label\n")
+        report = TrackletParser.convert_tracklets_to_kitti(
+            tracklets, self.example_frame_list_path, self.example_output_dir
+        )
+        self.assertEqual(report.files_written, 1)
+        with open(
+            os.path.join(self.example_output_dir, "point_cloud_042.txt"),
+            encoding="utf-8",
+        ) as label_file:
+            lines = label_file.read().splitlines()
+        self.assertEqual(
+            [line.split(" ")[0] for line in lines],
+            ["Pedestrian", "Car", "Cyclist"],
+        )
+
+    def test_convert_tracklets_to_kitti_parallel(self):
+        """Test that parallel exports match the serial export."""
+        tracklets: List[Tracklet] = TrackletParser.parse_tracklet_xml(
+            self.example_xml_path
+        )
+        serial_dir = os.path.join(self.example_output_dir, "serial")
+        serial_report = TrackletParser.convert_tracklets_to_kitti(
+            tracklets, self.example_frame_list_path, serial_dir
+        )
+
+        for executor in ["thread", "process"]:
+            parallel_dir = os.path.join(self.example_output_dir, executor)
+            report = TrackletParser.convert_tracklets_to_kitti(
+                tracklets,
+                self.example_frame_list_path,
+                parallel_dir,
+                workers=2,
+                executor=executor,
+            )
+            self.assertEqual(report, serial_report)
+            for file_name in os.listdir(serial_dir):
+                with (
+                    open(os.path.join(serial_dir, file_name), "rb") as serial,
+                    open(
+                        os.path.join(parallel_dir, file_name), "rb"
+                    ) as parallel,
+                ):
+                    self.assertEqual(serial.read(), parallel.read())
+
+    def test_convert_tracklets_to_kitti_table(self):
+        """Test that tables and tracklet lists produce the same labels."""
+        tracklets: List[Tracklet] = TrackletParser.parse_tracklet_xml(
+            self.example_xml_path
+        )
+        table = TrackletParser.parse_tracklet_table(self.example_xml_path)
+        list_dir = os.path.join(self.example_output_dir, "list")
+        table_dir = os.path.join(self.example_output_dir, "table")
+        TrackletParser.convert_tracklets_to_kitti(
+            tracklets, self.example_frame_list_path, list_dir, precision=2
+        )
+        TrackletParser.convert_tracklets_to_kitti(
+            table, self.example_frame_list_path, table_dir, precision=2
+        )
+        self.assertEqual(
+            sorted(os.listdir(list_dir)), sorted(os.listdir(table_dir))
+        )
+        for file_name in os.listdir(list_dir):
+            with (
+                open(os.path.join(list_dir, file_name)) as list_file,
+                open(os.path.join(table_dir, file_name)) as table_file,
+            ):
+                self.assertEqual(list_file.read(), table_file.read())
+
+        with open(os.path.join(table_dir, "point_cloud_100.txt")) as label:
+            self.assertEqual(
+                label.read(),
+                "Car 0.50 2 0.00 0.00 0.00 0.00 0.00 1.50 1.80 4.20 5.00 2.00"
+                " 0.00 1.57\n",
+            )
+
+    def test_validate_tracklets(self):
+        """Test validating parsed tracklets against the frame list."""
+        tracklets = TrackletParser.parse_tracklet_xml(self.example_xml_path)
+        report = TrackletParser.validate_tracklets(
+            tracklets, self.example_frame_list_path
+        )
+        self.assertTrue(report.valid)
+        self.assertEqual(
+            report.class_counts, {"Pedestrian": 1, "Car": 1, "Cyclist": 1}
+        )
+
+    def test_convert_tracklets_to_kitti_validate(self):
+        """Test that a failed validation stops before writing any file."""
+        tracklets = TrackletParser.parse_tracklet_xml(self.example_xml_path)
+        tracklets[0].frame_number = 7
+        with self.assertRaises(ValidationError) as context:
+            TrackletParser.convert_tracklets_to_kitti(
+                iter(tracklets),
+                self.example_frame_list_path,
+                self.example_output_dir,
+                validate=True,
+            )
+        self.assertEqual(context.exception.report.missing_frames, [7])
+        self.assertEqual(os.listdir(self.example_output_dir), [])
+
+        tracklets[0].frame_number = 42
+        report = TrackletParser.convert_tracklets_to_kitti(
+            iter(tracklets),
+            self.example_frame_list_path,
+            self.example_output_dir,
+            validate=True,
+        )
+        self.assertEqual(report.files_written, 3)
+
+    def test_create_process_pool(self):
+        """Test that only single-threaded callers are forked."""
+        with create_process_pool(1) as pool:
+            self.assertEqual(pool._mp_context.get_start_method(), "fork")
+        with patch("tracklet_parser.tracklet_parser.active_count") as count:
+            count.return_value = 2
+            with create_process_pool(1) as pool:
+                self.assertEqual(
+                    pool._mp_context.get_start_method(), "forkserver"
+                )
+
+    def test_map_bounded(self):
+        """Test that chunks are submitted only as results are consumed."""
+        submitted: List[int] = []
+
+        def chunks():
+            for chunk in range(20):
+                submitted.append(chunk)
+                yield chunk
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = TrackletParser._map_bounded(
+                pool, lambda chunk: chunk * 2, chunks(), 2
+            )
+            self.assertEqual(next(results), 0)
+            self.assertLessEqual(len(submitted), 5)
+            self.assertEqual(list(results), list(range(2, 40, 2)))
+
+    def test_convert_tracklets_to_kitti_invalid_workers(self):
+        """Test converting with an invalid worker configuration."""
+        with self.assertRaises(ValueError):
+            TrackletParser.convert_tracklets_to_kitti(
+                [], self.example_frame_list_path, self.example_output_dir, 0
+            )
+        with self.assertRaises(ValueError):
+            TrackletParser.convert_tracklets_to_kitti(
+                [],
+                self.example_frame_list_path,
+                self.example_output_dir,
+                executor="fiber",
+            )
+
     def test_convert_tracklets_to_kitti_empty_tracklets(self):
         """Test converting an empty list of tracklets."""
-        TrackletParser.convert_tracklets_to_kitti(
+        report = TrackletParser.convert_tracklets_to_kitti(
             [], self.example_frame_list_path, self.example_output_dir
         )
+        self.assertEqual(report.files_written, 0)
         # Ensure no files are created
         self.assertEqual(len(os.listdir(self.example_output_dir)), 0)
 
@@ -138,5 +614,131 @@ class TestTrackletParser(unittest.TestCase):
         return temp_file
 
 
+class TestTrackletParserAsync(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.example_xml_path = os.path.join(
+            os.path.dirname(__file__),
+            "resources",
+            "example_tracklet_labels.xml",
+        )
+        self.example_frame_list_path = os.path.join(
+            os.path.dirname(__file__), "resources", "example_frame_list.txt"
+        )
+        self.temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    async def test_aparse_tracklet_xml(self):
+        """Test that async parsing matches parsing."""
+        tracklets = await TrackletParser.aparse_tracklet_xml(
+            self.example_xml_path, chunk_size=1
+        )
+        expected = TrackletParser.parse_tracklet_xml(self.example_xml_path)
+        self.assertEqual(
+            [
+                (tracklet.type, tracklet.frame_number, tracklet.location)
+                for tracklet in tracklets
+            ],
+            [
+                (tracklet.type, tracklet.frame_number, tracklet.location)
+                for tracklet in expected
+            ],
+        )
+
+    async def test_aparse_tracklet_xml_yields_to_loop(self):
+        """Test that other tasks run while a file is parsed."""
+        ticks = 0
+        done = False
+
+        async def tick():
+            nonlocal ticks
+            while not done:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.create_task(tick())
+        await TrackletParser.aparse_tracklet_xml(
+            self.example_xml_path, chunk_size=1
+        )
+        done = True
+        await ticker
+        self.assertGreaterEqual(ticks, 3)
+
+    async def test_aparse_tracklet_xml_file_not_found(self):
+        """Test async parsing of a non-existent XML file."""
+        with self.assertRaises(FileNotFoundError):
+            await TrackletParser.aparse_tracklet_xml("non_existent_file.xml")
+
+    async def test_aconvert_tracklets_to_kitti(self):
+        """Test that async conversion writes the files of a conversion."""
+        tracklets = TrackletParser.parse_tracklet_xml(self.example_xml_path)
+        output_dir = os.path.join(self.temp_dir.name, "async")
+        expected_dir = os.path.join(self.temp_dir.name, "sync")
+        report = await TrackletParser.aconvert_tracklets_to_kitti(
+            tracklets,
+            self.example_frame_list_path,
+            output_dir,
+            concurrency=2,
+            chunk_size=1,
+        )
+        expected = TrackletParser.convert_tracklets_to_kitti(
+            tracklets, self.example_frame_list_path, expected_dir
+        )
+        self.assertEqual(report, expected)
+        self.assertEqual(
+            self._read_files(output_dir), self._read_files(expected_dir)
+        )
+
+    async def test_aconvert_tracklets_to_kitti_ordered_sink(self):
+        """Test that a tar sink receives the label files in order."""
+        tracklets = TrackletParser.parse_tracklet_xml(self.example_xml_path)
+        archive = os.path.join(self.temp_dir.name, "labels.tar")
+        await TrackletParser.aconvert_tracklets_to_kitti(
+            tracklets,
+            self.example_frame_list_path,
+            archive,
+            sink="tar",
+            concurrency=3,
+            chunk_size=1,
+        )
+        with tarfile.open(archive) as tar_file:
+            self.assertEqual(
+                tar_file.getnames(),
+                [
+                    "point_cloud_042.txt",
+                    "point_cloud_100.txt",
+                    "point_cloud_200.txt",
+                ],
+            )
+
+    async def test_aconvert_tracklets_to_kitti_invalid_arguments(self):
+        """Test that invalid async conversion arguments are rejected."""
+        for arguments in (
+            {"concurrency": 0},
+            {"chunk_size": 0},
+            {"executor": ProcessPoolExecutor(max_workers=1)},
+        ):
+            with self.subTest(arguments=arguments):
+                with self.assertRaises(ValueError):
+                    await TrackletParser.aconvert_tracklets_to_kitti(
+                        [],
+                        self.example_frame_list_path,
+                        self.temp_dir.name,
+                        **arguments,
+                    )
+                if "executor" in arguments:
+                    arguments["executor"].shutdown()
+
+    @staticmethod
+    def _read_files(directory: str) -> dict:
+        """Helper method to read all files of a directory."""
+        contents = {}
+        for name in sorted(os.listdir(directory)):
+            with open(os.path.join(directory, name), "rb") as file:
+                contents[name] = file.read()
+        return contents
+
+
 if __name__ == "__main__":
     unittest.main()
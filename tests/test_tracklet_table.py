@@ -0,0 +1,165 @@
+import os
+import unittest
+from io import BytesIO
+
+import numpy as np
+
+from tracklet_parser.track import Track
+from tracklet_parser.tracklet_parser import TrackletParser
+from tracklet_parser.tracklet_table import TrackletTable
+
+
+class TestTrackletTable(unittest.TestCase):
+    def setUp(self):
+        self.example_xml_path = os.path.join(
+            os.path.dirname(__file__),
+            "resources",
+            "example_tracklet_labels.xml",
+        )
+        self.table = TrackletParser.parse_tracklet_table(self.example_xml_path)
+
+    def test_parse_tracklet_table(self):
+        """Test that the table matches the parsed tracklets."""
+        tracklets = TrackletParser.parse_tracklet_xml(self.example_xml_path)
+        self.assertEqual(len(self.table), len(tracklets))
+        for view, tracklet in zip(self.table, tracklets):
+            self.assertEqual(view.frame_number, tracklet.frame_number)
+            self.assertEqual(view.type, tracklet.type)
+            self.assertEqual(view.truncated, tracklet.truncated)
+            self.assertEqual(view.occluded, tracklet.occluded)
+            self.assertEqual(view.dimensions, tracklet.dimensions)
+            self.assertEqual(view.location, tracklet.location)
+            self.assertEqual(view.rotation_z, tracklet.rotation_z)
+
+    def test_from_tracks_expands_poses(self):
+        """Test filling the table with one row per track and frame."""
+        track = Track()
+        track.type = "Car"
+        track.first_frame = 7
+        track.add_pose(tx=1.0)
+        track.add_pose(tx=2.0)
+        table = TrackletTable.from_tracks([track])
+        np.testing.assert_array_equal(table.frame_number, [7, 8])
+        np.testing.assert_array_equal(table.location[:, 0], [1.0, 2.0])
+
+    def test_from_tracks_invalid_occlusion(self):
+        """Test that out of range occlusion states are rejected."""
+        track = Track()
+        with self.assertRaises(ValueError):
+            track.add_pose(occlusion=4)
+            TrackletTable.from_tracks([track])
+
+    def test_parse_tracklet_table_occlusion_not_wrapped(self):
+        """Test that occlusion states beyond int8 are rejected, not
+        wrapped into range."""
+        xml = (
+            b"<boost_serialization><tracklets><item>"
+            b"<objectType>Car</objectType><first_frame>0</first_frame>"
+            b"<poses><item><occlusion>256</occlusion></item></poses>"
+            b"</item></tracklets></boost_serialization>"
+        )
+        for backend in ("etree", "fast"):
+            with self.subTest(backend=backend):
+                with self.assertRaises(ValueError):
+                    TrackletParser.parse_tracklet_table(
+                        BytesIO(xml), backend=backend
+                    )
+
+    def test_parse_tracklet_table_nan_truncation(self):
+        """Test that a NaN truncation state is rejected like by Tracklet."""
+        xml = (
+            b"<boost_serialization><tracklets><item>"
+            b"<objectType>Car</objectType><first_frame>0</first_frame>"
+            b"<poses><item><truncation>nan</truncation></item></poses>"
+            b"</item></tracklets></boost_serialization>"
+        )
+        for backend in ("etree", "fast"):
+            with self.subTest(backend=backend):
+                with self.assertRaises(ValueError):
+                    TrackletParser.parse_tracklet_table(
+                        BytesIO(xml), backend=backend
+                    )
+
+    def test_merge(self):
+        """Test that merging sorted tables equals the stable global sort."""
+        generator = np.random.default_rng(0)
+        tables = []
+        for size in (5, 1, 7, 3):
+            track = Track()
+            track.type = f"Type{size}"
+            for x in range(size):
+                track.add_pose(tx=float(x))
+            table = TrackletTable.from_tracks([track])
+            tables.append(
+                table.replace(
+                    frame_number=np.sort(generator.integers(0, 6, size))
+                )
+            )
+        merged = TrackletTable.merge(tables)
+        expected = TrackletTable.concatenate(tables).sort()
+        np.testing.assert_array_equal(
+            merged.frame_number, expected.frame_number
+        )
+        self.assertEqual(
+            [view.type for view in merged], [view.type for view in expected]
+        )
+        np.testing.assert_array_equal(merged.location, expected.location)
+        self.assertEqual(len(TrackletTable.merge([])), 0)
+
+    def test_where_type(self):
+        """Test selecting rows by object type."""
+        cars = self.table.where_type("Car", "Cyclist")
+        self.assertEqual([view.type for view in cars], ["Car", "Cyclist"])
+        self.assertEqual(len(self.table.where_type("Truck")), 0)
+
+    def test_sort(self):
+        """Test sorting rows by a column."""
+        table = self.table.sort("rotation_z")
+        np.testing.assert_array_equal(table.rotation_z, [0.0, 0.0, 1.57])
+        with self.assertRaises(ValueError):
+            self.table.sort("location")
+
+    def test_replace(self):
+        """Test replacing columns while sharing the others."""
+        table = self.table.replace(alpha=np.ones(3))
+        np.testing.assert_array_equal(table.alpha, [1.0, 1.0, 1.0])
+        self.assertTrue(np.shares_memory(table.location, self.table.location))
+        with self.assertRaises(ValueError):
+            self.table.replace(rotation_y=np.ones(3))
+        with self.assertRaises(ValueError):
+            self.table.replace(alpha=np.ones(2))
+
+    def test_concatenate(self):
+        """Test appending tables with different object types."""
+        table = TrackletTable.concatenate(
+            [self.table.where_type("Car"), self.table]
+        )
+        self.assertEqual(len(table), 4)
+        self.assertEqual(
+            [view.type for view in table],
+            ["Car", "Pedestrian", "Car", "Cyclist"],
+        )
+        self.assertEqual(len(TrackletTable.concatenate([])), 0)
+
+    def test_getitem(self):
+        """Test single row views and row selections."""
+        self.assertEqual(self.table[-1].type, "Cyclist")
+        self.assertEqual(len(self.table[1:]), 2)
+        with self.assertRaises(IndexError):
+            self.table[3]
+
+    def test_to_tracklets(self):
+        """Test materializing rows as Tracklet objects."""
+        tracklets = self.table.to_tracklets()
+        self.assertEqual(tracklets[1].type, "Car")
+        self.assertEqual(tracklets[1].dimensions["length"], 4.2)
+
+    def test_from_tracklets_empty(self):
+        """Test filling a table without tracklets."""
+        table = TrackletTable.from_tracklets([])
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.bbox.shape, (0, 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import os
+import unittest
+from io import BytesIO
+from tempfile import TemporaryDirectory
+from xml.etree.ElementTree import fromstring
+
+from tracklet_parser.tracklet_parser import TrackletParser
+from tracklet_parser.tracklet_writer import write_tracklet_xml
+
+
+class TestTrackletWriter(unittest.TestCase):
+    def setUp(self):
+        resources = os.path.join(os.path.dirname(__file__), "resources")
+        self.example_xml_path = os.path.join(
+            resources, "example_tracklet_labels.xml"
+        )
+        self.example_frame_list_path = os.path.join(
+            resources, "example_frame_list.txt"
+        )
+        self.temp_dir = TemporaryDirectory()
+        self.label_dir = os.path.join(self.temp_dir.name, "labels")
+        os.makedirs(self.label_dir)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self):
+        """Test that converted labels parse back into the same boxes."""
+        tracklets = TrackletParser.parse_tracklet_xml(self.example_xml_path)
+        TrackletParser.convert_tracklets_to_kitti(
+            tracklets, self.example_frame_list_path, self.label_dir
+        )
+        tracklet_xml = os.path.join(self.temp_dir.name, "tracklets.xml")
+        boxes = TrackletParser.convert_kitti_to_tracklets(
+            self.label_dir, self.example_frame_list_path, tracklet_xml
+        )
+        self.assertEqual(boxes, 3)
+
+        expected = [self._box(tracklet) for tracklet in tracklets]
+        for backend in TrackletParser._BACKENDS:
+            with self.subTest(backend=backend):
+                self.assertEqual(
+                    [
+                        self._box(tracklet)
+                        for tracklet in TrackletParser.parse_tracklet_xml(
+                            tracklet_xml, backend=backend
+                        )
+                    ],
+                    expected,
+                )
+
+    def test_boost_serialization_layout(self):
+        """Test the counts and class attributes of boost serialization."""
+        self._write_label_file("7", "Car 0 0 0 0 0 0 0 1.5 1.8 4.2 1 2 3 0.5")
+        self._write_label_file(
+            "3",
+            "Van 0.5 2 0 0 0 0 0 2 2 5 4 5 6 -1\n\n"
+            "Cyclist 0 1 0 0 0 0 0 1.7 0.6 1.8 7 8 9 0 0.9\n",
+        )
+        xml_stream = BytesIO()
+        self.assertEqual(write_tracklet_xml(self.label_dir, {}, xml_stream), 3)
+
+        tracklets = fromstring(xml_stream.getvalue()).find("tracklets")
+        self.assertEqual(tracklets.findtext("count"), "3")
+        items = tracklets.findall("item")
+        self.assertEqual(
+            [item.findtext("first_frame") for item in items], ["3", "3", "7"]
+        )
+        self.assertEqual(items[0].get("class_id"), "1")
+        self.assertIsNone(items[1].get("class_id"))
+        pose = items[0].find("poses/item")
+        self.assertEqual(pose.findtext("occlusion"), "2")
+        self.assertEqual(pose.findtext("truncation"), "0.5")
+        self.assertEqual(pose.findtext("rz"), "-1")
+
+    def test_empty_label_dir(self):
+        """Test writing a document without tracks."""
+        xml_stream = BytesIO()
+        self.assertEqual(write_tracklet_xml(self.label_dir, {}, xml_stream), 0)
+        self.assertEqual(
+            TrackletParser.parse_tracklet_xml(BytesIO(xml_stream.getvalue())),
+            [],
+        )
+
+    def test_unmapped_label_file(self):
+        """Test a label file neither in the frame list nor numbered."""
+        self._write_label_file("unknown", "")
+        with self.assertRaises(ValueError):
+            write_tracklet_xml(
+                self.label_dir, {0: "point_cloud_000"}, BytesIO()
+            )
+
+    def test_malformed_label_line(self):
+        """Test that malformed label lines are reported."""
+        self._write_label_file("0", "Car 0 zero 0 0 0 0 0 1 1 1 0 0 0 0")
+        tracklet_xml = os.path.join(self.temp_dir.name, "tracklets.xml")
+        with self.assertRaises(ValueError):
+            write_tracklet_xml(self.label_dir, {}, tracklet_xml)
+        self.assertEqual(os.listdir(self.temp_dir.name), ["labels"])
+
+    def _write_label_file(self, name: str, content: str) -> None:
+        """Helper method to write a label file."""
+        with open(
+            os.path.join(self.label_dir, f"{name}.txt"), "w", encoding="utf-8"
+        ) as label_file:
+            label_file.write(content)
+
+    @staticmethod
+    def _box(tracklet) -> tuple:
+        """Helper method to compare the written fields of a tracklet."""
+        return (
+            tracklet.frame_number,
+            tracklet.type,
+            tracklet.truncated,
+            tracklet.occluded,
+            tracklet.dimensions,
+            tracklet.location,
+            tracklet.rotation_z,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+
+import numpy as np
+
+from tracklet_parser.tracklet_table import TrackletTable
+from tracklet_parser.validation import ValidationError, validate_table
+
+
+def _table(frame_numbers, type_codes, dimensions, locations) -> TrackletTable:
+    """Helper function to create a table of boxes."""
+    count = len(frame_numbers)
+    return TrackletTable(
+        ["Car", "Pedestrian"],
+        frame_number=frame_numbers,
+        type_code=type_codes,
+        truncated=np.zeros(count),
+        occluded=np.zeros(count),
+        alpha=np.zeros(count),
+        bbox=np.zeros((count, 4)),
+        dimensions=dimensions,
+        location=locations,
+        rotation_z=np.zeros(count),
+    )
+
+
+class TestValidation(unittest.TestCase):
+    def test_validate_table_valid(self):
+        """Test the statistics of boxes passing all checks."""
+        table = _table(
+            [0, 0, 1],
+            [0, 1, 0],
+            [[1.5, 1.8, 4.2], [1.7, 0.6, 0.8], [1.5, 1.8, 4.0]],
+            [[10.0, 0.0, -1.7], [5.0, 2.0, -1.7], [10.0, 0.0, -1.7]],
+        )
+        report = validate_table(table, {0: "a", 1: "b"}, bins=2)
+        self.assertTrue(report.valid)
+        self.assertEqual(report.boxes, 3)
+        self.assertEqual(report.class_counts, {"Car": 2, "Pedestrian": 1})
+        self.assertEqual(report.size_bin_edges["height"], [1.5, 1.6, 1.7])
+        self.assertEqual(report.size_histograms["Car"]["height"], [2, 0])
+        self.assertEqual(
+            report.size_histograms["Pedestrian"]["length"], [1, 0]
+        )
+
+    def test_validate_table_failed_checks(self):
+        """Test detecting NaNs, invalid sizes, duplicates and frames."""
+        table = _table(
+            [0, 0, 0, 7],
+            [0, 0, 0, 1],
+            [[1.5, 1.8, 4.2], [1.5, 1.8, 4.2], [0.0, 1.8, 4.2], [1.7] * 3],
+            [
+                [10.0, 0.0, -1.7],
+                [10.0, -0.0, -1.7],
+                [20.0, 0.0, -1.7],
+                [np.nan, 2.0, -1.7],
+            ],
+        )
+        report = validate_table(table, {0: "a"})
+        self.assertFalse(report.valid)
+        self.assertEqual(report.nan_boxes, 1)
+        self.assertEqual(report.non_positive_dimensions, 1)
+        self.assertEqual(report.duplicate_boxes, 1)
+        self.assertEqual(report.missing_frames, [7])
+        self.assertEqual(len(report.errors()), 4)
+        self.assertIn("1 boxes are duplicates", str(ValidationError(report)))
+
+    def test_validate_table_empty(self):
+        """Test validating a table without boxes."""
+        report = validate_table(TrackletTable.empty(), {0: "a"})
+        self.assertTrue(report.valid)
+        self.assertEqual(report.class_counts, {})
+
+    def test_validate_table_invalid_bins(self):
+        """Test that an invalid number of histogram bins is rejected."""
+        with self.assertRaises(ValueError):
+            validate_table(TrackletTable.empty(), bins=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,288 @@
+import json
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from glob import glob
+from os import cpu_count, path
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from tracklet_parser.tracklet_parser import TrackletParser, create_process_pool
+from tracklet_parser.validation import ValidationError, ValidationReport
+
+
+@dataclass
+class BatchJob:
+    """A single CVAT export to be converted to KITTI format."""
+
+    tracklet_xml: str
+    frame_list: str
+    output_dir: str
+
+
+@dataclass
+class JobSummary:
+    """The outcome of a single batch job."""
+
+    tracklet_xml: str
+    output_dir: str
+    seconds: float
+    boxes: int = 0
+    files_written: int = 0
+    bytes_written: int = 0
+    error: Optional[str] = None
+    validation: Optional[ValidationReport] = None
+
+
+def discover_jobs(
+    pattern: str, output_root: str, frame_list_name: str = "frame_list.txt"
+) -> List[BatchJob]:
+    """Creates a job for every tracklet XML file matching a glob pattern.
+
+    The frame list is expected next to the XML file and the labels are
+    written to a directory below `output_root` named after the directory
+    containing the XML file.
+
+    Arguments:
+        pattern (str): The glob pattern matching the tracklet XML files.
+        output_root (str): The directory receiving one output directory per job.
+        frame_list_name (str): The file name of the frame lists.
+
+    Returns:
+        List[BatchJob]: The jobs sorted by tracklet XML path.
+
+    Raises:
+        ValueError: If two exports would be written to the same directory.
+    """
+    jobs: Dict[str, BatchJob] = {}
+    for tracklet_xml in sorted(glob(pattern, recursive=True)):
+        export_dir = path.dirname(path.abspath(tracklet_xml))
+        output_dir = path.join(output_root, path.basename(export_dir))
+        if output_dir in jobs:
+            raise ValueError(
+                f"{tracklet_xml} and {jobs[output_dir].tracklet_xml} share"
+                f" the output directory {output_dir}."
+            )
+        jobs[output_dir] = BatchJob(
+            tracklet_xml,
+            path.join(export_dir, frame_list_name),
+            output_dir,
+        )
+    return list(jobs.values())
+
+
+def load_manifest(manifest: str) -> List[BatchJob]:
+    """Loads the jobs of a JSON manifest.
+
+    The manifest is a list of objects with the keys "tracklet_xml",
+    "frame_list" and "output_dir". Relative paths are resolved against the
+    directory of the manifest.
+
+    Arguments:
+        manifest (str): The path to the manifest.
+
+    Returns:
+        List[BatchJob]: The jobs in manifest order.
+
+    Raises:
+        ValueError: If an entry of the manifest is incomplete.
+    """
+    with open(manifest, encoding="utf-8") as manifest_file:
+        entries = json.load(manifest_file)
+
+    manifest_dir = path.dirname(path.abspath(manifest))
+    jobs: List[BatchJob] = []
+    for index, entry in enumerate(entries):
+        try:
+            jobs.append(
+                BatchJob(
+                    **{
+                        key: path.join(manifest_dir, entry[key])
+                        for key in ["tracklet_xml", "frame_list", "output_dir"]
+                    }
+                )
+            )
+        except (KeyError, TypeError) as error:
+            raise ValueError(
+                f"Manifest entry {index} is incomplete: {entry}"
+            ) from error
+    return jobs
+
+
+def run_batch(
+    jobs: List[BatchJob],
+    workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    validate: bool = False,
+) -> List[JobSummary]:
+    """Converts many CVAT exports on a shared process pool.
+
+    At most `max_in_flight` jobs are submitted at a time, which bounds the
+    memory held by parsed exports. A failing job is recorded in its summary
+    and does not abort the remaining jobs. With validation, every export is
+    validated by its worker and only written if all checks pass.
+
+    A worker which dies, e.g. killed by the OOM killer, breaks the pool and
+    all jobs in flight. The remaining jobs continue on a new pool, while the
+    jobs in flight are retried one at a time, so only the job killing its
+    worker is recorded as failed.
+
+    Arguments:
+        jobs (List[BatchJob]): The jobs to run.
+        workers (Optional[int]): The number of worker processes, defaults to the number of CPUs.
+        max_in_flight (Optional[int]): The number of jobs submitted at a time, defaults to twice the number of workers.
+        validate (bool): Whether to validate every export before writing it and record the report in its summary.
+
+    Returns:
+        List[JobSummary]: The summaries in job order.
+
+    Raises:
+        ValueError: If the number of workers or of jobs in flight is less than one.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError(f"{workers} is an invalid number of workers.")
+    if max_in_flight is not None and max_in_flight < 1:
+        raise ValueError(
+            f"{max_in_flight} is an invalid number of jobs in flight."
+        )
+
+    workers = workers or cpu_count() or 1
+    limit = max_in_flight or 2 * workers
+    summaries: List[Optional[JobSummary]] = [None] * len(jobs)
+    indices = iter(range(len(jobs)))
+    suspects: List[int] = []
+    while True:
+        lost = _run_jobs(jobs, indices, summaries, workers, limit, validate)
+        if not lost:
+            break
+        suspects.extend(lost)
+
+    for index in sorted(suspects):
+        start = perf_counter()
+        lost = _run_jobs(jobs, iter((index,)), summaries, 1, 1, validate)
+        if lost:
+            summaries[index] = JobSummary(
+                jobs[index].tracklet_xml,
+                jobs[index].output_dir,
+                perf_counter() - start,
+                error=lost[index],
+            )
+    return summaries
+
+
+def _run_jobs(
+    jobs: List[BatchJob],
+    indices: Iterator[int],
+    summaries: List[Optional[JobSummary]],
+    workers: int,
+    limit: int,
+    validate: bool,
+) -> Dict[int, str]:
+    """Runs jobs on a new process pool until all jobs are done or the pool
+    breaks.
+
+    Arguments:
+        jobs (List[BatchJob]): All jobs of the batch.
+        indices (Iterator[int]): The indices of the jobs to run, which are only consumed as far as they are submitted.
+        summaries (List[Optional[JobSummary]]): The summaries in job order, which receive the summaries of the finished jobs.
+        workers (int): The number of worker processes.
+        limit (int): The number of jobs submitted at a time.
+        validate (bool): Whether to validate every export before writing it.
+
+    Returns:
+        Dict[int, str]: The error message per job lost with a broken pool, which is empty if all jobs are done.
+    """
+    pending: Dict[Future, int] = {}
+    lost: Dict[int, str] = {}
+    with create_process_pool(workers) as pool:
+        while not lost:
+            if len(pending) >= limit:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                _collect(done, pending, summaries, lost)
+                continue
+            index = next(indices, None)
+            if index is None:
+                break
+            try:
+                pending[pool.submit(run_job, jobs[index], validate)] = index
+            except BrokenProcessPool as error:
+                lost[index] = f"{type(error).__name__}: {error}"
+        _collect(pending.copy(), pending, summaries, lost)
+    return lost
+
+
+def _collect(
+    done: Iterable[Future],
+    pending: Dict[Future, int],
+    summaries: List[Optional[JobSummary]],
+    lost: Dict[int, str],
+) -> None:
+    """Collects the summaries of finished jobs.
+
+    Arguments:
+        done (Iterable[Future]): The futures of the jobs to collect, which are waited for.
+        pending (Dict[Future, int]): The job index per pending future, from which the collected futures are removed.
+        summaries (List[Optional[JobSummary]]): The summaries in job order.
+        lost (Dict[int, str]): The error message per job lost with a broken pool.
+    """
+    for future in done:
+        index = pending.pop(future)
+        try:
+            summaries[index] = future.result()
+        except BrokenProcessPool as error:
+            lost[index] = f"{type(error).__name__}: {error}"
+
+
+def run_job(job: BatchJob, validate: bool = False) -> JobSummary:
+    """Parses and converts a single CVAT export.
+
+    Arguments:
+        job (BatchJob): The job to run.
+        validate (bool): Whether to validate the export before writing it.
+
+    Returns:
+        JobSummary: The summary of the job, including any error message and the validation report.
+    """
+    start = perf_counter()
+    validation: Optional[ValidationReport] = None
+    try:
+        tracklets = TrackletParser.parse_tracklet_table(job.tracklet_xml)
+        if validate:
+            validation = TrackletParser.validate_tracklets(
+                tracklets, job.frame_list
+            )
+            if not validation.valid:
+                raise ValidationError(validation)
+        report = TrackletParser.convert_tracklets_to_kitti(
+            tracklets, job.frame_list, job.output_dir
+        )
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        return JobSummary(
+            job.tracklet_xml,
+            job.output_dir,
+            perf_counter() - start,
+            error=f"{type(error).__name__}: {error}",
+            validation=validation,
+        )
+    return JobSummary(
+        job.tracklet_xml,
+        job.output_dir,
+        perf_counter() - start,
+        len(tracklets),
+        report.files_written,
+        report.bytes_written,
+        validation=validation,
+    )
+
+
+def write_summary(summaries: List[JobSummary], summary_file: str) -> None:
+    """Writes the job summaries to a JSON file.
+
+    Arguments:
+        summaries (List[JobSummary]): The job summaries.
+        summary_file (str): The path to the JSON file.
+    """
+    with open(summary_file, "w", encoding="utf-8") as json_file:
+        json.dump(
+            [asdict(summary) for summary in summaries], json_file, indent=2
+        )
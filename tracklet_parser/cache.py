@@ -0,0 +1,205 @@
+import json
+from hashlib import sha256
+from logging import Logger, getLogger
+from mmap import ACCESS_READ, mmap
+from os import path, remove, replace, stat
+from struct import Struct
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from tracklet_parser.tracklet_table import TrackletTable
+
+# Suffix of the cache file stored next to the tracklet XML file
+CACHE_SUFFIX: str = ".tpcache"
+
+_LOGGER: Logger = getLogger(__name__)
+_MAGIC: bytes = b"TPCACHE1"
+# Version of the header layout, caches of other versions are rewritten
+_VERSION: int = 1
+_HEADER_SIZE: Struct = Struct("<Q")
+# Column data is aligned for efficient memory mapped access
+_ALIGNMENT: int = 64
+_HASH_CHUNK_SIZE: int = 1 << 20
+
+
+def load_cached_table(
+    tracklet_xml: str, parse: Callable[[str], TrackletTable]
+) -> TrackletTable:
+    """Loads the parsed tracklets of an XML file from its sidecar cache.
+
+    The cache is keyed by the size, modification time and content hash of
+    the XML file. If size and modification time match, the cached columns
+    are memory mapped without reading the XML file at all. If only the
+    modification time changed, the content hash decides whether the cache
+    is still valid. Otherwise the XML file is parsed and the cache is
+    rewritten.
+
+    Arguments:
+        tracklet_xml (str): The path to the tracklet XML file.
+        parse (Callable[[str], TrackletTable]): Parses the XML file on a cache miss.
+
+    Returns:
+        TrackletTable: The table of parsed tracklets.
+    """
+    cache_file = f"{tracklet_xml}{CACHE_SUFFIX}"
+    source = _stat_source(tracklet_xml)
+
+    cached = _read_cache(cache_file)
+    if cached is not None:
+        cached_source, table = cached
+        if (
+            cached_source["size"] == source["size"]
+            and cached_source["mtime_ns"] == source["mtime_ns"]
+        ):
+            return table
+        if cached_source["size"] == source["size"]:
+            source["sha256"] = _hash_source(tracklet_xml)
+            if cached_source["sha256"] == source["sha256"]:
+                _write_cache(cache_file, table, source)
+                return table
+
+    table = parse(tracklet_xml)
+    source.setdefault("sha256", _hash_source(tracklet_xml))
+    _write_cache(cache_file, table, source)
+    return table
+
+
+def _stat_source(tracklet_xml: str) -> Dict[str, Any]:
+    """Collects the size and modification time of the XML file.
+
+    Arguments:
+        tracklet_xml (str): The path to the tracklet XML file.
+
+    Returns:
+        Dict[str, Any]: The source fingerprint without content hash.
+    """
+    status = stat(tracklet_xml)
+    return {"size": status.st_size, "mtime_ns": status.st_mtime_ns}
+
+
+def _hash_source(tracklet_xml: str) -> str:
+    """Computes the content hash of the XML file.
+
+    Arguments:
+        tracklet_xml (str): The path to the tracklet XML file.
+
+    Returns:
+        str: The hexadecimal SHA-256 digest
+    """
+    digest = sha256()
+    with open(tracklet_xml, "rb") as xml_file:
+        while chunk := xml_file.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_cache(
+    cache_file: str,
+) -> Optional[Tuple[Dict[str, Any], TrackletTable]]:
+    """Memory maps a cache file.
+
+    Arguments:
+        cache_file (str): The path to the cache file.
+
+    Returns:
+        Optional[Tuple[Dict[str, Any], TrackletTable]]: The fingerprint of the cached XML file and the table backed by the memory map, or None if the cache is missing, unreadable or of another version.
+    """
+    if not path.exists(cache_file):
+        return None
+
+    try:
+        with open(cache_file, "rb") as binary_file:
+            data = mmap(binary_file.fileno(), 0, access=ACCESS_READ)
+        if data[: len(_MAGIC)] != _MAGIC:
+            raise ValueError("Unknown cache format.")
+        (header_size,) = _HEADER_SIZE.unpack_from(data, len(_MAGIC))
+        header_start = len(_MAGIC) + _HEADER_SIZE.size
+        header = json.loads(data[header_start : header_start + header_size])
+        if header["version"] != _VERSION:
+            raise ValueError(f"Unsupported version {header['version']}.")
+        source = {
+            key: header["source"][key]
+            for key in ("size", "mtime_ns", "sha256")
+        }
+        data_start = _align(header_start + header_size)
+
+        columns = {
+            name: (
+                np.frombuffer(
+                    data,
+                    dtype=np.dtype(column["dtype"]),
+                    count=int(np.prod(column["shape"])),
+                    offset=data_start + column["offset"],
+                ).reshape(column["shape"])
+            )
+            for name, column in header["columns"].items()
+        }
+        return source, TrackletTable(header["types"], **columns)
+    except (OSError, ValueError, KeyError, TypeError) as error:
+        _LOGGER.warning("Ignoring unreadable cache %s: %s", cache_file, error)
+        return None
+
+
+def _write_cache(
+    cache_file: str, table: TrackletTable, source: Dict[str, Any]
+) -> None:
+    """Atomically writes a table to a cache file.
+
+    Arguments:
+        cache_file (str): The path to the cache file.
+        table (TrackletTable): The table of parsed tracklets.
+        source (Dict[str, Any]): The fingerprint of the XML file.
+    """
+    columns = {
+        name: np.ascontiguousarray(getattr(table, name))
+        for name in TrackletTable.COLUMNS
+    }
+    header: Dict[str, Any] = {
+        "version": _VERSION,
+        "source": source,
+        "types": list(table.types),
+        "columns": {},
+    }
+    # Column offsets are relative to the aligned end of the header
+    offset = 0
+    for name, column in columns.items():
+        header["columns"][name] = {
+            "dtype": column.dtype.str,
+            "shape": list(column.shape),
+            "offset": offset,
+        }
+        offset = _align(offset + column.nbytes)
+
+    encoded_header = json.dumps(header).encode("utf-8")
+    data_start = _align(len(_MAGIC) + _HEADER_SIZE.size + len(encoded_header))
+    temporary_file = f"{cache_file}.tmp"
+    try:
+        with open(temporary_file, "wb") as binary_file:
+            binary_file.write(_MAGIC)
+            binary_file.write(_HEADER_SIZE.pack(len(encoded_header)))
+            binary_file.write(encoded_header)
+            for name, column in columns.items():
+                binary_file.seek(
+                    data_start + header["columns"][name]["offset"]
+                )
+                binary_file.write(column.tobytes())
+            binary_file.truncate(data_start + offset)
+        replace(temporary_file, cache_file)
+    except OSError as error:
+        _LOGGER.warning("Failed to write cache %s: %s", cache_file, error)
+        if path.exists(temporary_file):
+            remove(temporary_file)
+
+
+def _align(offset: int) -> int:
+    """Rounds an offset up to the column alignment.
+
+    Arguments:
+        offset (int): The offset in bytes.
+
+    Returns:
+        int: The aligned offset
+    """
+
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
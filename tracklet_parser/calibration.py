@@ -0,0 +1,233 @@
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from tracklet_parser.tracklet_table import TrackletTable
+
+# Accepted names of the matrices in a calibration file
+_MATRIX_KEYS: Dict[str, Tuple[str, ...]] = {
+    "projection": ("P2", "P_rect_02"),
+    "rectification": ("R0_rect", "R_rect_00", "R_rect"),
+    "lidar_to_camera": ("Tr_velo_to_cam", "Tr_velo_cam"),
+}
+_MATRIX_SHAPES: Dict[str, Tuple[int, int]] = {
+    "projection": (3, 4),
+    "rectification": (3, 3),
+    "lidar_to_camera": (3, 4),
+}
+# Corners of a unit box in camera coordinates relative to its bottom center,
+# scaled by length, height and width
+_UNIT_CORNERS: np.ndarray = np.array(
+    [
+        [0.5, 0.5, -0.5, -0.5, 0.5, 0.5, -0.5, -0.5],
+        [0.0, 0.0, 0.0, 0.0, -1.0, -1.0, -1.0, -1.0],
+        [0.5, -0.5, -0.5, 0.5, 0.5, -0.5, -0.5, 0.5],
+    ]
+)
+# Boxes with a corner closer to the image plane are not projected, as in
+# the KITTI devkit
+_MIN_DEPTH: float = 0.1
+
+
+@dataclass(frozen=True)
+class Calibration:
+    """The calibration of a LiDAR and a camera of a KITTI recording.
+
+    Transforms LiDAR boxes as annotated in CVAT into the rectified camera
+    coordinates of KITTI object labels and projects them into the image of
+    the camera. All operations are vectorized over many boxes, e.g. all
+    boxes of a frame or of a whole dataset.
+
+    ## Example:
+
+    ```python
+    calibration = Calibration.from_file("path/to/calib.txt", image_size=(1242, 375))
+    table = calibration.transform(TrackletParser.parse_tracklet_table("path/to/tracklet_labels.xml"))
+    ```
+    """
+
+    # The 3x4 projection matrix of the rectified camera, P2 in KITTI
+    projection: np.ndarray
+    # The 3x3 rectifying rotation, R0_rect in KITTI
+    rectification: np.ndarray
+    # The 3x4 rigid transform from LiDAR to camera, Tr_velo_to_cam in KITTI
+    lidar_to_camera: np.ndarray
+    # The width and height of the image to clip 2D boxes to, if known
+    image_size: Optional[Tuple[int, int]] = None
+
+    def __post_init__(self):
+        """Validates and freezes the matrices.
+
+        Raises:
+            ValueError: If a matrix has the wrong shape.
+        """
+        for name, shape in _MATRIX_SHAPES.items():
+            matrix = np.array(getattr(self, name), dtype=np.float64)
+            if matrix.size != shape[0] * shape[1]:
+                raise ValueError(
+                    f"The {name} matrix must have {shape[0]}x{shape[1]}"
+                    " entries."
+                )
+            matrix = matrix.reshape(shape)
+            matrix.flags.writeable = False
+            object.__setattr__(self, name, matrix)
+
+    @classmethod
+    def from_file(
+        cls, calib_file: str, image_size: Optional[Tuple[int, int]] = None
+    ) -> "Calibration":
+        """Reads the calibration file of the KITTI object detection benchmark.
+
+        Every line holds the name of a matrix, a colon and its entries in
+        row-major order. The matrices P2, R0_rect and Tr_velo_to_cam are
+        used, all other lines are ignored.
+
+        Arguments:
+            calib_file (str): The path to the calibration file.
+            image_size (Optional[Tuple[int, int]]): The width and height of the image to clip 2D boxes to, or None to not clip them.
+
+        Returns:
+            Calibration: The calibration
+
+        Raises:
+            FileNotFoundError: If the calibration file does not exist.
+            ValueError: If a matrix is missing or malformed.
+        """
+        entries: Dict[str, str] = {}
+        with open(calib_file, encoding="utf-8") as calib_stream:
+            for line in calib_stream:
+                key, separator, values = line.partition(":")
+                if separator:
+                    entries[key.strip()] = values
+
+        matrices: Dict[str, np.ndarray] = {}
+        for name, keys in _MATRIX_KEYS.items():
+            key = next((key for key in keys if key in entries), None)
+            if key is None:
+                raise ValueError(f"{calib_file} lacks the {keys[0]} matrix.")
+            try:
+                matrices[name] = np.array(entries[key].split(), np.float64)
+            except ValueError as error:
+                raise ValueError(
+                    f"The {key} matrix of {calib_file} is malformed."
+                ) from error
+        return cls(**matrices, image_size=image_size)
+
+    def to_camera(self, points: np.ndarray) -> np.ndarray:
+        """Transforms points from LiDAR into rectified camera coordinates.
+
+        Arguments:
+            points (np.ndarray): The LiDAR points of shape (n, 3).
+
+        Returns:
+            np.ndarray: The camera points of shape (n, 3)
+        """
+        points = np.asarray(points, np.float64).reshape(-1, 3)
+
+        return (
+            points @ self.lidar_to_camera[:, :3].T + self.lidar_to_camera[:, 3]
+        ) @ self.rectification.T
+
+    def project(self, points: np.ndarray) -> np.ndarray:
+        """Projects points in rectified camera coordinates into the image.
+
+        Arguments:
+            points (np.ndarray): The camera points of shape (..., 3).
+
+        Returns:
+            np.ndarray: The pixel coordinates of shape (..., 2)
+        """
+        points = np.asarray(points, np.float64)
+        image_points = (
+            points @ self.projection[:, :3].T + self.projection[:, 3]
+        )
+
+        return image_points[..., :2] / image_points[..., 2:]
+
+    def transform(self, table: TrackletTable) -> TrackletTable:
+        """Converts a table of LiDAR boxes into KITTI camera labels.
+
+        The locations are transformed into camera coordinates, the LiDAR
+        yaw becomes the rotation around the camera y axis,
+        `rotation_y = -rotation_z - pi / 2`, and the observation angle is
+        `alpha = rotation_y - arctan2(x, z)`. The eight corners of every box
+        are projected into the image and enclosed by the 2D bounding box,
+        which is clipped to the image size, if known. Boxes reaching behind
+        the camera keep an empty 2D bounding box.
+
+        Arguments:
+            table (TrackletTable): The boxes with LiDAR locations and yaws.
+
+        Returns:
+            TrackletTable: The boxes in camera coordinates with alpha and 2D bounding boxes
+        """
+        location = self.to_camera(table.location)
+        rotation_y = _normalize_angle(-table.rotation_z - np.pi / 2)
+        alpha = _normalize_angle(
+            rotation_y - np.arctan2(location[:, 0], location[:, 2])
+        )
+
+        return table.replace(
+            location=location,
+            rotation_z=rotation_y,
+            alpha=alpha,
+            bbox=self._project_boxes(location, table.dimensions, rotation_y),
+        )
+
+    def _project_boxes(
+        self,
+        location: np.ndarray,
+        dimensions: np.ndarray,
+        rotation_y: np.ndarray,
+    ) -> np.ndarray:
+        """Computes the 2D bounding boxes enclosing projected 3D boxes.
+
+        Arguments:
+            location (np.ndarray): The bottom centers in camera coordinates of shape (n, 3).
+            dimensions (np.ndarray): The heights, widths and lengths of shape (n, 3).
+            rotation_y (np.ndarray): The rotations around the camera y axis of shape (n,).
+
+        Returns:
+            np.ndarray: The left, top, right and bottom pixel coordinates of shape (n, 4)
+        """
+        # Scale the unit corners by length, height and width
+        corners = _UNIT_CORNERS * dimensions[:, [2, 0, 1], np.newaxis]
+        # Rotate the corners around the y axis and move them to the boxes
+        cos = np.cos(rotation_y)[:, np.newaxis]
+        sin = np.sin(rotation_y)[:, np.newaxis]
+        corners = (
+            np.stack(
+                (
+                    cos * corners[:, 0] + sin * corners[:, 2],
+                    corners[:, 1],
+                    cos * corners[:, 2] - sin * corners[:, 0],
+                ),
+                axis=-1,
+            )
+            + location[:, np.newaxis]
+        )
+
+        visible = np.all(corners[..., 2] >= _MIN_DEPTH, axis=1)
+        pixels = self.project(corners[visible])
+        bbox = np.zeros((len(location), 4))
+        bbox[visible, :2] = pixels.min(axis=1)
+        bbox[visible, 2:] = pixels.max(axis=1)
+        if self.image_size is not None:
+            width, height = self.image_size
+            np.clip(bbox[:, 0::2], 0.0, width - 1, out=bbox[:, 0::2])
+            np.clip(bbox[:, 1::2], 0.0, height - 1, out=bbox[:, 1::2])
+        return bbox
+
+
+def _normalize_angle(angle: np.ndarray) -> np.ndarray:
+    """Wraps angles into [-pi, pi).
+
+    Arguments:
+        angle (np.ndarray): The angles in radians.
+
+    Returns:
+        np.ndarray: The wrapped angles
+    """
+
+    return (angle + np.pi) % (2 * np.pi) - np.pi
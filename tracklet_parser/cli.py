@@ -0,0 +1,282 @@
+import json
+import sys
+from argparse import ArgumentParser, Namespace
+from typing import List, Optional
+from xml.etree.ElementTree import ParseError
+
+from tracklet_parser.batch import (
+    discover_jobs,
+    load_manifest,
+    run_batch,
+    write_summary,
+)
+from tracklet_parser.calibration import Calibration
+from tracklet_parser.instrumentation import Instrumentation
+from tracklet_parser.kitti_sink import SINKS, create_sink
+from tracklet_parser.tracklet_parser import TrackletParser
+from tracklet_parser.tracklet_table import TrackletTable
+
+# Denotes stdin or stdout instead of a file path
+_STANDARD_STREAM: str = "-"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Runs the command-line interface.
+
+    Arguments:
+        argv (Optional[List[str]]): The command-line arguments, defaults to `sys.argv`.
+
+    Returns:
+        int: The exit code
+    """
+    parser = ArgumentParser(
+        prog="tracklet-parser",
+        description="Convert CVAT tracklet labels to KITTI format and back.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    convert_parser = subparsers.add_parser(
+        "convert", help="Convert a single CVAT export."
+    )
+    convert_parser.add_argument(
+        "tracklet_xml",
+        help=(
+            "Tracklet XML file, or - to read from stdin. Compressed input is"
+            " detected by its leading bytes."
+        ),
+    )
+    convert_parser.add_argument(
+        "frame_list", help="Frame list of the CVAT export."
+    )
+    convert_parser.add_argument(
+        "output",
+        help="Output directory or file, or - to write to stdout.",
+    )
+    convert_parser.add_argument(
+        "--sink",
+        choices=list(SINKS),
+        default="directory",
+        help="Output layout of the label files.",
+    )
+    convert_parser.add_argument(
+        "--backend",
+        choices=["etree", "fast"],
+        default="etree",
+        help="Parser of the tracklet XML file.",
+    )
+    convert_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of workers formatting the label files.",
+    )
+    convert_parser.add_argument(
+        "--executor",
+        choices=["thread", "process"],
+        default="thread",
+        help="Worker pool formatting the label files.",
+    )
+    convert_parser.add_argument(
+        "--precision",
+        type=int,
+        help="Number of decimals, e.g. 2 as in the KITTI devkit.",
+    )
+    convert_parser.add_argument(
+        "--calibration",
+        help="KITTI calibration file to compute camera coordinates, alpha"
+        " and 2D bounding boxes.",
+    )
+    convert_parser.add_argument(
+        "--image-size",
+        type=int,
+        nargs=2,
+        metavar=("WIDTH", "HEIGHT"),
+        help="Image size to clip the 2D bounding boxes to.",
+    )
+    convert_parser.add_argument(
+        "--stats",
+        help="JSON file receiving the stage times and counters.",
+    )
+    convert_parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Check the boxes and fail before writing if a check fails.",
+    )
+    convert_parser.set_defaults(handler=_run_convert)
+
+    to_xml_parser = subparsers.add_parser(
+        "to-xml", help="Convert KITTI label files back into tracklet XML."
+    )
+    to_xml_parser.add_argument(
+        "label_dir", help="Directory of KITTI label files."
+    )
+    to_xml_parser.add_argument(
+        "frame_list", help="Frame list mapping frames to label files."
+    )
+    to_xml_parser.add_argument(
+        "tracklet_xml", help="Tracklet XML file, or - to write to stdout."
+    )
+    to_xml_parser.set_defaults(handler=_run_to_xml)
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="Convert many CVAT exports on a shared worker pool."
+    )
+    jobs_group = batch_parser.add_mutually_exclusive_group(required=True)
+    jobs_group.add_argument(
+        "--manifest", help="JSON manifest listing the exports to convert."
+    )
+    jobs_group.add_argument(
+        "--glob", help="Glob pattern matching the tracklet XML files."
+    )
+    batch_parser.add_argument(
+        "--output-root",
+        default=".",
+        help="Directory receiving one output directory per export (--glob).",
+    )
+    batch_parser.add_argument(
+        "--workers", type=int, help="Number of worker processes."
+    )
+    batch_parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        help="Number of exports held in memory at a time.",
+    )
+    batch_parser.add_argument(
+        "--summary",
+        default="batch_summary.json",
+        help="JSON file receiving the per-job summary.",
+    )
+    batch_parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Validate every export and skip writing exports failing it.",
+    )
+    batch_parser.set_defaults(handler=_run_batch)
+
+    arguments = parser.parse_args(argv)
+    return arguments.handler(arguments)
+
+
+def _run_convert(arguments: Namespace) -> int:
+    """Runs the convert subcommand.
+
+    The tracks are streamed from the XML file straight into the columns of
+    a table, so no Tracklet objects are created. The label files are then
+    formatted frame by frame and streamed to the sink.
+
+    Arguments:
+        arguments (Namespace): The parsed command-line arguments.
+
+    Returns:
+        int: 0 if the conversion succeeded, 1 otherwise
+    """
+    tracklet_xml = arguments.tracklet_xml
+    if tracklet_xml == _STANDARD_STREAM:
+        tracklet_xml = sys.stdin.buffer
+    output = arguments.output
+    if output == _STANDARD_STREAM:
+        output = sys.stdout.buffer
+
+    instrumentation = Instrumentation() if arguments.stats else None
+    try:
+        sink = create_sink(arguments.sink, output)
+        calibration = None
+        if arguments.calibration:
+            calibration = Calibration.from_file(
+                arguments.calibration,
+                tuple(arguments.image_size) if arguments.image_size else None,
+            )
+        table = TrackletTable.from_tracks(
+            TrackletParser.iter_tracks(
+                tracklet_xml, instrumentation, arguments.backend
+            )
+        )
+        report = TrackletParser.convert_tracklets_to_kitti(
+            table,
+            arguments.frame_list,
+            arguments.output,
+            workers=arguments.workers,
+            executor=arguments.executor,
+            precision=arguments.precision,
+            sink=sink,
+            instrumentation=instrumentation,
+            calibration=calibration,
+            validate=arguments.validate,
+        )
+        if instrumentation is not None:
+            with open(arguments.stats, "w", encoding="utf-8") as stats_file:
+                json.dump(
+                    instrumentation.stats.to_dict(), stats_file, indent=2
+                )
+    except (OSError, ValueError, ParseError) as error:
+        print(f"tracklet-parser: {error}", file=sys.stderr)
+        return 1
+
+    # Report on stderr, stdout may carry the label files
+    print(
+        f"Converted {len(table)} boxes into {report.files_written} label"
+        f" files ({report.bytes_written} bytes)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def _run_to_xml(arguments: Namespace) -> int:
+    """Runs the to-xml subcommand.
+
+    Arguments:
+        arguments (Namespace): The parsed command-line arguments.
+
+    Returns:
+        int: 0 if the conversion succeeded, 1 otherwise
+    """
+    tracklet_xml = arguments.tracklet_xml
+    if tracklet_xml == _STANDARD_STREAM:
+        tracklet_xml = sys.stdout.buffer
+
+    try:
+        boxes = TrackletParser.convert_kitti_to_tracklets(
+            arguments.label_dir, arguments.frame_list, tracklet_xml
+        )
+    except (OSError, ValueError) as error:
+        print(f"tracklet-parser: {error}", file=sys.stderr)
+        return 1
+
+    print(f"Converted {boxes} boxes into tracks", file=sys.stderr)
+    return 0
+
+
+def _run_batch(arguments: Namespace) -> int:
+    """Runs the batch subcommand.
+
+    Arguments:
+        arguments (Namespace): The parsed command-line arguments.
+
+    Returns:
+        int: 0 if all jobs succeeded, 1 otherwise
+    """
+    try:
+        if arguments.manifest:
+            jobs = load_manifest(arguments.manifest)
+        else:
+            jobs = discover_jobs(arguments.glob, arguments.output_root)
+        summaries = run_batch(
+            jobs,
+            arguments.workers,
+            arguments.max_in_flight,
+            arguments.validate,
+        )
+    except (OSError, ValueError) as error:
+        print(f"tracklet-parser: {error}", file=sys.stderr)
+        return 1
+
+    write_summary(summaries, arguments.summary)
+
+    failed = [summary for summary in summaries if summary.error]
+    for summary in failed:
+        print(f"{summary.tracklet_xml}: {summary.error}", file=sys.stderr)
+    print(
+        f"Converted {len(summaries) - len(failed)} of {len(summaries)}"
+        f" exports, summary written to {arguments.summary}"
+    )
+    return 1 if failed else 0
@@ -0,0 +1,203 @@
+import gzip
+import lzma
+import zipfile
+from contextlib import ExitStack, contextmanager
+from io import BytesIO
+from mmap import ACCESS_READ, mmap
+from os import path
+from typing import BinaryIO, Iterator, Optional, Tuple, Union
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Default names of the files of a CVAT export inside a zip archive
+TRACKLET_XML_MEMBER: str = "tracklet_labels.xml"
+FRAME_LIST_MEMBER: str = "frame_list.txt"
+
+_ZSTD_SUFFIXES = (".zst", ".zstd")
+# The leading bytes identifying the formats of binary streams by suffix
+_SIGNATURES: Tuple[Tuple[bytes, str], ...] = (
+    (b"\x1f\x8b", ".gz"),
+    (b"\xfd7zXZ\x00", ".xz"),
+    (b"\x28\xb5\x2f\xfd", ".zst"),
+    (b"PK\x03\x04", ".zip"),
+)
+
+
+def is_compressed(source: Union[str, BinaryIO]) -> bool:
+    """Check whether a source is a path to a compressed file or an archive.
+
+    Arguments:
+        source (Union[str, BinaryIO]): The file path or a binary stream.
+
+    Returns:
+        bool: Whether the source is decompressed while reading
+    """
+
+    return isinstance(source, str) and source.lower().endswith(
+        (".gz", ".xz", ".zip", *_ZSTD_SUFFIXES)
+    )
+
+
+@contextmanager
+def open_input(
+    source: Union[str, BinaryIO], member: Optional[str] = None
+) -> Iterator[BinaryIO]:
+    """Opens a file for streamed binary reading, decompressing it on the fly.
+
+    Files ending in `.gz`, `.xz` and, if the `zstandard` package is
+    installed, `.zst` are decompressed while reading. Of a `.zip` archive,
+    the given member is read, which is also found by its base name in a
+    subdirectory, e.g. the `frame_list.txt` of a CVAT export. Binary streams,
+    e.g. stdin, are recognized by their leading bytes if they can be peeked
+    at or rewound and are decompressed the same way, otherwise they are
+    passed through. Binary streams are not closed.
+
+    Arguments:
+        source (Union[str, BinaryIO]): The file path or a binary stream.
+        member (Optional[str]): The member to read from a zip archive, or None if the archive holds a single file.
+
+    Returns:
+        Iterator[BinaryIO]: A context manager yielding the binary stream.
+
+    Raises:
+        FileNotFoundError: If the file or the zip archive member does not exist.
+        ValueError: If a zstd file is read without the `zstandard` package or the zip archive member is ambiguous.
+    """
+    if isinstance(source, str):
+        suffix = path.splitext(source)[1].lower()
+        name = source
+    else:
+        suffix = _detect_suffix(source)
+        name = "the input stream"
+        if suffix is None:
+            yield source
+            return
+
+    with ExitStack() as stack:
+        if isinstance(source, str) and suffix not in (".zip", ".gz", ".xz"):
+            raw_stream = stack.enter_context(open(source, "rb"))
+        else:
+            raw_stream = source
+        if suffix == ".gz":
+            stream = stack.enter_context(gzip.open(raw_stream, "rb"))
+        elif suffix == ".xz":
+            stream = stack.enter_context(lzma.open(raw_stream, "rb"))
+        elif suffix in _ZSTD_SUFFIXES:
+            if zstandard is None:
+                raise ValueError(
+                    f"Reading {name} requires the zstandard package."
+                )
+            stream = stack.enter_context(
+                zstandard.ZstdDecompressor().stream_reader(
+                    raw_stream, closefd=False
+                )
+            )
+        elif suffix == ".zip":
+            if not isinstance(raw_stream, str) and not raw_stream.seekable():
+                # Zip archives are indexed at their end
+                raw_stream = BytesIO(raw_stream.read())
+            archive = stack.enter_context(zipfile.ZipFile(raw_stream))
+            stream = stack.enter_context(
+                archive.open(_find_member(archive, member))
+            )
+        else:
+            stream = raw_stream
+        yield stream
+
+
+def _detect_suffix(stream: BinaryIO) -> Optional[str]:
+    """Detects the format of a binary stream by its leading bytes without
+    consuming them.
+
+    Arguments:
+        stream (BinaryIO): The binary stream.
+
+    Returns:
+        Optional[str]: The file suffix of the format, or None for uncompressed streams and streams which can neither be peeked at nor rewound.
+    """
+    if hasattr(stream, "peek"):
+        head = stream.peek(6)[:6]
+    elif stream.seekable():
+        position = stream.tell()
+        head = stream.read(6)
+        stream.seek(position)
+    else:
+        return None
+
+    for signature, suffix in _SIGNATURES:
+        if head.startswith(signature):
+            return suffix
+    return None
+
+
+def _find_member(archive: zipfile.ZipFile, member: Optional[str]) -> str:
+    """Finds a file in a zip archive by its name or base name.
+
+    Arguments:
+        archive (zipfile.ZipFile): The zip archive.
+        member (Optional[str]): The member name, or None if the archive holds a single file.
+
+    Returns:
+        str: The full name of the member
+
+    Raises:
+        FileNotFoundError: If the member does not exist.
+        ValueError: If several files match.
+    """
+    names = [name for name in archive.namelist() if not name.endswith("/")]
+    if member is None:
+        candidates = names
+    elif member in names:
+        return member
+    else:
+        candidates = [name for name in names if path.basename(name) == member]
+
+    if not candidates:
+        raise FileNotFoundError(
+            f"{member or 'A file'} not found in {archive.filename}."
+        )
+    if len(candidates) > 1:
+        raise ValueError(
+            f"{archive.filename} contains several candidates: "
+            f"{', '.join(candidates)}"
+        )
+    return candidates[0]
+
+
+@contextmanager
+def map_input(
+    source: Union[str, BinaryIO], member: Optional[str] = None
+) -> Iterator[Union[bytes, mmap]]:
+    """Provides the whole content of a file as a bytes-like object.
+
+    Plain files are memory mapped, compressed files, zip archive members and
+    binary streams are decompressed and read into memory.
+
+    Arguments:
+        source (Union[str, BinaryIO]): The file path or a binary stream.
+        member (Optional[str]): The member to read from a zip archive, or None if the archive holds a single file.
+
+    Returns:
+        Iterator[Union[bytes, mmap]]: A context manager yielding the content.
+
+    Raises:
+        FileNotFoundError: If the file or the zip archive member does not exist.
+        ValueError: If a zstd file is read without the `zstandard` package or the zip archive member is ambiguous.
+    """
+    if (
+        isinstance(source, str)
+        and not is_compressed(source)
+        and path.getsize(source)
+    ):
+        with (
+            open(source, "rb") as binary_file,
+            mmap(binary_file.fileno(), 0, access=ACCESS_READ) as content,
+        ):
+            yield content
+        return
+
+    with open_input(source, member) as stream:
+        yield stream.read()
@@ -0,0 +1,64 @@
+from typing import BinaryIO, Dict, Union
+
+from tracklet_parser.compression import FRAME_LIST_MEMBER, open_input
+
+
+def read_frame_list(frame_list: Union[str, BinaryIO]) -> Dict[int, str]:
+    """Reads a CVAT frame list mapping frame numbers to point cloud files.
+
+    Each non-empty line holds a frame number and a file prefix separated by
+    whitespace. The file is streamed line by line, so only a single line
+    is held in memory besides the dictionary. Compressed files and the
+    `frame_list.txt` of a zipped CVAT export are decompressed while
+    streaming.
+
+    Arguments:
+        frame_list (Union[str, BinaryIO]): The frame list file path, a compressed file path, a CVAT export zip archive or a binary stream.
+
+    Returns:
+        Dict[int, str]: A dictionary mapping frame numbers to file prefixes.
+
+    Raises:
+        FileNotFoundError: If the file or the zip archive member does not exist.
+        ValueError: If a line is malformed or a frame number is listed twice.
+    """
+    with open_input(frame_list, FRAME_LIST_MEMBER) as frame_list_file:
+        return _stream_frame_list(frame_list_file)
+
+
+def _stream_frame_list(frame_list_file: BinaryIO) -> Dict[int, str]:
+    """Parses and validates a frame list line by line.
+
+    Arguments:
+        frame_list_file (BinaryIO): The frame list opened in binary mode.
+
+    Returns:
+        Dict[int, str]: A dictionary mapping frame numbers to file prefixes.
+
+    Raises:
+        ValueError: If a line is malformed or a frame number is listed twice.
+    """
+    label_dict: Dict[int, str] = {}
+    for line_number, line in enumerate(frame_list_file, 1):
+        fields = line.split(None, 1)
+        if not fields:
+            continue
+        if len(fields) != 2:
+            raise ValueError(
+                f"Line {line_number} of the frame list lacks a file name."
+            )
+
+        try:
+            frame_number = int(fields[0])
+        except ValueError as error:
+            raise ValueError(
+                f"Line {line_number} of the frame list has an invalid frame"
+                f" number: {fields[0].decode(errors='replace')}"
+            ) from error
+        if frame_number in label_dict:
+            raise ValueError(
+                f"Line {line_number} of the frame list repeats frame number"
+                f" {frame_number}."
+            )
+        label_dict[frame_number] = fields[1].strip().decode("utf-8")
+    return label_dict
@@ -0,0 +1,232 @@
+import tracemalloc
+from contextlib import contextmanager
+from cProfile import Profile
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, TypeVar
+
+_Item = TypeVar("_Item")
+
+# Receives the name and the new total of a counter
+ProgressHook = Callable[[str, int], None]
+
+
+@dataclass
+class Stats:
+    """Collects the time spent per stage and the counters of a call."""
+
+    seconds: Dict[str, float] = field(default_factory=dict)
+    counters: Dict[str, int] = field(default_factory=dict)
+    peak_memory_bytes: Optional[int] = None
+
+    def merge(self, other: "Stats") -> None:
+        """Adds the times and counters of another call, e.g. of a worker.
+
+        Arguments:
+            other (Stats): The stats to add.
+        """
+        for stage, seconds in other.seconds.items():
+            self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+        for counter, value in other.counters.items():
+            self.counters[counter] = self.counters.get(counter, 0) + value
+        if other.peak_memory_bytes is not None:
+            self.peak_memory_bytes = max(
+                self.peak_memory_bytes or 0, other.peak_memory_bytes
+            )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the stats into JSON serializable types.
+
+        Returns:
+            Dict[str, Any]: The stats
+        """
+
+        return {
+            "seconds": dict(self.seconds),
+            "counters": dict(self.counters),
+            "peak_memory_bytes": self.peak_memory_bytes,
+        }
+
+
+class Instrumentation:
+    """Opt-in instrumentation of the parser and the KITTI conversion.
+
+    An instrumentation object is passed to a public `TrackletParser` call,
+    which records the time of every stage, e.g. "parse", "frame_list",
+    "format" and "write", and counters such as "tracks", "boxes",
+    "files_written" and "bytes_written" into its `stats`. Work done by
+    workers is summed up, so stage times may exceed the wall clock time.
+
+    ## Example:
+
+    ```python
+    instrumentation = Instrumentation(progress=lambda name, total: print(name, total))
+    tracklets = TrackletParser.parse_tracklet_xml("path/to/tracklet_labels.xml", instrumentation=instrumentation)
+    print(instrumentation.stats.to_dict())
+    ```
+    """
+
+    stats: Stats
+    progress: Optional[ProgressHook]
+    profiler: Optional[Profile]
+    trace_memory: bool
+    _depth: int
+
+    def __init__(
+        self,
+        progress: Optional[ProgressHook] = None,
+        profile: bool = False,
+        trace_memory: bool = False,
+    ):
+        """Initializes the instrumentation.
+
+        Arguments:
+            progress (Optional[ProgressHook]): Called with the name and the new total of a counter whenever it changes.
+            profile (bool): Whether to run public calls under cProfile, see `profiler`.
+            trace_memory (bool): Whether to trace the peak memory of public calls with tracemalloc.
+        """
+        self.stats = Stats()
+        self.progress = progress
+        self.profiler = Profile() if profile else None
+        self.trace_memory = trace_memory
+        self._depth = 0
+
+    @contextmanager
+    def session(self) -> Iterator["Instrumentation"]:
+        """Wraps a public call with the profiler and the memory tracing.
+        Nested calls are only wrapped once.
+
+        Returns:
+            Iterator[Instrumentation]: A context manager yielding the instrumentation.
+        """
+        self._depth += 1
+        outermost = self._depth == 1
+        tracing = (
+            outermost and self.trace_memory and not tracemalloc.is_tracing()
+        )
+        if tracing:
+            tracemalloc.start()
+        if outermost and self.profiler is not None:
+            self.profiler.enable()
+        try:
+            yield self
+        finally:
+            if outermost and self.profiler is not None:
+                self.profiler.disable()
+            if tracing:
+                _, peak_memory_bytes = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                self.stats.peak_memory_bytes = max(
+                    self.stats.peak_memory_bytes or 0, peak_memory_bytes
+                )
+            self._depth -= 1
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Times a stage.
+
+        Arguments:
+            name (str): The name of the stage.
+
+        Returns:
+            Iterator[None]: A context manager timing its body.
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, perf_counter() - start)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """Adds time to a stage.
+
+        Arguments:
+            name (str): The name of the stage.
+            seconds (float): The time in seconds.
+        """
+
+        self.stats.seconds[name] = self.stats.seconds.get(name, 0.0) + seconds
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increments a counter and reports the new total to the progress
+        hook.
+
+        Arguments:
+            name (str): The name of the counter.
+            amount (int): The increment.
+        """
+        total = self.stats.counters.get(name, 0) + amount
+        self.stats.counters[name] = total
+        if self.progress is not None:
+            self.progress(name, total)
+
+    def iterate(
+        self,
+        stage: str,
+        iterable: Iterable[_Item],
+        counter: Optional[str] = None,
+    ) -> Iterator[_Item]:
+        """Times the production of every item of a lazy iterable, e.g. the
+        parsing of streamed tracks, and counts the items.
+
+        Arguments:
+            stage (str): The name of the stage.
+            iterable (Iterable[_Item]): The iterable.
+            counter (Optional[str]): The name of the counter of items, or None to not count them.
+
+        Returns:
+            Iterator[_Item]: An iterator over the items.
+        """
+        iterator = iter(iterable)
+        while True:
+            start = perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add_time(stage, perf_counter() - start)
+                return
+            self.add_time(stage, perf_counter() - start)
+            if counter is not None:
+                self.count(counter)
+            yield item
+
+
+@contextmanager
+def optional_session(
+    instrumentation: Optional[Instrumentation],
+) -> Iterator[Optional[Instrumentation]]:
+    """Opens a session of an instrumentation, if any.
+
+    Arguments:
+        instrumentation (Optional[Instrumentation]): The instrumentation or None.
+
+    Returns:
+        Iterator[Optional[Instrumentation]]: A context manager yielding the instrumentation.
+    """
+    if instrumentation is None:
+        yield None
+        return
+
+    with instrumentation.session():
+        yield instrumentation
+
+
+@contextmanager
+def optional_stage(
+    instrumentation: Optional[Instrumentation], name: str
+) -> Iterator[None]:
+    """Times a stage if an instrumentation is given.
+
+    Arguments:
+        instrumentation (Optional[Instrumentation]): The instrumentation or None.
+        name (str): The name of the stage.
+
+    Returns:
+        Iterator[None]: A context manager timing its body.
+    """
+    if instrumentation is None:
+        yield
+        return
+
+    with instrumentation.stage(name):
+        yield
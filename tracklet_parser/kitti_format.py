@@ -0,0 +1,132 @@
+from itertools import chain
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from tracklet_parser.tracklet import Tracklet
+from tracklet_parser.tracklet_table import TrackletTable
+
+
+def format_kitti_label(
+    tracklet: Tracklet, precision: Optional[int] = None
+) -> str:
+    """Formats a single tracklet as a KITTI label line.
+
+    Arguments:
+        tracklet (Tracklet): The tracklet object.
+        precision (Optional[int]): The number of decimals of all floating point values, or None for their shortest representation.
+
+    Returns:
+        str: The tracklet in KITTI format without line break.
+    """
+    information = (
+        tracklet.type,
+        tracklet.truncated,
+        tracklet.occluded,
+        tracklet.alpha,
+        *tracklet.bbox,
+        *tracklet.dimensions,
+        *tracklet.location,
+        tracklet.rotation_z,
+    )
+    if precision is None:
+        return " ".join(map(str, information))
+    return _line_template(precision)[:-1] % information
+
+
+def format_kitti_labels(
+    tracklets: Union[Sequence[Tracklet], TrackletTable],
+    precision: Optional[int] = None,
+) -> str:
+    """Formats a batch of tracklets, e.g. all boxes of a frame, as a block of
+    KITTI label lines in a single pass.
+
+    With a fixed precision, all values are rendered by one `%` operation on
+    a repeated line template, e.g. `%.2f` as in the KITTI devkit. Otherwise
+    the shortest representation of every value is used.
+
+    Arguments:
+        tracklets (Union[Sequence[Tracklet], TrackletTable]): The tracklets or a columnar table of tracklets.
+        precision (Optional[int]): The number of decimals of all floating point values, or None for their shortest representation.
+
+    Returns:
+        str: The KITTI label lines, each terminated by a line break.
+
+    Raises:
+        ValueError: If the precision is negative.
+    """
+    if precision is not None and precision < 0:
+        raise ValueError(f"{precision} is an invalid precision.")
+    if isinstance(tracklets, TrackletTable):
+        return _format_table(tracklets, precision)
+
+    if precision is None:
+        return "".join(
+            f"{format_kitti_label(tracklet)}\n" for tracklet in tracklets
+        )
+
+    values = []
+    for tracklet in tracklets:
+        values.extend(
+            (
+                tracklet.type,
+                tracklet.truncated,
+                tracklet.occluded,
+                tracklet.alpha,
+                *tracklet.bbox,
+                *tracklet.dimensions,
+                *tracklet.location,
+                tracklet.rotation_z,
+            )
+        )
+    return (_line_template(precision) * len(tracklets)) % tuple(values)
+
+
+def _format_table(table: TrackletTable, precision: Optional[int]) -> str:
+    """Formats all rows of a table as KITTI label lines.
+
+    Arguments:
+        table (TrackletTable): The table of tracklets.
+        precision (Optional[int]): The number of decimals of all floating point values, or None for their shortest representation.
+
+    Returns:
+        str: The KITTI label lines, each terminated by a line break.
+    """
+    if not len(table):
+        return ""
+
+    columns = [
+        np.asarray(table.types, dtype=object)[table.type_code].tolist(),
+        table.truncated.tolist(),
+        table.occluded.tolist(),
+        table.alpha.tolist(),
+        *table.bbox.T.tolist(),
+        *table.dimensions.T.tolist(),
+        *table.location.T.tolist(),
+        table.rotation_z.tolist(),
+    ]
+
+    if precision is None:
+        return (
+            "\n".join(
+                map(" ".join, zip(*(map(str, column) for column in columns)))
+            )
+            + "\n"
+        )
+    # Interleave the columns row by row into a single flat sequence
+    return (_line_template(precision) * len(table)) % tuple(
+        chain.from_iterable(zip(*columns))
+    )
+
+
+def _line_template(precision: int) -> str:
+    """Creates the `%` template of a KITTI label line.
+
+    Arguments:
+        precision (int): The number of decimals of all floating point values.
+
+    Returns:
+        str: The template including the trailing line break.
+    """
+    number = f"%.{precision}f"
+    return " ".join(["%s", number, "%d"] + [number] * 12) + "\n"
@@ -0,0 +1,306 @@
+import tarfile
+import zipfile
+from abc import ABC, abstractmethod
+from io import BytesIO
+from os import makedirs, path, remove
+from time import time
+from typing import BinaryIO, Callable, Dict, Optional, TextIO, Tuple, Union
+
+from tracklet_parser.kitti_writer import write_label_file
+
+
+class LabelSink(ABC):
+    """Receives the label files of a KITTI conversion.
+
+    A sink is opened before the first label file is written and closed after
+    the last one, e.g. by using it as a context manager. Label files are
+    passed one at a time, so no sink has to hold more than a single label
+    file in memory.
+    """
+
+    # Whether label files may be written from several workers at once
+    concurrent: bool = False
+
+    def open(self) -> None:
+        """Prepares the sink for writing."""
+
+    @abstractmethod
+    def write(self, name: str, data: bytes) -> int:
+        """Writes a label file.
+
+        Arguments:
+            name (str): The name of the label file, e.g. `frame_0000.txt`.
+            data (bytes): The UTF-8 encoded labels in KITTI format, one per line.
+
+        Returns:
+            int: The number of label bytes written
+        """
+
+    def close(self) -> None:
+        """Finalizes the sink after the last label file."""
+
+    def __enter__(self) -> "LabelSink":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class DirectorySink(LabelSink):
+    """Writes every label file to its own file in an output directory. This
+    is the layout of the KITTI object detection benchmark.
+    """
+
+    concurrent = True
+
+    output_dir: str
+
+    def __init__(self, output_dir: str):
+        """Initializes the sink.
+
+        Arguments:
+            output_dir (str): The output directory, which is created if missing.
+        """
+        self.output_dir = output_dir
+
+    def open(self) -> None:
+        makedirs(self.output_dir, exist_ok=True)
+
+    def write(self, name: str, data: bytes) -> int:
+        return write_label_file(path.join(self.output_dir, name), data)
+
+    def exists(self, name: str) -> bool:
+        """Check whether a label file exists in the output directory.
+
+        Arguments:
+            name (str): The name of the label file.
+
+        Returns:
+            bool: Whether the label file exists
+        """
+
+        return path.exists(path.join(self.output_dir, name))
+
+    def remove(self, name: str) -> bool:
+        """Removes a label file from the output directory.
+
+        Arguments:
+            name (str): The name of the label file.
+
+        Returns:
+            bool: Whether the label file existed
+        """
+        label_file = path.join(self.output_dir, name)
+        if not path.exists(label_file):
+            return False
+        remove(label_file)
+        return True
+
+
+class TarSink(LabelSink):
+    """Streams all label files into a single tar archive."""
+
+    archive: Union[str, BinaryIO]
+    compression: str
+    _tar_file: Optional[tarfile.TarFile]
+    _mtime: float
+
+    def __init__(self, archive: Union[str, BinaryIO], compression: str = ""):
+        """Initializes the sink.
+
+        Arguments:
+            archive (Union[str, BinaryIO]): The path to the tar archive or a binary stream, which is written sequentially, e.g. `sys.stdout.buffer`.
+            compression (str): The compression of the archive, "" for none or one of "gz", "bz2" and "xz".
+        """
+        self.archive = archive
+        self.compression = compression
+        self._tar_file = None
+        self._mtime = 0.0
+
+    def open(self) -> None:
+        if isinstance(self.archive, str):
+            _make_parent_dirs(self.archive)
+            self._tar_file = tarfile.open(
+                self.archive, f"w:{self.compression}"
+            )
+        else:
+            self._tar_file = tarfile.open(
+                fileobj=self.archive, mode=f"w|{self.compression}"
+            )
+        self._mtime = time()
+
+    def write(self, name: str, data: bytes) -> int:
+        member = tarfile.TarInfo(name)
+        member.size = len(data)
+        member.mtime = self._mtime
+        self._tar_file.addfile(member, BytesIO(data))
+        return len(data)
+
+    def close(self) -> None:
+        if self._tar_file is not None:
+            self._tar_file.close()
+            self._tar_file = None
+
+
+class ZipSink(LabelSink):
+    """Streams all label files into a single zip archive."""
+
+    archive: Union[str, BinaryIO]
+    compression: int
+    _zip_file: Optional[zipfile.ZipFile]
+
+    def __init__(
+        self,
+        archive: Union[str, BinaryIO],
+        compression: int = zipfile.ZIP_STORED,
+    ):
+        """Initializes the sink.
+
+        Arguments:
+            archive (Union[str, BinaryIO]): The path to the zip archive or a binary stream, e.g. `sys.stdout.buffer`.
+            compression (int): The zipfile compression method, e.g. `zipfile.ZIP_DEFLATED`.
+        """
+        self.archive = archive
+        self.compression = compression
+        self._zip_file = None
+
+    def open(self) -> None:
+        if isinstance(self.archive, str):
+            _make_parent_dirs(self.archive)
+        self._zip_file = zipfile.ZipFile(
+            self.archive, "w", compression=self.compression
+        )
+
+    def write(self, name: str, data: bytes) -> int:
+        self._zip_file.writestr(name, data)
+        return len(data)
+
+    def close(self) -> None:
+        if self._zip_file is not None:
+            self._zip_file.close()
+            self._zip_file = None
+
+
+class ConcatenatedSink(LabelSink):
+    """Appends all label files to a single KITTI label file and records the
+    byte range of every label file in an index.
+
+    Every line of the index holds the offset, the length and the name of a
+    label file separated by a space, see `read_label_index`.
+    """
+
+    label_file: Union[str, BinaryIO]
+    index_file: Optional[str]
+    _label_stream: Optional[BinaryIO]
+    _index_stream: Optional[TextIO]
+    _offset: int
+
+    def __init__(
+        self,
+        label_file: Union[str, BinaryIO],
+        index_file: Optional[str] = None,
+    ):
+        """Initializes the sink.
+
+        Arguments:
+            label_file (Union[str, BinaryIO]): The path to the concatenated label file or a binary stream, e.g. `sys.stdout.buffer`.
+            index_file (Optional[str]): The path to the index, or None for `<label_file>.index` if the label file is a path and for no index otherwise.
+        """
+        self.label_file = label_file
+        self.index_file = index_file
+        if index_file is None and isinstance(label_file, str):
+            self.index_file = f"{label_file}.index"
+        self._label_stream = None
+        self._index_stream = None
+        self._offset = 0
+
+    def open(self) -> None:
+        if isinstance(self.label_file, str):
+            _make_parent_dirs(self.label_file)
+            self._label_stream = open(self.label_file, "wb")
+        if self.index_file is not None:
+            _make_parent_dirs(self.index_file)
+            self._index_stream = open(self.index_file, "w", encoding="utf-8")
+        self._offset = 0
+
+    def write(self, name: str, data: bytes) -> int:
+        (self._label_stream or self.label_file).write(data)
+        if self._index_stream is not None:
+            self._index_stream.write(f"{self._offset} {len(data)} {name}\n")
+        self._offset += len(data)
+        return len(data)
+
+    def close(self) -> None:
+        for stream in (self._label_stream, self._index_stream):
+            if stream is not None:
+                stream.close()
+        if not isinstance(self.label_file, str):
+            self.label_file.flush()
+        self._label_stream = None
+        self._index_stream = None
+
+
+# The sinks selectable by name, created with their output path
+SINKS: Dict[str, Callable[[Union[str, BinaryIO]], LabelSink]] = {
+    "directory": DirectorySink,
+    "tar": TarSink,
+    "zip": ZipSink,
+    "concatenated": ConcatenatedSink,
+}
+
+
+def create_sink(name: str, output: Union[str, BinaryIO]) -> LabelSink:
+    """Creates a sink by name.
+
+    Arguments:
+        name (str): The name of the sink, one of `SINKS`.
+        output (Union[str, BinaryIO]): The output directory, the output file or a binary stream.
+
+    Returns:
+        LabelSink: The unopened sink
+
+    Raises:
+        ValueError: If the sink is unknown or cannot write to a stream.
+    """
+    if name not in SINKS:
+        raise ValueError(f"{name} is an unknown sink.")
+    if name == "directory" and not isinstance(output, str):
+        raise ValueError("The directory sink cannot write to a stream.")
+
+    return SINKS[name](output)
+
+
+def read_label_index(index_file: str) -> Dict[str, Tuple[int, int]]:
+    """Reads the index of a concatenated label file.
+
+    Arguments:
+        index_file (str): The path to the index.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: The offset and the length in bytes per label file name.
+
+    Raises:
+        ValueError: If a line of the index is malformed.
+    """
+    index: Dict[str, Tuple[int, int]] = {}
+    with open(index_file, encoding="utf-8") as index_stream:
+        for line_number, line in enumerate(index_stream, 1):
+            fields = line.rstrip("\n").split(" ", 2)
+            if len(fields) != 3:
+                raise ValueError(
+                    f"Line {line_number} of the label index is malformed."
+                )
+            index[fields[2]] = (int(fields[0]), int(fields[1]))
+    return index
+
+
+def _make_parent_dirs(file_path: str) -> None:
+    """Creates the missing parent directories of a file.
+
+    Arguments:
+        file_path (str): The file path.
+    """
+    parent = path.dirname(file_path)
+    if parent:
+        makedirs(parent, exist_ok=True)
@@ -0,0 +1,103 @@
+import json
+from dataclasses import dataclass
+from hashlib import blake2b
+from os import path, replace
+from typing import Dict
+
+# Name of the manifest of an incrementally converted output directory
+LABEL_MANIFEST: str = ".kitti_manifest.json"
+
+
+@dataclass
+class WriteReport:
+    """Summarizes the label files written by a KITTI conversion."""
+
+    files_written: int = 0
+    bytes_written: int = 0
+    files_skipped: int = 0
+    files_deleted: int = 0
+
+    def __add__(self, other: "WriteReport") -> "WriteReport":
+        """Combines the reports of two conversions.
+
+        Arguments:
+            other (WriteReport): The report to add.
+
+        Returns:
+            WriteReport: The combined report
+        """
+
+        return WriteReport(
+            self.files_written + other.files_written,
+            self.bytes_written + other.bytes_written,
+            self.files_skipped + other.files_skipped,
+            self.files_deleted + other.files_deleted,
+        )
+
+
+def write_label_file(label_file: str, data: bytes) -> int:
+    """Writes all labels of a frame to a label file with a single buffered
+    write call, replacing any previous content.
+
+    Arguments:
+        label_file (str): The path to the label file.
+        data (bytes): The UTF-8 encoded labels in KITTI format, one per line.
+
+    Returns:
+        int: The number of bytes written
+    """
+    with open(label_file, "wb") as kitti_file:
+        kitti_file.write(data)
+    return len(data)
+
+
+def label_digest(data: bytes) -> str:
+    """Computes the content hash of a label file.
+
+    Arguments:
+        data (bytes): The content of the label file.
+
+    Returns:
+        str: The hexadecimal digest
+    """
+
+    return blake2b(data, digest_size=16).hexdigest()
+
+
+def load_label_manifest(output_dir: str) -> Dict[str, str]:
+    """Loads the content hashes of the label files of an output directory.
+
+    A missing or unreadable manifest is treated as empty, which causes every
+    label file to be rewritten.
+
+    Arguments:
+        output_dir (str): The output directory.
+
+    Returns:
+        Dict[str, str]: The content hash per label file name.
+    """
+    try:
+        with open(
+            path.join(output_dir, LABEL_MANIFEST), encoding="utf-8"
+        ) as manifest_file:
+            digests = json.load(manifest_file)["files"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+    return digests if isinstance(digests, dict) else {}
+
+
+def save_label_manifest(output_dir: str, digests: Dict[str, str]) -> None:
+    """Atomically replaces the manifest of an output directory.
+
+    Arguments:
+        output_dir (str): The output directory.
+        digests (Dict[str, str]): The content hash per label file name.
+    """
+    manifest = path.join(output_dir, LABEL_MANIFEST)
+    with open(f"{manifest}.tmp", "w", encoding="utf-8") as manifest_file:
+        json.dump(
+            {"version": 1, "files": dict(sorted(digests.items()))},
+            manifest_file,
+            indent=0,
+        )
+    replace(f"{manifest}.tmp", manifest)
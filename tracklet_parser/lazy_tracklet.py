@@ -0,0 +1,336 @@
+from array import array
+from typing import AnyStr, Dict, Iterator, Optional, Sequence, Tuple
+
+from tracklet_parser.track import check_occlusion_texts, check_occlusions
+from tracklet_parser.tracklet import BBox, Dimensions, Location
+
+# The fields of a tracklet which can be requested by a projection
+FIELDS: Tuple[str, ...] = (
+    "frame_number",
+    "type",
+    "truncated",
+    "occluded",
+    "alpha",
+    "bbox",
+    "dimensions",
+    "location",
+    "rotation_z",
+)
+# The pose fields of `Track.POSE_FIELDS` making up a tracklet field, the
+# remaining fields are known without decoding
+_POSE_COLUMNS: Dict[str, Tuple[int, ...]] = {
+    "location": (0, 1, 2),
+    "rotation_z": (3,),
+    "occluded": (4,),
+    "truncated": (5,),
+}
+_DEFAULT_BBOX: BBox = BBox()
+_DEFAULT_LOCATION: Location = Location()
+
+
+def check_fields(fields: Sequence[str]) -> Tuple[str, ...]:
+    """Validates a field projection.
+
+    Arguments:
+        fields (Sequence[str]): The requested fields of `FIELDS`.
+
+    Returns:
+        Tuple[str, ...]: The requested fields
+
+    Raises:
+        ValueError: If a field is unknown.
+    """
+    unknown = set(fields) - set(FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    return tuple(fields)
+
+
+class LazyTrack:
+    """An annotated track whose fields are decoded on first access.
+
+    The dimensions and pose fields are kept as the raw text of the XML
+    file, joined per field, until a tracklet of the track reads them. Only
+    the requested fields are converted to floats and validated while
+    parsing and no Tracklet objects are created. This only saves parse
+    time with the fast backend, which hands over the raw text without
+    building elements. With ElementTree, building the elements dominates,
+    so a projection parses about as fast as the full Tracklet objects.
+    """
+
+    __slots__ = ("_type", "_first_frame", "_pose_count", "_raw", "_decoded")
+
+    _type: str
+    _first_frame: int
+    _pose_count: int
+    _raw: Dict[str, AnyStr]
+    _decoded: Dict[str, array]
+
+    def __init__(
+        self,
+        object_type: str,
+        first_frame: int,
+        dimensions: Sequence[AnyStr],
+        poses: Sequence[Sequence[AnyStr]],
+        fields: Sequence[str] = (),
+    ):
+        """Creates a track from the raw text of its fields.
+
+        Arguments:
+            object_type (str): The object type.
+            first_frame (int): The frame number of the first pose.
+            dimensions (Sequence[AnyStr]): The raw height, width and length.
+            poses (Sequence[Sequence[AnyStr]]): The raw values of `Track.POSE_FIELDS` of every pose.
+            fields (Sequence[str]): The fields to decode right away.
+
+        Raises:
+            ValueError: If a requested field is malformed, a truncation state is out of range or an occlusion state is no integer or out of range.
+        """
+        self._type = object_type
+        self._first_frame = first_frame
+        self._pose_count = len(poses)
+        separator = " " if isinstance(dimensions[0], str) else b" "
+        self._raw = {"dimensions": separator.join(dimensions)}
+        if poses:
+            columns = list(zip(*poses))
+            for field, indices in _POSE_COLUMNS.items():
+                self._raw[field] = separator.join(
+                    text
+                    for values in zip(*(columns[index] for index in indices))
+                    for text in values
+                )
+        self._decoded = {}
+        for field in fields:
+            if field in self._raw:
+                self.column(field)
+
+    @property
+    def type(self) -> str:
+        """Get the object type.
+
+        Returns:
+            str: The object type
+        """
+
+        return self._type
+
+    @property
+    def first_frame(self) -> int:
+        """Get the frame number of the first pose of the track.
+
+        Returns:
+            int: The first frame number
+        """
+
+        return self._first_frame
+
+    @property
+    def pose_count(self) -> int:
+        """Get the number of poses of the track.
+
+        Returns:
+            int: The number of poses
+        """
+
+        return self._pose_count
+
+    def column(self, field: str) -> Optional[array]:
+        """Decodes a field of all poses of the track, once.
+
+        Arguments:
+            field (str): The field, "dimensions" or a pose field.
+
+        Returns:
+            Optional[array]: The values of the field row by row, or None if the track has no poses.
+
+        Raises:
+            ValueError: If the field is malformed, a truncation state is out of range or an occlusion state is no integer or out of range.
+        """
+        values = self._decoded.get(field)
+        if values is not None or field not in self._raw:
+            return values
+
+        width = len(_POSE_COLUMNS.get(field, (0, 1, 2)))
+        count = 1 if field == "dimensions" else self._pose_count
+        if field == "occluded":
+            check_occlusion_texts(self._raw[field].split())
+        try:
+            values = array("d", map(float, self._raw[field].split()))
+        except ValueError as error:
+            raise ValueError(f"The {field} field is malformed.") from error
+        if len(values) != width * count:
+            raise ValueError(f"The {field} field is malformed.")
+        if field == "occluded":
+            check_occlusions(values)
+        elif field == "truncated":
+            for value in values:
+                if not 0 <= value <= 1:
+                    raise ValueError(
+                        f"{value} is an unknown truncation representative."
+                    )
+        self._decoded[field] = values
+        return values
+
+    def __len__(self) -> int:
+        """Get the number of frames covered by the track. A track without
+        poses still covers its first frame.
+
+        Returns:
+            int: The number of frames
+        """
+
+        return max(self._pose_count, 1)
+
+    def __getitem__(self, index: int) -> "LazyTracklet":
+        """Create the lazy tracklet of the `index`-th frame of the track.
+
+        Arguments:
+            index (int): The pose index
+
+        Returns:
+            LazyTracklet: The tracklet of the frame
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if not 0 <= index < len(self):
+            raise IndexError(f"Pose index {index} is out of range.")
+
+        return LazyTracklet(self, index)
+
+    def __iter__(self) -> Iterator["LazyTracklet"]:
+        """Iterate over the lazy tracklets of all frames covered by the track.
+
+        Returns:
+            Iterator[LazyTracklet]: An iterator over the per-frame tracklets
+        """
+
+        return (LazyTracklet(self, index) for index in range(len(self)))
+
+
+class LazyTracklet:
+    """A read-only tracklet of a LazyTrack.
+
+    The tracklet mirrors the getters of Tracklet and only holds its track
+    and its pose index. Fields which were not requested while parsing are
+    decoded for the whole track on first access, so a malformed or out of
+    range value raises a ValueError only then.
+    """
+
+    __slots__ = ("_track", "_index")
+
+    _track: LazyTrack
+    _index: int
+
+    def __init__(self, track: LazyTrack, index: int):
+        self._track = track
+        self._index = index
+
+    @property
+    def frame_number(self) -> int:
+        """Get the frame number.
+
+        Returns:
+            int: The frame number
+        """
+
+        return self._track.first_frame + self._index
+
+    @property
+    def type(self) -> str:
+        """Get the object type.
+
+        Returns:
+            str: The object type
+        """
+
+        return self._track.type
+
+    @property
+    def truncated(self) -> float:
+        """Get the truncation state.
+
+        Returns:
+            float: The truncation state
+        """
+
+        return self._value("truncated")
+
+    @property
+    def occluded(self) -> int:
+        """Get the occlusion state.
+
+        Returns:
+            int: The occlusion state
+        """
+
+        return int(self._value("occluded"))
+
+    @property
+    def alpha(self) -> float:
+        """Get the observation angle, which is not part of tracklet XML
+        files.
+
+        Returns:
+            float: The observation angle
+        """
+
+        return 0.0
+
+    @property
+    def bbox(self) -> BBox:
+        """Get the 2D bounding box, which is not part of tracklet XML files.
+
+        Returns:
+            BBox: The 2D bounding box
+        """
+
+        return _DEFAULT_BBOX
+
+    @property
+    def dimensions(self) -> Dimensions:
+        """Get the 3D object dimensions.
+
+        Returns:
+            Dimensions: The 3D object dimensions
+        """
+
+        return Dimensions(*self._track.column("dimensions"))
+
+    @property
+    def location(self) -> Location:
+        """Get the 3D object location in LiDAR coordinates.
+
+        Returns:
+            Location: The 3D object location
+        """
+        values = self._track.column("location")
+        if values is None:
+            return _DEFAULT_LOCATION
+
+        offset = 3 * self._index
+        return Location(*values[offset : offset + 3])
+
+    @property
+    def rotation_z(self) -> float:
+        """Get the rotation angle around the LiDAR Z-axis.
+
+        Returns:
+            float: The rotation angle
+        """
+
+        return self._value("rotation_z")
+
+    def _value(self, field: str) -> float:
+        """Get a scalar pose field of the tracklet.
+
+        Arguments:
+            field (str): The pose field.
+
+        Returns:
+            float: The value, 0.0 for a track without poses
+        """
+        values = self._track.column(field)
+
+        return 0.0 if values is None else values[self._index]
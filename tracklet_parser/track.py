@@ -0,0 +1,257 @@
+from array import array
+from typing import AnyStr, Iterable, Iterator, Tuple
+
+from tracklet_parser.tracklet import Dimensions, Location, Tracklet
+
+
+def check_occlusions(occlusions: Iterable[float]):
+    """Validates occlusion states, which are stored as floats but have to
+    be integers from 0 to 3.
+
+    Arguments:
+        occlusions (Iterable[float]): The occlusion states
+
+    Raises:
+        ValueError: If an occlusion state is no integer or out of range.
+    """
+    for occlusion in occlusions:
+        if not (0 <= occlusion <= 3 and float(occlusion).is_integer()):
+            if float(occlusion).is_integer():
+                occlusion = int(occlusion)
+            raise ValueError(
+                f"{occlusion} is an unknown occlusion representative."
+            )
+
+
+def check_occlusion_texts(texts: Iterable[AnyStr]):
+    """Validates the raw text of occlusion states, which has to be an
+    integer literal such as "1", and not e.g. "1.0" or "1e0".
+
+    Arguments:
+        texts (Iterable[AnyStr]): The raw occlusion states
+
+    Raises:
+        ValueError: If an occlusion state is no integer literal.
+    """
+    for text in texts:
+        try:
+            int(text)
+        except ValueError:
+            if isinstance(text, bytes):
+                text = text.decode(errors="replace")
+            raise ValueError(
+                f"{text.strip()} is an unknown occlusion representative."
+            ) from None
+
+
+class Track:
+    """Represents an annotated object followed over consecutive point cloud
+    frames.
+
+    The poses of a track are kept in a compact array of doubles and are only
+    turned into per-frame Tracklet objects on demand, so long tracks with tens
+    of thousands of poses remain cheap to hold in memory.
+    """
+
+    POSE_FIELDS: Tuple[str, ...] = (
+        "tx",
+        "ty",
+        "tz",
+        "rz",
+        "occlusion",
+        "truncation",
+    )
+
+    _type: str
+    _first_frame: int
+    _dimensions: Dimensions
+    _poses: array
+
+    def __init__(self):
+        self._type = ""
+        self._first_frame = -1
+        self._dimensions = Dimensions()
+        self._poses = array("d")
+
+    @property
+    def type(self) -> str:
+        """Get the object type. This can be 'Pedestrian', 'Cyclist',..
+
+        Returns:
+            str: The object type
+        """
+
+        return self._type
+
+    @property
+    def first_frame(self) -> int:
+        """Get the frame number of the first pose of the track.
+
+        Returns:
+            int: The first frame number
+        """
+
+        return self._first_frame
+
+    @property
+    def dimensions(self) -> Dimensions:
+        """The 3D object dimensions height, width and length (in meters).
+
+        Returns:
+            Dimensions: The 3D object dimensions
+        """
+
+        return self._dimensions
+
+    @property
+    def pose_count(self) -> int:
+        """Get the number of poses of the track.
+
+        Returns:
+            int: The number of poses
+        """
+
+        return len(self._poses) // len(Track.POSE_FIELDS)
+
+    @property
+    def poses(self) -> memoryview:
+        """Get a read-only view of the pose array. The poses are stored row by
+        row with the values of `Track.POSE_FIELDS`.
+
+        Returns:
+            memoryview: The flat pose array
+        """
+
+        return memoryview(self._poses).toreadonly()
+
+    @type.setter
+    def type(self, object_type: str):
+        """Set the object type.
+
+        Arguments:
+            object_type (str): The object type
+        """
+
+        self._type = object_type
+
+    @first_frame.setter
+    def first_frame(self, first_frame: int):
+        """Set the frame number of the first pose.
+
+        Arguments:
+            first_frame (int): The first frame number
+        """
+
+        self._first_frame = first_frame
+
+    def put_dimension(self, key: str, value: float):
+        """Set a new dimension value for the 3D object.
+
+        Arguments:
+            key (str): The dimension direction (height, width, length)
+            value (str): The dimension value
+
+        Raises:
+            ValueError: If the dimension direction is unknown.
+        """
+
+        self._dimensions = self._dimensions._replace(**{key: value})
+
+    def add_pose(
+        self,
+        tx: float = 0.0,
+        ty: float = 0.0,
+        tz: float = 0.0,
+        rz: float = 0.0,
+        occlusion: int = 0,
+        truncation: float = 0.0,
+    ):
+        """Append the pose of the next frame to the track.
+
+        Arguments:
+            tx (float): The x coordinate in LiDAR coordinates
+            ty (float): The y coordinate in LiDAR coordinates
+            tz (float): The z coordinate in LiDAR coordinates
+            rz (float): The rotation angle
+            occlusion (int): The occlusion state
+            truncation (float): The truncation state
+
+        Raises:
+            ValueError: If the occlusion state is no integer or out of range.
+        """
+        check_occlusions((occlusion,))
+
+        self._poses.extend((tx, ty, tz, rz, occlusion, truncation))
+
+    def add_poses(self, poses: memoryview):
+        """Append the poses of several frames to the track in bulk.
+
+        Arguments:
+            poses (memoryview): A C-contiguous buffer of doubles holding the values of `Track.POSE_FIELDS` row by row, e.g. an `array.array("d")` or a NumPy array of shape (n, 6).
+
+        Raises:
+            ValueError: If the buffer does not hold complete rows of doubles or an occlusion state is no integer or out of range.
+        """
+        poses = memoryview(poses)
+        if poses.format != "d" or poses.nbytes % (
+            poses.itemsize * len(Track.POSE_FIELDS)
+        ):
+            raise ValueError("Poses must be complete rows of doubles.")
+        check_occlusions(
+            poses.cast("B").cast("d")[
+                Track.POSE_FIELDS.index("occlusion") :: len(Track.POSE_FIELDS)
+            ]
+        )
+
+        self._poses.frombytes(poses.cast("B"))
+
+    def __len__(self) -> int:
+        """Get the number of frames covered by the track. A track without
+        poses still covers its first frame.
+
+        Returns:
+            int: The number of frames
+        """
+
+        return max(self.pose_count, 1)
+
+    def __getitem__(self, index: int) -> Tracklet:
+        """Create the tracklet of the `index`-th frame of the track, i.e. the
+        frame `first_frame + index`.
+
+        Arguments:
+            index (int): The pose index
+
+        Returns:
+            Tracklet: The tracklet of the frame
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if not 0 <= index < len(self):
+            raise IndexError(f"Pose index {index} is out of range.")
+
+        tracklet = Tracklet()
+        tracklet.type = self._type
+        tracklet.frame_number = self._first_frame + index
+        tracklet.dimensions = self._dimensions
+
+        if self._poses:
+            offset = index * len(Track.POSE_FIELDS)
+            tx, ty, tz, rz, occlusion, truncation = self._poses[
+                offset : offset + len(Track.POSE_FIELDS)
+            ]
+            tracklet.location = Location(tx, ty, tz)
+            tracklet.rotation_z = rz
+            tracklet.occluded = int(occlusion)
+            tracklet.truncated = truncation
+        return tracklet
+
+    def __iter__(self) -> Iterator[Tracklet]:
+        """Iterate over the tracklets of all frames covered by the track.
+
+        Returns:
+            Iterator[Tracklet]: An iterator over the per-frame tracklets
+        """
+
+        return (self[index] for index in range(len(self)))
@@ -0,0 +1,293 @@
+import re
+from array import array
+from itertools import chain
+from typing import (
+    AnyStr,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+from xml.etree.ElementTree import Element, fromstring
+
+from tracklet_parser.track import Track, check_occlusion_texts
+
+_ENCODING = re.compile(rb"^<\?xml[^>]*encoding=[\"']([\w.-]+)")
+_TRACKLETS_START = re.compile(rb"<tracklets[\s/>]")
+_TRACKLETS_END: bytes = b"</tracklets>"
+# Every track of the boost serialization layout starts with its object type,
+# the first one with the class attributes of boost serialization
+_TRACK_START = re.compile(rb"<item(?:\s[^>]*)?>\s*<objectType[\s>]")
+_ITEM_START = re.compile(rb"<item[\s/>]")
+_ITEM_END: bytes = b"</item>"
+_COMMENT = re.compile(rb"<!--.*?-->", re.DOTALL)
+_HEADER_FIELD = re.compile(
+    rb"<(objectType|h|w|l|first_frame)(?:\s[^>]*)?>([^<]*)</"
+)
+# A pose in the field order of the KITTI devkit, which CVAT follows
+_KITTI_POSE = re.compile(
+    rb"<tx>([^<]*)</tx>\s*<ty>([^<]*)</ty>\s*<tz>([^<]*)</tz>\s*"
+    rb"<rx>[^<]*</rx>\s*<ry>[^<]*</ry>\s*<rz>([^<]*)</rz>\s*"
+    rb"<state>[^<]*</state>\s*<occlusion>([^<]*)</occlusion>\s*"
+    rb"<occlusion_kf>[^<]*</occlusion_kf>\s*"
+    rb"<truncation>([^<]*)</truncation>"
+)
+_POSE_FIELDS: List["re.Pattern[bytes]"] = [
+    re.compile(rb"<%s(?:\s[^>]*)?>([^<]*)</" % field.encode())
+    for field in Track.POSE_FIELDS
+]
+_DIMENSIONS = {b"h": 0, b"w": 1, b"l": 2}
+_OCCLUSION: int = Track.POSE_FIELDS.index("occlusion")
+# Entity references, CDATA sections and processing instructions are left
+# to the XML parser
+_UNSUPPORTED_MARKUP: Tuple[bytes, ...] = (b"&", b"<!", b"<?")
+
+# The type of the scanned tracks
+_T = TypeVar("_T")
+
+
+def build_track(
+    object_type: str,
+    first_frame: int,
+    dimensions: Sequence[AnyStr],
+    poses: Sequence[Sequence[AnyStr]],
+) -> Track:
+    """Builds a Track from the raw fields of a scanned or parsed track.
+
+    Arguments:
+        object_type (str): The object type.
+        first_frame (int): The frame number of the first pose.
+        dimensions (Sequence[AnyStr]): The raw height, width and length.
+        poses (Sequence[Sequence[AnyStr]]): The raw values of `Track.POSE_FIELDS` of every pose.
+
+    Returns:
+        Track: The Track object.
+
+    Raises:
+        ValueError: If a field is malformed or an occlusion state is no integer or out of range.
+    """
+    check_occlusion_texts(pose[_OCCLUSION] for pose in poses)
+    track = Track()
+    track.type = object_type
+    track.first_frame = first_frame
+    for key, text in zip(("height", "width", "length"), dimensions):
+        track.put_dimension(key, float(text))
+    track.add_poses(
+        memoryview(array("d", map(float, chain.from_iterable(poses))))
+    )
+    return track
+
+
+def scan_tracks(
+    document: bytes,
+    parse_track: Callable[[Element], _T],
+    build: Callable[
+        [str, int, Sequence[bytes], Sequence[Sequence[bytes]]], _T
+    ] = build_track,
+) -> Optional[Iterator[_T]]:
+    """Scans the tracks of a tracklet XML document without building an
+    element tree.
+
+    The scanner is specialized to the boost serialization layout of CVAT
+    exports: every track is an `<item>` of the "tracklets" element starting
+    with its `<objectType>`, followed by its dimensions, its first frame
+    and its poses. All poses of a track are extracted by a single regular
+    expression, or by one per field if their fields deviate from the order
+    of the KITTI devkit, and converted in bulk. A track that deviates from
+    the layout, e.g. with a pose lacking a field, is parsed by
+    `parse_track` instead. The raw fields of all other tracks are passed to
+    `build`, which converts them into Track objects by default.
+
+    The whole document is validated before the first track is scanned. If
+    it cannot be scanned, e.g. because it is not UTF-8 encoded, contains
+    entity references or CDATA sections or lacks the "tracklets" element,
+    None is returned and the document has to be parsed as XML.
+
+    Arguments:
+        document (bytes): The tracklet XML document or a memory map of it.
+        parse_track (Callable[[Element], _T]): Parses a track element which deviates from the layout.
+        build (Callable[[str, int, Sequence[bytes], Sequence[Sequence[bytes]]], _T]): Builds a track from its object type, its first frame and the raw text of its dimensions and poses, see `build_track`.
+
+    Returns:
+        Optional[Iterator[_T]]: An iterator over the tracks in document order, or None if the document cannot be scanned.
+    """
+    located = _locate_tracks(document, strip_comments=True)
+    if located is None:
+        return None
+
+    document, tracks = located
+    return (
+        _scan_track(document, *track, parse_track, build) for track in tracks
+    )
+
+
+def find_track_ranges(document: bytes) -> Optional[List[Tuple[int, int]]]:
+    """Finds the byte ranges of all tracks of a tracklet XML document
+    without parsing them, e.g. to split the document into shards which
+    are parsed independently.
+
+    The document is validated like in `scan_tracks`. Since the ranges
+    refer to the unmodified document, documents with comments between the
+    tracks are not supported either.
+
+    Arguments:
+        document (bytes): The tracklet XML document or a memory map of it.
+
+    Returns:
+        Optional[List[Tuple[int, int]]]: The start and the end of every track item in document order, or None if the tracks cannot be located.
+    """
+    located = _locate_tracks(document, strip_comments=False)
+    if located is None:
+        return None
+
+    return [(start, end) for start, end, _, _ in located[1]]
+
+
+def _locate_tracks(
+    document: bytes, strip_comments: bool
+) -> Optional[Tuple[bytes, List[Tuple[int, int, int, int]]]]:
+    """Validates a tracklet XML document and locates all of its tracks.
+
+    Arguments:
+        document (bytes): The tracklet XML document or a memory map of it.
+        strip_comments (bool): Whether to strip comments from a copy of the tracklets element, otherwise documents with comments are not supported.
+
+    Returns:
+        Optional[Tuple[bytes, List[Tuple[int, int, int, int]]]]: The document the ranges refer to and the start and the end of every track and of its poses, or None if the document cannot be scanned.
+    """
+    encoding = _ENCODING.match(document)
+    if encoding and encoding.group(1).lower() not in (b"utf-8", b"utf8"):
+        return None
+    tracklets = _TRACKLETS_START.search(document)
+    if tracklets is None:
+        return None
+    start = document.find(b">", tracklets.start()) + 1
+    if document[start - 2 : start] == b"/>":
+        return document, []
+    stop = document.find(_TRACKLETS_END, start)
+    if stop < 0:
+        return None
+
+    # The document is only copied if comments have to be stripped
+    if document.find(b"<!--", start, stop) >= 0:
+        if not strip_comments:
+            return None
+        document = _COMMENT.sub(b"", document[start:stop])
+        start, stop = 0, len(document)
+    if any(
+        document.find(markup, start, stop) >= 0
+        for markup in _UNSUPPORTED_MARKUP
+    ):
+        return None
+
+    starts = [
+        match.start() for match in _TRACK_START.finditer(document, start, stop)
+    ]
+    # Items in front of the first track would not be detected as tracks
+    if _ITEM_START.search(document, start, starts[0] if starts else stop):
+        return None
+    starts.append(stop)
+
+    tracks: List[Tuple[int, int, int, int]] = []
+    for track_start, next_start in zip(starts, starts[1:]):
+        track = _locate_track(document, track_start, next_start)
+        if track is None:
+            return None
+        tracks.append(track)
+    return document, tracks
+
+
+def _locate_track(
+    document: bytes, start: int, stop: int
+) -> Optional[Tuple[int, int, int, int]]:
+    """Validates that a range of the tracklets element holds a single track
+    and locates its poses.
+
+    Arguments:
+        document (bytes): The tracklet XML document.
+        start (int): The start of the track item.
+        stop (int): The start of the next track item.
+
+    Returns:
+        Optional[Tuple[int, int, int, int]]: The start and the end of the track and of its poses, which are empty for a track without poses, or None if the range does not hold a single track.
+    """
+    end = document.rfind(_ITEM_END, start, stop)
+    if end < 0 or document[end + len(_ITEM_END) : stop].strip():
+        return None
+
+    poses_start = document.find(b"<poses", start, end)
+    if poses_start < 0:
+        poses_start = poses_end = end
+    else:
+        poses_end = document.find(b"</poses>", poses_start, end)
+        if poses_end < 0:
+            return None
+
+    # Only the track item itself may open before the poses and nothing but
+    # the end of the track item may follow them
+    if (
+        len(_ITEM_START.findall(document, start, poses_start)) != 1
+        or _ITEM_START.search(document, poses_end, end)
+        or document.find(b"<poses", poses_end, end) >= 0
+    ):
+        return None
+    return start, end + len(_ITEM_END), poses_start, poses_end
+
+
+def _scan_track(
+    document: bytes,
+    start: int,
+    end: int,
+    poses_start: int,
+    poses_end: int,
+    parse_track: Callable[[Element], _T],
+    build: Callable[
+        [str, int, Sequence[bytes], Sequence[Sequence[bytes]]], _T
+    ],
+) -> _T:
+    """Scans a single track.
+
+    Arguments:
+        document (bytes): The tracklet XML document.
+        start (int): The start of the track item.
+        end (int): The end of the track item.
+        poses_start (int): The start of the poses.
+        poses_end (int): The end of the poses.
+        parse_track (Callable[[Element], _T]): Parses the track element if it deviates from the layout.
+        build (Callable[[str, int, Sequence[bytes], Sequence[Sequence[bytes]]], _T]): Builds the track from its raw fields.
+
+    Returns:
+        _T: The scanned track.
+    """
+    poses = document[poses_start:poses_end]
+    pose_count = len(_ITEM_START.findall(poses))
+    rows = _KITTI_POSE.findall(poses)
+    if len(rows) != pose_count:
+        columns = [pattern.findall(poses) for pattern in _POSE_FIELDS]
+        rows = (
+            list(zip(*columns))
+            if all(len(column) == pose_count for column in columns)
+            else None
+        )
+    # Header fields following the poses are overwritten in document order
+    if (
+        rows is None
+        or poses.count(_ITEM_END) != pose_count
+        or _HEADER_FIELD.search(document, poses_end, end)
+    ):
+        return parse_track(fromstring(document[start:end]))
+
+    object_type = ""
+    first_frame = -1
+    dimensions = [b"0", b"0", b"0"]
+    for tag, text in _HEADER_FIELD.findall(document, start, poses_start):
+        if tag == b"objectType":
+            object_type = text.decode("utf-8") if text else None
+        elif tag == b"first_frame":
+            first_frame = int(text)
+        else:
+            dimensions[_DIMENSIONS[tag]] = text
+    return build(object_type, first_frame, dimensions, rows)
@@ -1,30 +1,96 @@
-from copy import deepcopy
-from typing import Dict
+from collections import namedtuple
+from typing import Any, Iterable, Union
+
+
+class _FieldAccess:
+    """Allows reading the fields of a named tuple by name, e.g.
+    `bbox["left"]`, in addition to attribute and positional access."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key: Union[str, int, slice]) -> Any:
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return super().__getitem__(key)
+
+
+class BBox(
+    _FieldAccess,
+    namedtuple(
+        "BBox", ["left", "top", "right", "bottom"], defaults=(0.0,) * 4
+    ),
+):
+    """The left, top, right and bottom pixel coordinates of a 2D bounding
+    box."""
+
+    __slots__ = ()
+
+
+class Dimensions(
+    _FieldAccess,
+    namedtuple(
+        "Dimensions", ["height", "width", "length"], defaults=(0.0,) * 3
+    ),
+):
+    """The height, width and length of a 3D object (in meters)."""
+
+    __slots__ = ()
+
+
+class Location(
+    _FieldAccess,
+    namedtuple("Location", ["x", "y", "z"], defaults=(0.0,) * 3),
+):
+    """The x, y and z coordinates of a 3D object (in meters)."""
+
+    __slots__ = ()
 
 
 class Tracklet:
     """Represents an annotated tracklet object representing 3D bounding boxes
-    of a point cloud frame."""
+    of a point cloud frame.
+
+    The 2D bounding box, the dimensions and the location are immutable named
+    tuples, so they can be handed out without copying.
+    """
+
+    __slots__ = (
+        "_frame_number",
+        "_type",
+        "_truncated",
+        "_occluded",
+        "_alpha",
+        "_bbox",
+        "_dimensions",
+        "_location",
+        "_rotation_z",
+    )
 
     _frame_number: int
     _type: str
     _truncated: float
     _occluded: int
     _alpha: float
-    _bbox: Dict[str, float]
-    _dimensions: Dict[str, float]
-    _location: Dict[str, float]
+    _bbox: BBox
+    _dimensions: Dimensions
+    _location: Location
     _rotation_z: float
 
+    _DEFAULT_BBOX: BBox = BBox()
+    _DEFAULT_DIMENSIONS: Dimensions = Dimensions()
+    _DEFAULT_LOCATION: Location = Location()
+
     def __init__(self):
         self._frame_number = -1
         self._type = ""
         self._truncated = 0.0
         self._occluded = 0
         self._alpha = 0.0
-        self._bbox = {"left": 0.0, "top": 0.0, "right": 0.0, "bottom": 0.0}
-        self._dimensions = {"height": 0.0, "width": 0.0, "length": 0.0}
-        self._location = {"x": 0.0, "y": 0.0, "z": 0.0}
+        self._bbox = Tracklet._DEFAULT_BBOX
+        self._dimensions = Tracklet._DEFAULT_DIMENSIONS
+        self._location = Tracklet._DEFAULT_LOCATION
         self._rotation_z = 0.0
 
     @property
@@ -87,44 +153,46 @@ class Tracklet:
         return self._alpha
 
     @property
-    def bbox(self) -> Dict[str, float]:
-        """Get the 2D bounding box of the object in the image and contains
-        left.
-
-        , top, right, bottom pixel coordinates.
+    def bbox(self) -> BBox:
+        """Get the 2D bounding box of the object in the image. It contains
+        the left, top, right and bottom pixel coordinates.
 
         Returns:
-            Dict[str, float]: The 2D bounding box
+            BBox: The 2D bounding box
         """
 
-        return deepcopy(self._bbox)
+        return self._bbox
 
     @property
-    def dimensions(self) -> Dict[str, float]:
+    def dimensions(self) -> Dimensions:
         """The 3D object dimensions height, width and length (in meters).
 
         Returns:
-            Dict[str, float]: The 3D object dimensions
+            Dimensions: The 3D object dimensions
         """
 
-        return deepcopy(self._dimensions)
+        return self._dimensions
 
     @property
-    def location(self) -> Dict[str, float]:
+    def location(self) -> Location:
         """The 3D object location x, y and z in LiDAR coordinates (in meters).
+        After `Calibration.transform`, the bottom center of the object in
+        rectified camera coordinates as in KITTI object labels.
 
         Returns:
-            Dict[str, float]: The 3D object location
+            Location: The 3D object location
         """
 
-        return deepcopy(self._location)
+        return self._location
 
     @property
     def rotation_z(self) -> float:
         """The rotation around Y-axis in camera coordinates ranging from [-PI,
         PI].
 
-        Note: Keep in mind that this is in camera coordinates!
+        Note: Keep in mind that this is in camera coordinates! Tracklets
+        parsed from CVAT hold the yaw around the LiDAR Z-axis until they are
+        converted by `Calibration.transform`.
 
         Returns:
             float: The rotation angle around Y-axis
@@ -190,15 +258,48 @@ class Tracklet:
 
         self._alpha = alpha
 
+    @bbox.setter
+    def bbox(self, bbox: Iterable[float]):
+        """Set the 2D bounding box.
+
+        Arguments:
+            bbox (Iterable[float]): The left, top, right and bottom pixel coordinates
+        """
+
+        self._bbox = BBox(*bbox)
+
+    @dimensions.setter
+    def dimensions(self, dimensions: Iterable[float]):
+        """Set the 3D object dimensions.
+
+        Arguments:
+            dimensions (Iterable[float]): The height, width and length
+        """
+
+        self._dimensions = Dimensions(*dimensions)
+
+    @location.setter
+    def location(self, location: Iterable[float]):
+        """Set the 3D object location.
+
+        Arguments:
+            location (Iterable[float]): The x, y and z coordinates
+        """
+
+        self._location = Location(*location)
+
     def put_bbox(self, key: str, value: float):
         """Set a new pixel coordinate for the 2D bounding box.
 
         Arguments:
             key (str): The 2D bounding orientation (left, top, right, bottom)
             value (str): The pixel coordinate
+
+        Raises:
+            ValueError: If the orientation is unknown.
         """
 
-        self._bbox[key] = value
+        self._bbox = self._bbox._replace(**{key: value})
 
     def put_dimension(self, key: str, value: float):
         """Set a new dimension value for the 3D object.
@@ -206,9 +307,12 @@ class Tracklet:
         Arguments:
             key (str): The dimension direction (height, width, length)
             value (str): The dimension value
+
+        Raises:
+            ValueError: If the dimension direction is unknown.
         """
 
-        self._dimensions[key] = value
+        self._dimensions = self._dimensions._replace(**{key: value})
 
     def put_location(self, key: str, value: float):
         """Set a new coordinate for the 3D object.
@@ -216,9 +320,12 @@ class Tracklet:
         Arguments:
             key (str): The axis (x, y, z)
             value (str): The coordinate
+
+        Raises:
+            ValueError: If the axis is unknown.
         """
 
-        self._location[key] = value
+        self._location = self._location._replace(**{key: value})
 
     @rotation_z.setter
     def rotation_z(self, rotation_z: float):
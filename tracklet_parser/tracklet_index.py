@@ -0,0 +1,204 @@
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
+
+from tracklet_parser.tracklet import Tracklet
+from tracklet_parser.tracklet_table import TrackletTable
+
+
+class TrackletIndex:
+    """A frame index over parsed tracklets for random access lookups.
+
+    The tracklets are kept in a contiguous table sorted by frame number.
+    Every frame maps to the offsets of its rows, so all boxes of a frame or
+    of a range of frames are a slice of the table.
+
+    ## Example:
+
+    ```python
+    index = TrackletIndex(TrackletParser.parse_tracklet_table("path/to/tracklet_labels.xml"))
+    index.save("path/to/tracklet_index.npz")
+
+    index = TrackletIndex.load("path/to/tracklet_index.npz")
+    boxes = index.frame(42)
+    cars = index.range(1000, 2000, "Car")
+    ```
+    """
+
+    _table: TrackletTable
+    _frames: np.ndarray
+    _offsets: np.ndarray
+    _positions: Dict[int, int]
+
+    def __init__(self, tracklets: Union[TrackletTable, Iterable[Tracklet]]):
+        """Builds the index.
+
+        Arguments:
+            tracklets (Union[TrackletTable, Iterable[Tracklet]]): The table of tracklets or the tracklets to index.
+        """
+        if not isinstance(tracklets, TrackletTable):
+            tracklets = TrackletTable.from_tracklets(tracklets)
+
+        table = tracklets.sort()
+        frames, starts = np.unique(table.frame_number, return_index=True)
+        self._restore(table, frames, np.append(starts, len(table)))
+
+    @property
+    def table(self) -> TrackletTable:
+        """Get the table of all tracklets sorted by frame number.
+
+        Returns:
+            TrackletTable: The sorted table
+        """
+
+        return self._table
+
+    @property
+    def frames(self) -> np.ndarray:
+        """Get the sorted frame numbers containing at least one box.
+
+        Returns:
+            np.ndarray: The frame numbers
+        """
+
+        return self._frames
+
+    def frame(
+        self, frame_number: int, object_type: Optional[str] = None
+    ) -> TrackletTable:
+        """Looks up all boxes of a frame in constant time.
+
+        Arguments:
+            frame_number (int): The frame number.
+            object_type (Optional[str]): The object type to select, or None for all types.
+
+        Returns:
+            TrackletTable: The boxes of the frame, which is empty for unknown frames
+        """
+        position = self._positions.get(frame_number)
+        if position is None:
+            return self._table[0:0]
+
+        return self._select(
+            self._offsets[position], self._offsets[position + 1], object_type
+        )
+
+    def range(
+        self, start: int, stop: int, object_type: Optional[str] = None
+    ) -> TrackletTable:
+        """Looks up all boxes of the frames `start <= frame_number < stop`.
+
+        Arguments:
+            start (int): The first frame number.
+            stop (int): The frame number after the last frame.
+            object_type (Optional[str]): The object type to select, or None for all types.
+
+        Returns:
+            TrackletTable: The boxes of the frames in ascending frame order
+        """
+        first, last = np.searchsorted(self._frames, [start, stop])
+        return self._select(
+            self._offsets[first], self._offsets[last], object_type
+        )
+
+    def save(self, index_file: str) -> None:
+        """Serializes the index to an uncompressed NumPy archive, including
+        the frame offsets, so loading it does not sort the table again.
+
+        Arguments:
+            index_file (str): The path to the archive, which is used as is even without the `.npz` suffix.
+        """
+        # NumPy appends the suffix to paths, but not to open files
+        with open(index_file, "wb") as archive_file:
+            np.savez(
+                archive_file,
+                types=np.asarray(self._table.types, dtype=np.str_),
+                index_frames=self._frames,
+                index_offsets=self._offsets,
+                **{
+                    name: getattr(self._table, name)
+                    for name in TrackletTable.COLUMNS
+                },
+            )
+
+    @classmethod
+    def load(cls, index_file: str) -> "TrackletIndex":
+        """Deserializes an index written by `save` without rebuilding it.
+
+        Arguments:
+            index_file (str): The path to the archive.
+
+        Returns:
+            TrackletIndex: The index
+        """
+        with np.load(index_file, allow_pickle=False) as archive:
+            table = TrackletTable(
+                archive["types"].tolist(),
+                **{name: archive[name] for name in TrackletTable.COLUMNS},
+            )
+            # Archives of earlier versions lack the frame offsets
+            if "index_offsets" not in archive.files:
+                return cls(table)
+
+            index = cls.__new__(cls)
+            index._restore(
+                table, archive["index_frames"], archive["index_offsets"]
+            )
+        return index
+
+    def __len__(self) -> int:
+        """Get the number of indexed boxes.
+
+        Returns:
+            int: The number of boxes
+        """
+
+        return len(self._table)
+
+    def __contains__(self, frame_number: int) -> bool:
+        """Check whether a frame contains at least one box.
+
+        Arguments:
+            frame_number (int): The frame number.
+
+        Returns:
+            bool: Whether the frame contains boxes
+        """
+
+        return frame_number in self._positions
+
+    def _restore(
+        self, table: TrackletTable, frames: np.ndarray, offsets: np.ndarray
+    ) -> None:
+        """Sets the sorted table and its frame offsets.
+
+        Arguments:
+            table (TrackletTable): The table sorted by frame number.
+            frames (np.ndarray): The sorted frame numbers of the table.
+            offsets (np.ndarray): The first row of every frame followed by the number of rows.
+        """
+        self._table = table
+        self._frames = frames
+        self._offsets = offsets
+        self._positions = {
+            frame_number: position
+            for position, frame_number in enumerate(frames.tolist())
+        }
+
+    def _select(
+        self, start: int, stop: int, object_type: Optional[str]
+    ) -> TrackletTable:
+        """Selects a contiguous range of rows, optionally of a single type.
+
+        Arguments:
+            start (int): The first row.
+            stop (int): The row after the last row.
+            object_type (Optional[str]): The object type to select, or None for all types.
+
+        Returns:
+            TrackletTable: The selected rows
+        """
+        rows = self._table[int(start) : int(stop)]
+        if object_type is None:
+            return rows
+        return rows.where_type(object_type)
@@ -1,11 +1,117 @@
+import heapq
+from asyncio import Future, get_running_loop, wait
+from collections import deque
+from concurrent.futures import Executor
+from concurrent.futures import Future as PoolFuture
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from io import BytesIO
+from itertools import chain, islice
 from logging import Logger, getLogger
-from os import makedirs, path
-from typing import Dict, List, final
-from xml.etree.ElementTree import Element, ElementTree
+from multiprocessing import get_all_start_methods, get_context
+from operator import attrgetter
+from os import path
+from threading import active_count
+from time import perf_counter
+from typing import (
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    final,
+)
+from xml.etree.ElementTree import Element, iterparse
 
-from pandas import read_table
+import numpy as np
 
+from tracklet_parser.cache import load_cached_table
+from tracklet_parser.calibration import Calibration
+from tracklet_parser.compression import (
+    TRACKLET_XML_MEMBER,
+    is_compressed,
+    map_input,
+    open_input,
+)
+from tracklet_parser.frame_list import read_frame_list
+from tracklet_parser.instrumentation import (
+    Instrumentation,
+    optional_session,
+    optional_stage,
+)
+from tracklet_parser.kitti_format import (
+    format_kitti_label,
+    format_kitti_labels,
+)
+from tracklet_parser.kitti_sink import DirectorySink, LabelSink, create_sink
+from tracklet_parser.kitti_writer import (
+    LABEL_MANIFEST,
+    WriteReport,
+    label_digest,
+    load_label_manifest,
+    save_label_manifest,
+)
+from tracklet_parser.lazy_tracklet import LazyTrack, LazyTracklet, check_fields
+from tracklet_parser.track import Track
+from tracklet_parser.track_scanner import (
+    build_track,
+    find_track_ranges,
+    scan_tracks,
+)
 from tracklet_parser.tracklet import Tracklet
+from tracklet_parser.tracklet_table import TrackletTable
+from tracklet_parser.tracklet_writer import write_tracklet_xml
+from tracklet_parser.validation import (
+    ValidationError,
+    ValidationReport,
+    validate_table,
+)
+
+# The tracklets of a single label file
+_LabelGroup = Union[List[Tracklet], TrackletTable]
+# The chunks and results of a bounded pool map
+_Chunk = TypeVar("_Chunk")
+_Result = TypeVar("_Result")
+# Wraps the tracks of a shard into a document of their own
+_SHARD_PREFIX: bytes = b"<boost_serialization><tracklets>"
+_SHARD_SUFFIX: bytes = b"</tracklets></boost_serialization>"
+
+
+def create_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Creates a process pool whose start method is safe for the caller.
+
+    A single-threaded caller is forked, which works without an
+    `if __name__ == "__main__":` guard in the calling script. Forking a
+    multi-threaded caller, e.g. one running an event loop with an
+    executor, may deadlock, so its workers are started by a server process
+    instead ("forkserver", or "spawn" where it is unavailable). These
+    workers import the main module of the caller, which then requires the
+    guard.
+
+    Arguments:
+        max_workers (int): The number of worker processes.
+
+    Returns:
+        ProcessPoolExecutor: The process pool
+    """
+    start_methods = get_all_start_methods()
+    if active_count() == 1 and "fork" in start_methods:
+        start_method = "fork"
+    elif "forkserver" in start_methods:
+        start_method = "forkserver"
+    else:
+        start_method = "spawn"
+
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=get_context(start_method)
+    )
 
 
 @final
@@ -31,136 +137,1349 @@ class TrackletParser:
     """
 
     _LOGGER: Logger = getLogger(__name__)
-    _ATTRIBUTE_MAP: Dict[str, str] = {
-        "h": "height",
-        "w": "width",
-        "l": "length",
-        "tx": "x",
-        "ty": "y",
-        "tz": "z",
+    _EXECUTORS: Dict[str, Callable[..., Executor]] = {
+        "thread": ThreadPoolExecutor,
+        "process": create_process_pool,
     }
+    _BACKENDS: Tuple[str, ...] = ("etree", "fast")
+    # Number of chunks per worker to balance unevenly sized frames
+    _CHUNKS_PER_WORKER: int = 4
+    _POSE_INDEX: Dict[str, int] = {
+        field: index for index, field in enumerate(Track.POSE_FIELDS)
+    }
+    _DIMENSION_INDEX: Dict[str, int] = {"h": 0, "w": 1, "l": 2}
 
     @staticmethod
-    def parse_tracklet_xml(tracklet_xml: str) -> List[Tracklet]:
+    def parse_tracklet_xml(
+        tracklet_xml: Union[str, BinaryIO],
+        cache: bool = False,
+        instrumentation: Optional[Instrumentation] = None,
+        backend: str = "etree",
+        workers: int = 1,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Union[List[Tracklet], List[LazyTracklet]]:
         """Parses annotated tracklet labels from a given XML file.
 
+        With a field projection, e.g. `fields=["type", "frame_number",
+        "location"]`, read-only LazyTracklet objects are returned instead.
+        Only the requested fields are converted and validated while
+        parsing, all other fields are decoded per track on first access.
+        This reduces the parse time with the "fast" backend only. The cache and multiple workers decode all fields anyway, so they
+        return Tracklet objects regardless of the projection.
+
+        With more than one worker, the tracks of a plain XML file are split
+        into shards by a byte-level pre-scan and parsed on a process pool.
+        The frame-sorted shards are merged in frame order. The result does
+        not depend on the number of workers.
+
         Arguments:
-            tracklet_xml (str): The path to the tracklet XML file.
+            tracklet_xml (Union[str, BinaryIO]): The path to the tracklet XML file, optionally compressed (.gz, .xz, .zst) or inside a CVAT export zip archive, or a binary stream of it.
+            cache (bool): Whether to reuse and maintain a binary sidecar cache of the parsed tracklets next to the XML file.
+            instrumentation (Optional[Instrumentation]): Records the stage times and counters of the call, or None to disable the instrumentation.
+            backend (str): The XML parser, either "etree" for the streaming ElementTree parser or "fast" for a scanner specialized to the boost serialization layout, which reads the whole file.
+            workers (int): The number of processes parsing shards of the file. Compressed files, streams and documents the pre-scan cannot split, e.g. with comments between the tracks, are parsed by a single process.
+            fields (Optional[Sequence[str]]): The fields of `lazy_tracklet.FIELDS` to decode while parsing, or None to parse Tracklet objects with all fields.
+
+        Returns:
+            Union[List[Tracklet], List[LazyTracklet]]: A list of parsed Tracklet objects, or of LazyTracklet objects with a field projection.
+
+        Raises:
+            FileNotFoundError: If the specified XML file does not exist.
+            ValueError: If the XML structure is invalid, the "tracklets" element is missing, the backend or a field is unknown or the number of workers is invalid.
+            ParseError: If the parser fails to parse the document.
+        """
+        if fields is not None:
+            fields = check_fields(fields)
+
+        with optional_session(instrumentation):
+            if cache:
+                table = TrackletParser.parse_tracklet_table(
+                    tracklet_xml,
+                    cache=True,
+                    instrumentation=instrumentation,
+                    backend=backend,
+                    workers=workers,
+                )
+                with optional_stage(instrumentation, "expand"):
+                    return table.to_tracklets()
+
+            shards = TrackletParser._parse_shards(
+                tracklet_xml, workers, backend, instrumentation
+            )
+            if shards is not None:
+                # Equal frame numbers keep the order of the shards, which
+                # equals the stable sort of a single process
+                with optional_stage(instrumentation, "merge"):
+                    return list(
+                        heapq.merge(
+                            *(shard.to_tracklets() for shard in shards),
+                            key=attrgetter("frame_number"),
+                        )
+                    )
+
+            tracklets = list(
+                TrackletParser.iter_tracklets(
+                    tracklet_xml, instrumentation, backend, fields
+                )
+            )
+
+            # Sort tracklets by ascending frame number
+            with optional_stage(instrumentation, "sort"):
+                tracklets.sort(key=lambda tracklet: tracklet.frame_number)
+            return tracklets
+
+    @staticmethod
+    async def aparse_tracklet_xml(
+        tracklet_xml: Union[str, BinaryIO],
+        backend: str = "etree",
+        chunk_size: int = 64,
+        executor: Optional[Executor] = None,
+    ) -> List[Tracklet]:
+        """Parses annotated tracklet labels from a given XML file without
+        blocking the event loop.
+
+        The tracks are parsed on an executor in chunks of `chunk_size`
+        tracks, one chunk at a time, so the event loop serves other tasks
+        between the chunks. The result equals `parse_tracklet_xml`.
+
+        Arguments:
+            tracklet_xml (Union[str, BinaryIO]): The path to the tracklet XML file, optionally compressed (.gz, .xz, .zst) or inside a CVAT export zip archive, or a binary stream of it.
+            backend (str): The XML parser, either "etree" or "fast", see `parse_tracklet_xml`.
+            chunk_size (int): The number of tracks parsed per executor call.
+            executor (Optional[Executor]): The thread pool parsing the chunks, or None for the default executor of the event loop.
 
         Returns:
             List[Tracklet]: A list of parsed Tracklet objects.
 
         Raises:
             FileNotFoundError: If the specified XML file does not exist.
-            ValueError: If the XML structure is invalid or the "tracklets" element is missing.
+            ValueError: If the XML structure is invalid, the "tracklets" element is missing, the backend, the chunk size or the executor is invalid.
+            ParseError: If the parser fails to parse the document.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"{chunk_size} is an invalid chunk size.")
+        TrackletParser._check_async_executor(executor)
+
+        loop = get_running_loop()
+        tracks = TrackletParser.iter_tracks(tracklet_xml, backend=backend)
+        tracklets: List[Tracklet] = []
+        while True:
+            chunk = await loop.run_in_executor(
+                executor,
+                TrackletParser._expand_track_chunk,
+                tracks,
+                chunk_size,
+            )
+            if chunk is None:
+                break
+            tracklets.extend(chunk)
+
+        # Sort tracklets by ascending frame number
+        await loop.run_in_executor(
+            executor,
+            partial(
+                tracklets.sort, key=lambda tracklet: tracklet.frame_number
+            ),
+        )
+        return tracklets
+
+    @staticmethod
+    def _expand_track_chunk(
+        tracks: Iterator[Track], chunk_size: int
+    ) -> Optional[List[Tracklet]]:
+        """Parses the next chunk of tracks and expands them into tracklets.
+
+        Arguments:
+            tracks (Iterator[Track]): The lazily parsed tracks.
+            chunk_size (int): The number of tracks to parse.
+
+        Returns:
+            Optional[List[Tracklet]]: The tracklets of the chunk, or None if all tracks have been parsed.
+        """
+        chunk = list(islice(tracks, chunk_size))
+        if not chunk:
+            return None
+        return [tracklet for track in chunk for tracklet in track]
+
+    @staticmethod
+    def _check_async_executor(executor: Optional[Executor]) -> None:
+        """Validates the executor of an async call, which shares parser
+        state and sinks with the event loop thread.
+
+        Arguments:
+            executor (Optional[Executor]): The executor or None.
+
+        Raises:
+            ValueError: If the executor is a process pool.
+        """
+        if isinstance(executor, ProcessPoolExecutor):
+            raise ValueError("Async calls require a thread pool executor.")
+
+    @staticmethod
+    def parse_tracklet_table(
+        tracklet_xml: Union[str, BinaryIO],
+        cache: bool = False,
+        instrumentation: Optional[Instrumentation] = None,
+        backend: str = "etree",
+        workers: int = 1,
+    ) -> TrackletTable:
+        """Parses annotated tracklet labels from a given XML file directly
+        into a columnar table sorted by ascending frame number.
+
+        With the cache enabled, the table is stored in a memory-mappable
+        sidecar file next to the XML file (`<tracklet_xml>.tpcache`). Later
+        calls map it instead of parsing the XML file again, as long as the
+        size, modification time or content hash of the XML file match.
+
+        Arguments:
+            tracklet_xml (Union[str, BinaryIO]): The path to the tracklet XML file, optionally compressed (.gz, .xz, .zst) or inside a CVAT export zip archive, or a binary stream of it.
+            cache (bool): Whether to reuse and maintain a binary sidecar cache of the parsed tracklets next to the XML file.
+            instrumentation (Optional[Instrumentation]): Records the stage times and counters of the call, or None to disable the instrumentation.
+            backend (str): The XML parser, either "etree" for the streaming ElementTree parser or "fast" for a scanner specialized to the boost serialization layout, which reads the whole file.
+            workers (int): The number of processes parsing shards of the file, see `parse_tracklet_xml`.
+
+        Returns:
+            TrackletTable: The table of parsed tracklets.
+
+        Raises:
+            FileNotFoundError: If the specified XML file does not exist.
+            ValueError: If the XML structure is invalid, the "tracklets" element is missing, the backend or the number of workers is invalid or the cache is used with a stream.
+            ParseError: If the parser fails to parse the document.
+        """
+        if cache:
+            if not isinstance(tracklet_xml, str):
+                raise ValueError("The cache requires a tracklet XML path.")
+            if not path.exists(tracklet_xml):
+                raise FileNotFoundError(
+                    f"Tracklet XML file not found: {tracklet_xml}"
+                )
+            with optional_session(instrumentation):
+                return load_cached_table(
+                    tracklet_xml,
+                    partial(
+                        TrackletParser.parse_tracklet_table,
+                        instrumentation=instrumentation,
+                        backend=backend,
+                        workers=workers,
+                    ),
+                )
+
+        with optional_session(instrumentation):
+            shards = TrackletParser._parse_shards(
+                tracklet_xml, workers, backend, instrumentation
+            )
+            if shards is not None:
+                with optional_stage(instrumentation, "merge"):
+                    return TrackletTable.merge(shards)
+
+            table = TrackletTable.from_tracks(
+                TrackletParser.iter_tracks(
+                    tracklet_xml, instrumentation, backend
+                )
+            )
+            with optional_stage(instrumentation, "sort"):
+                return table.sort()
+
+    @staticmethod
+    def iter_tracklets(
+        tracklet_xml: Union[str, BinaryIO],
+        instrumentation: Optional[Instrumentation] = None,
+        backend: str = "etree",
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[Union[Tracklet, LazyTracklet]]:
+        """Lazily parses annotated tracklet labels from a given XML file.
+
+        Every pose of a track is expanded into its own tracklet at frame
+        `first_frame + i`. Tracklets are yielded in document order.
+        With a field projection, LazyTracklet objects are yielded, see
+        `parse_tracklet_xml`.
+
+        Arguments:
+            tracklet_xml (Union[str, BinaryIO]): The path to the tracklet XML file, optionally compressed (.gz, .xz, .zst) or inside a CVAT export zip archive, or a binary stream of it.
+            instrumentation (Optional[Instrumentation]): Records the stage times and counters of the call, or None to disable the instrumentation.
+            backend (str): The XML parser, either "etree" for the streaming ElementTree parser or "fast" for a scanner specialized to the boost serialization layout, which reads the whole file.
+            fields (Optional[Sequence[str]]): The fields of `lazy_tracklet.FIELDS` to decode while parsing, or None to parse Tracklet objects with all fields.
+
+        Returns:
+            Iterator[Union[Tracklet, LazyTracklet]]: An iterator over the parsed Tracklet objects, or LazyTracklet objects with a field projection.
+
+        Raises:
+            FileNotFoundError: If the specified XML file does not exist.
+            ValueError: If the XML structure is invalid, the "tracklets" element is missing or the backend or a field is unknown.
+            ParseError: If the parser fails to parse the document.
+        """
+        tracks = TrackletParser._iter_tracks(
+            tracklet_xml,
+            instrumentation,
+            backend,
+            None if fields is None else check_fields(fields),
+        )
+        if instrumentation is None:
+            return chain.from_iterable(tracks)
+        return TrackletParser._expand_tracks(tracks, instrumentation)
+
+    @staticmethod
+    def iter_tracks(
+        tracklet_xml: Union[str, BinaryIO],
+        instrumentation: Optional[Instrumentation] = None,
+        backend: str = "etree",
+    ) -> Iterator[Track]:
+        """Lazily parses the annotated tracks from a given XML file.
+
+        The file is streamed with `iterparse` and every track element is
+        released as soon as it has been parsed, so memory consumption stays
+        flat regardless of the file size. Tracks are yielded in document
+        order and keep their poses in a compact array.
+
+        Arguments:
+            tracklet_xml (Union[str, BinaryIO]): The path to the tracklet XML file, optionally compressed (.gz, .xz, .zst) or inside a CVAT export zip archive, or a binary stream of it.
+            instrumentation (Optional[Instrumentation]): Records the stage times and counters of the call, or None to disable the instrumentation.
+            backend (str): The XML parser, either "etree" for the streaming ElementTree parser or "fast" for a scanner specialized to the boost serialization layout, which reads the whole file.
+
+        Returns:
+            Iterator[Track]: An iterator over the parsed Track objects.
+
+        Raises:
+            FileNotFoundError: If the specified XML file does not exist.
+            ValueError: If the XML structure is invalid, the "tracklets" element is missing or the backend is unknown.
             ParseError: If the parser fails to parse the document.
         """
+
+        return TrackletParser._iter_tracks(
+            tracklet_xml, instrumentation, backend
+        )
+
+    @staticmethod
+    def _iter_tracks(
+        tracklet_xml: Union[str, BinaryIO],
+        instrumentation: Optional[Instrumentation] = None,
+        backend: str = "etree",
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> Iterator[Union[Track, LazyTrack]]:
+        """Lazily parses the annotated tracks from a given XML file, see
+        `iter_tracks`.
+
+        Arguments:
+            tracklet_xml (Union[str, BinaryIO]): The path to the tracklet XML file, optionally compressed (.gz, .xz, .zst) or inside a CVAT export zip archive, or a binary stream of it.
+            instrumentation (Optional[Instrumentation]): Records the stage times and counters of the call, or None to disable the instrumentation.
+            backend (str): The XML parser, either "etree" or "fast".
+            fields (Optional[Tuple[str, ...]]): The validated fields to decode while parsing LazyTrack objects, or None to parse Track objects.
+
+        Returns:
+            Iterator[Union[Track, LazyTrack]]: An iterator over the parsed tracks.
+
+        Raises:
+            FileNotFoundError: If the specified XML file does not exist.
+            ValueError: If the XML structure is invalid, the "tracklets" element is missing or the backend is unknown.
+            ParseError: If the parser fails to parse the document.
+        """
+        if backend not in TrackletParser._BACKENDS:
+            raise ValueError(f"{backend} is an unknown backend.")
+        if isinstance(tracklet_xml, str) and not path.exists(tracklet_xml):
+            raise FileNotFoundError(
+                f"Tracklet XML file not found: {tracklet_xml}"
+            )
+
+        if backend == "fast":
+            tracks = TrackletParser._scan_tracks(tracklet_xml, fields)
+        else:
+            tracks = TrackletParser._parse_tracks(tracklet_xml, fields)
+        if instrumentation is None:
+            return tracks
+        return TrackletParser._count_tracks(tracks, instrumentation)
+
+    @staticmethod
+    def _parse_tracks(
+        tracklet_xml: Union[str, BinaryIO],
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> Iterator[Union[Track, LazyTrack]]:
+        """Parses the tracks of a tracklet XML file with ElementTree.
+
+        Arguments:
+            tracklet_xml (Union[str, BinaryIO]): The path to the tracklet XML file or a binary stream of it.
+            fields (Optional[Tuple[str, ...]]): The fields to decode while parsing LazyTrack objects, or None to parse Track objects.
+
+        Returns:
+            Iterator[Union[Track, LazyTrack]]: An iterator over the parsed tracks.
+        """
+        parse_track = (
+            TrackletParser._parse_track
+            if fields is None
+            else partial(TrackletParser._parse_lazy_track, fields=fields)
+        )
+
+        return (
+            parse_track(track_element)
+            for track_element in TrackletParser._iter_tracklet_elements(
+                tracklet_xml
+            )
+        )
+
+    @staticmethod
+    def _scan_tracks(
+        tracklet_xml: Union[str, BinaryIO],
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> Iterator[Union[Track, LazyTrack]]:
+        """Scans the tracks of a tracklet XML file without building element
+        trees. Documents the scanner does not support are parsed with
+        ElementTree instead.
+
+        Arguments:
+            tracklet_xml (Union[str, BinaryIO]): The path to the tracklet XML file or a binary stream of it.
+            fields (Optional[Tuple[str, ...]]): The fields to decode while scanning LazyTrack objects, or None to scan Track objects.
+
+        Returns:
+            Iterator[Union[Track, LazyTrack]]: An iterator over the parsed tracks.
+        """
+        if fields is None:
+            parse_track, build = TrackletParser._parse_track, build_track
+        else:
+            parse_track = partial(
+                TrackletParser._parse_lazy_track, fields=fields
+            )
+            build = partial(LazyTrack, fields=fields)
+        with map_input(tracklet_xml, TRACKLET_XML_MEMBER) as document:
+            tracks = scan_tracks(document, parse_track, build)
+            if tracks is None:
+                tracks = TrackletParser._parse_tracks(
+                    (
+                        tracklet_xml
+                        if isinstance(tracklet_xml, str)
+                        else BytesIO(document)
+                    ),
+                    fields,
+                )
+            yield from tracks
+
+    @staticmethod
+    def _parse_shards(
+        tracklet_xml: Union[str, BinaryIO],
+        workers: int,
+        backend: str,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> Optional[List[TrackletTable]]:
+        """Parses shards of a tracklet XML file on a process pool.
+
+        A byte-level pre-scan of the memory mapped file locates the tracks,
+        which are split into contiguous shards of about the same size. Every
+        worker maps the file itself and parses the byte range of its shard.
+
+        Arguments:
+            tracklet_xml (Union[str, BinaryIO]): The path to the tracklet XML file or a binary stream of it.
+            workers (int): The number of worker processes.
+            backend (str): The XML parser of the workers.
+            instrumentation (Optional[Instrumentation]): Records the scan and parse times and the number of tracks and boxes.
+
+        Returns:
+            Optional[List[TrackletTable]]: The frame-sorted table of every shard in document order, or None if the file has to be parsed by a single process.
+
+        Raises:
+            FileNotFoundError: If the specified XML file does not exist.
+            ValueError: If the number of workers or the backend is invalid.
+        """
+        if workers < 1:
+            raise ValueError(f"{workers} is an invalid number of workers.")
+        if backend not in TrackletParser._BACKENDS:
+            raise ValueError(f"{backend} is an unknown backend.")
+        if (
+            workers == 1
+            or not isinstance(tracklet_xml, str)
+            or is_compressed(tracklet_xml)
+        ):
+            return None
         if not path.exists(tracklet_xml):
             raise FileNotFoundError(
                 f"Tracklet XML file not found: {tracklet_xml}"
             )
 
-        tree = ElementTree()
-        tree.parse(tracklet_xml)
+        with optional_stage(instrumentation, "scan"):
+            with map_input(tracklet_xml) as document:
+                track_ranges = find_track_ranges(document)
+        if not track_ranges:
+            return None
+
+        shard_ranges = TrackletParser._split_track_ranges(
+            track_ranges, workers * TrackletParser._CHUNKS_PER_WORKER
+        )
+        with optional_stage(instrumentation, "parse"):
+            with create_process_pool(workers) as pool:
+                shards = list(
+                    pool.map(
+                        partial(
+                            TrackletParser._parse_shard,
+                            tracklet_xml,
+                            backend=backend,
+                        ),
+                        *zip(*shard_ranges),
+                    )
+                )
+        if instrumentation is not None:
+            instrumentation.count("tracks", len(track_ranges))
+            instrumentation.count("boxes", sum(map(len, shards)))
+        return shards
+
+    @staticmethod
+    def _split_track_ranges(
+        track_ranges: List[Tuple[int, int]], shard_count: int
+    ) -> List[Tuple[int, int]]:
+        """Splits the tracks into contiguous shards of about the same number
+        of bytes.
+
+        Arguments:
+            track_ranges (List[Tuple[int, int]]): The start and the end of every track in document order.
+            shard_count (int): The maximum number of shards.
+
+        Returns:
+            List[Tuple[int, int]]: The start and the end of every shard.
+        """
+        first_start = track_ranges[0][0]
+        shard_size = (track_ranges[-1][1] - first_start) / shard_count
+        shard_ranges: List[Tuple[int, int]] = []
+        shard_start = first_start
+        for _, end in track_ranges:
+            if end - first_start >= shard_size * (len(shard_ranges) + 1):
+                shard_ranges.append((shard_start, end))
+                shard_start = end
+        if shard_start < track_ranges[-1][1]:
+            shard_ranges.append((shard_start, track_ranges[-1][1]))
+        return shard_ranges
+
+    @staticmethod
+    def _parse_shard(
+        tracklet_xml: str, start: int, end: int, backend: str
+    ) -> TrackletTable:
+        """Parses the tracks within a byte range of a tracklet XML file.
+
+        Arguments:
+            tracklet_xml (str): The path to the tracklet XML file.
+            start (int): The start of the first track of the shard.
+            end (int): The end of the last track of the shard.
+            backend (str): The XML parser.
+
+        Returns:
+            TrackletTable: The table of the parsed tracklets sorted by ascending frame number.
+        """
+        with map_input(tracklet_xml) as document:
+            shard = b"".join(
+                (_SHARD_PREFIX, document[start:end], _SHARD_SUFFIX)
+            )
+
+        return TrackletTable.from_tracks(
+            TrackletParser.iter_tracks(BytesIO(shard), backend=backend)
+        ).sort()
+
+    @staticmethod
+    def _count_tracks(
+        tracks: Iterator[Track], instrumentation: Instrumentation
+    ) -> Iterator[Track]:
+        """Times the parsing of streamed tracks and counts tracks and boxes.
+
+        Arguments:
+            tracks (Iterator[Track]): The lazily parsed tracks.
+            instrumentation (Instrumentation): The instrumentation.
+
+        Returns:
+            Iterator[Track]: An iterator over the tracks.
+        """
+        for track in instrumentation.iterate("parse", tracks, "tracks"):
+            instrumentation.count("boxes", len(track))
+            yield track
+
+    @staticmethod
+    def _expand_tracks(
+        tracks: Iterator[Track], instrumentation: Instrumentation
+    ) -> Iterator[Tracklet]:
+        """Expands tracks into per-frame tracklets and times the expansion.
+
+        Arguments:
+            tracks (Iterator[Track]): The lazily parsed tracks.
+            instrumentation (Instrumentation): The instrumentation.
+
+        Returns:
+            Iterator[Tracklet]: An iterator over the tracklets.
+        """
+        for track in tracks:
+            with instrumentation.stage("expand"):
+                tracklets = list(track)
+            yield from tracklets
+
+    @staticmethod
+    def _iter_tracklet_elements(
+        tracklet_xml: Union[str, BinaryIO],
+    ) -> Iterator[Element]:
+        """Streams the tracklet elements of the "tracklets" element.
+
+        Each yielded element is detached from the document once the consumer
+        resumes the iterator, so at most one tracklet subtree is held in
+        memory at a time.
+
+        Arguments:
+            tracklet_xml (Union[str, BinaryIO]): The path to the tracklet XML file or a binary stream of it.
+
+        Returns:
+            Iterator[Element]: An iterator over the tracklet elements.
+
+        Raises:
+            ValueError: If the XML structure is invalid or the "tracklets" element is missing.
+            ParseError: If the parser fails to parse the document.
+        """
+        depth = 0
+        tracklet_elements: Optional[Element] = None
+        in_tracklets = False
+
+        with open_input(tracklet_xml, TRACKLET_XML_MEMBER) as xml_stream:
+            for event, element in iterparse(
+                xml_stream, events=("start", "end")
+            ):
+                if event == "start":
+                    depth += 1
+                    # Only the first "tracklets" element below the root is used
+                    if (
+                        depth == 2
+                        and element.tag == "tracklets"
+                        and tracklet_elements is None
+                    ):
+                        tracklet_elements = element
+                        in_tracklets = True
+                    continue
+
+                depth -= 1
+                if in_tracklets and depth == 2 and element.tag == "item":
+                    yield element
+                    # Drop finished tracklets to keep the memory footprint flat
+                    tracklet_elements.clear()
+                elif depth == 1 and element is tracklet_elements:
+                    in_tracklets = False
 
-        # Extract tracklet information from XML
-        tracklet_elements = tree.find("tracklets")
         if tracklet_elements is None:
             raise ValueError(
                 "Invalid XML structure: 'tracklets' element not found."
             )
 
-        tracklets: List[Tracklet] = [
-            TrackletParser._parse_tracklet(tracklet_element)
-            for tracklet_element in tracklet_elements
-            if tracklet_element.tag == "item"
-        ]
+    @staticmethod
+    def _parse_track(track_element: Element) -> Track:
+        """Parses a single track element from the XML.
 
-        # Sort tracklets by ascending frame number
-        tracklets.sort(key=lambda tracklet: tracklet.frame_number)
-        return tracklets
+        Arguments:
+            track_element (Element): The XML element representing a track.
+
+        Returns:
+            Track: The parsed Track object.
+        """
+
+        return build_track(*TrackletParser._read_track_element(track_element))
+
+    @staticmethod
+    def _parse_lazy_track(
+        track_element: Element, fields: Tuple[str, ...]
+    ) -> LazyTrack:
+        """Parses a single track element from the XML, keeping the raw text
+        of the fields which are not requested.
+
+        Arguments:
+            track_element (Element): The XML element representing a track.
+            fields (Tuple[str, ...]): The fields to decode right away.
+
+        Returns:
+            LazyTrack: The parsed LazyTrack object.
+        """
+
+        return LazyTrack(
+            *TrackletParser._read_track_element(track_element), fields
+        )
 
     @staticmethod
-    def _parse_tracklet(tracklet_element: Element) -> Tracklet:
-        """Parses a single tracklet element from the XML.
+    def _read_track_element(
+        track_element: Element,
+    ) -> Tuple[str, int, List[str], List[List[str]]]:
+        """Reads the raw fields of a single track element from the XML.
 
         Arguments:
-            tracklet_element (Element): The XML element representing a tracklet.
+            track_element (Element): The XML element representing a track.
 
         Returns:
-            Tracklet: The parsed Tracklet object.
+            Tuple[str, int, List[str], List[List[str]]]: The object type, the first frame and the raw text of the height, width and length and of the values of `Track.POSE_FIELDS` of every pose.
         """
-        tracklet = Tracklet()
-        for attribute in tracklet_element:
+        object_type = ""
+        first_frame = -1
+        dimensions = ["0", "0", "0"]
+        poses: List[List[str]] = []
+        for attribute in track_element:
             if attribute.tag == "objectType":
-                tracklet.type = attribute.text
-            elif attribute.tag in ["h", "w", "l"]:
-                tracklet.put_dimension(
-                    TrackletParser._ATTRIBUTE_MAP[attribute.tag],
-                    float(attribute.text),
+                object_type = attribute.text
+            elif attribute.tag in TrackletParser._DIMENSION_INDEX:
+                dimensions[TrackletParser._DIMENSION_INDEX[attribute.tag]] = (
+                    attribute.text
                 )
             elif attribute.tag == "first_frame":
-                tracklet.frame_number = int(attribute.text)
+                first_frame = int(attribute.text)
             elif attribute.tag == "poses":
-                pose = attribute.find("item")
-                if pose is not None:
+                for pose in attribute.iterfind("item"):
+                    values = ["0"] * len(Track.POSE_FIELDS)
                     for pose_attribute in pose:
-                        if pose_attribute.tag in ["tx", "ty", "tz"]:
-                            tracklet.put_location(
-                                TrackletParser._ATTRIBUTE_MAP[
-                                    pose_attribute.tag
-                                ],
-                                float(pose_attribute.text),
-                            )
-                        elif pose_attribute.tag == "rz":
-                            tracklet.rotation_z = float(pose_attribute.text)
-                        elif pose_attribute.tag == "occlusion":
-                            tracklet.occluded = int(pose_attribute.text)
-                        elif pose_attribute.tag == "truncation":
-                            tracklet.truncated = float(pose_attribute.text)
-        return tracklet
+                        index = TrackletParser._POSE_INDEX.get(
+                            pose_attribute.tag
+                        )
+                        if index is not None:
+                            values[index] = pose_attribute.text
+                    poses.append(values)
+        return object_type, first_frame, dimensions, poses
+
+    @staticmethod
+    def validate_tracklets(
+        tracklets: Union[Iterable[Tracklet], TrackletTable],
+        frame_list: Optional[Union[str, BinaryIO]] = None,
+        bins: int = 10,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> ValidationReport:
+        """Checks tracklets for NaN values, non-positive dimensions,
+        duplicate boxes and frames missing from the frame list, and computes
+        the per-class counts and size histograms.
+
+        All checks run vectorized over the columns of a table, so tracklet
+        lists are converted into a table first. Batches of exports are
+        validated in parallel by `batch.run_batch(..., validate=True)`.
+
+        Arguments:
+            tracklets (Union[Iterable[Tracklet], TrackletTable]): The Tracklet objects or the table of tracklets to validate.
+            frame_list (Optional[Union[str, BinaryIO]]): Path to the frame list to check the frame numbers against, or a binary stream of it, or None to skip the check.
+            bins (int): The number of bins of the size histograms.
+            instrumentation (Optional[Instrumentation]): Records the stage times and counters of the call, or None to disable the instrumentation.
+
+        Returns:
+            ValidationReport: The results of the checks and the statistics.
+
+        Raises:
+            ValueError: If the number of bins is invalid or the frame list is malformed.
+        """
+        with optional_session(instrumentation):
+            label_dict: Dict[int, str] = {}
+            if frame_list is not None:
+                with optional_stage(instrumentation, "frame_list"):
+                    label_dict = TrackletParser._load_frame_list(frame_list)
+            with optional_stage(instrumentation, "validate"):
+                if not isinstance(tracklets, TrackletTable):
+                    tracklets = TrackletTable.from_tracklets(tracklets)
+                return validate_table(tracklets, label_dict, bins)
 
     @staticmethod
     def convert_tracklets_to_kitti(
-        tracklets: List[Tracklet], frame_list: str, output_dir: str
-    ) -> None:
+        tracklets: Union[Iterable[Tracklet], TrackletTable],
+        frame_list: Union[str, BinaryIO],
+        output_dir: str,
+        workers: int = 1,
+        executor: str = "thread",
+        precision: Optional[int] = None,
+        incremental: bool = False,
+        sink: Union[str, LabelSink] = "directory",
+        instrumentation: Optional[Instrumentation] = None,
+        calibration: Optional[Calibration] = None,
+        validate: bool = False,
+    ) -> WriteReport:
         """Converts a list of tracklet objects into KITTI format and writes
         them to the specified output directory.
 
+        The tracklets are grouped by label file in a single pass, so every
+        label file is opened and written exactly once. With more than one
+        worker, the label files are split into chunks which are formatted
+        and written concurrently. The output does not depend on the number
+        of workers. Every label file is formatted in one batch.
+
+        By default, every label file is written to its own file in the
+        output directory. Other sinks collect all label files in a single
+        tar or zip archive or in a single concatenated label file with a
+        byte offset index at the output path. Their label files are
+        formatted by the workers and streamed to the sink in order.
+
+        With a calibration, all boxes are transformed from LiDAR into camera
+        coordinates in one vectorized pass before they are grouped, which
+        also fills in their observation angles and 2D bounding boxes.
+
+        In incremental mode, a manifest of content hashes is kept in the
+        output directory. Only label files whose content changed are
+        rewritten and label files of frames without boxes are deleted.
+
+        With validation, the tracklets are checked as in
+        `validate_tracklets` before the sink is opened, so no file is
+        written if a check fails.
+
+        Arguments:
+            tracklets (Union[Iterable[Tracklet], TrackletTable]): The Tracklet objects or the table of tracklets to be converted.
+            frame_list (Union[str, BinaryIO]): Path to a file containing the mapping of frame numbers to point cloud file names, optionally compressed or inside a CVAT export zip archive, or a binary stream of it.
+            output_dir (str): Path to the output directory where the KITTI format label files will be saved, or to the output file of a single file sink.
+            workers (int): The number of workers formatting and writing label files.
+            executor (str): The worker pool, either "thread" for I/O-bound or "process" for formatting-bound exports.
+            precision (Optional[int]): The number of decimals of all floating point values, e.g. 2 as in the KITTI devkit, or None for their shortest representation.
+            incremental (bool): Whether to rewrite only changed label files.
+            sink (Union[str, LabelSink]): The output sink, either "directory", "tar", "zip" or "concatenated" at the output path, or an unopened LabelSink.
+            instrumentation (Optional[Instrumentation]): Records the stage times and counters of the call, or None to disable the instrumentation.
+            calibration (Optional[Calibration]): Transforms the LiDAR boxes into camera coordinates and computes their observation angles and 2D bounding boxes, or None to write the boxes as parsed.
+            validate (bool): Whether to check the tracklets and fail before writing any file.
+
+        Returns:
+            WriteReport: The number of label files and bytes written, skipped and deleted.
+
+        Raises:
+            ValueError: If the number of workers, the executor, the sink or the precision is invalid, or if incremental mode is used with a single file sink.
+            ValidationError: If validation is enabled and a check fails.
+        """
+        if precision is not None and precision < 0:
+            raise ValueError(f"{precision} is an invalid precision.")
+        if workers < 1:
+            raise ValueError(f"{workers} is an invalid number of workers.")
+        if executor not in TrackletParser._EXECUTORS:
+            raise ValueError(f"{executor} is an unknown executor.")
+        if isinstance(sink, str):
+            sink = create_sink(sink, output_dir)
+        if incremental and not isinstance(sink, DirectorySink):
+            raise ValueError("Incremental mode requires a directory sink.")
+
+        with optional_session(instrumentation):
+            with optional_stage(instrumentation, "frame_list"):
+                label_dict: Dict[int, str] = TrackletParser._load_frame_list(
+                    frame_list
+                )
+            if validate:
+                with optional_stage(instrumentation, "validate"):
+                    if not isinstance(tracklets, TrackletTable):
+                        # The tracklets are iterated again when grouped
+                        tracklets = list(tracklets)
+                        table = TrackletTable.from_tracklets(tracklets)
+                    else:
+                        table = tracklets
+                    validation = validate_table(table, label_dict)
+                if not validation.valid:
+                    raise ValidationError(validation)
+            if calibration is not None:
+                with optional_stage(instrumentation, "transform"):
+                    tracklets = TrackletParser._transform_tracklets(
+                        tracklets, calibration
+                    )
+            with sink:
+                previous_digests: Dict[str, str] = {}
+                if incremental:
+                    previous_digests = load_label_manifest(sink.output_dir)
+                elif isinstance(sink, DirectorySink):
+                    # A manifest would no longer match the rewritten files
+                    sink.remove(LABEL_MANIFEST)
+
+                with optional_stage(instrumentation, "group"):
+                    label_files: List[
+                        Tuple[str, _LabelGroup, Optional[str]]
+                    ] = [
+                        (
+                            f"{label_file_name}.txt",
+                            frame_tracklets,
+                            previous_digests.get(f"{label_file_name}.txt"),
+                        )
+                        for label_file_name, frame_tracklets in (
+                            TrackletParser._group_tracklets_by_label_file(
+                                tracklets, label_dict
+                            ).items()
+                        )
+                    ]
+                if instrumentation is not None:
+                    instrumentation.count("label_files", len(label_files))
+                results = TrackletParser._write_chunks(
+                    label_files,
+                    sink,
+                    workers,
+                    executor,
+                    precision,
+                    incremental,
+                    instrumentation,
+                )
+
+            report = sum((result[0] for result in results), WriteReport())
+            if incremental:
+                digests: Dict[str, str] = {}
+                for _, chunk_digests in results:
+                    digests.update(chunk_digests)
+                for stale_file_name in (
+                    previous_digests.keys() - digests.keys()
+                ):
+                    if sink.remove(stale_file_name):
+                        report.files_deleted += 1
+                save_label_manifest(sink.output_dir, digests)
+                if instrumentation is not None:
+                    instrumentation.count(
+                        "files_deleted", report.files_deleted
+                    )
+            return report
+
+    @staticmethod
+    async def aconvert_tracklets_to_kitti(
+        tracklets: Union[Iterable[Tracklet], TrackletTable],
+        frame_list: Union[str, BinaryIO],
+        output_dir: str,
+        precision: Optional[int] = None,
+        sink: Union[str, LabelSink] = "directory",
+        concurrency: int = 4,
+        chunk_size: int = 64,
+        executor: Optional[Executor] = None,
+        calibration: Optional[Calibration] = None,
+    ) -> WriteReport:
+        """Converts tracklet objects into KITTI format like
+        `convert_tracklets_to_kitti` without blocking the event loop.
+
+        Loading the frame list, grouping the tracklets and opening and
+        closing the sink run on an executor. The label files are formatted
+        and written in chunks of `chunk_size` label files with at most
+        `concurrency` chunks in flight. Sinks which cannot be written
+        concurrently receive the label files in order, while the following
+        chunks are formatted. The output equals `convert_tracklets_to_kitti`.
+
+        Arguments:
+            tracklets (Union[Iterable[Tracklet], TrackletTable]): The Tracklet objects or the table of tracklets to be converted.
+            frame_list (Union[str, BinaryIO]): Path to a file containing the mapping of frame numbers to point cloud file names, optionally compressed or inside a CVAT export zip archive, or a binary stream of it.
+            output_dir (str): Path to the output directory where the KITTI format label files will be saved, or to the output file of a single file sink.
+            precision (Optional[int]): The number of decimals of all floating point values, e.g. 2 as in the KITTI devkit, or None for their shortest representation.
+            sink (Union[str, LabelSink]): The output sink, either "directory", "tar", "zip" or "concatenated" at the output path, or an unopened LabelSink.
+            concurrency (int): The maximum number of chunks formatted or written at a time.
+            chunk_size (int): The number of label files per chunk.
+            executor (Optional[Executor]): The thread pool doing the blocking work, or None for the default executor of the event loop.
+            calibration (Optional[Calibration]): Transforms the LiDAR boxes into camera coordinates, see `convert_tracklets_to_kitti`.
+
+        Returns:
+            WriteReport: The number of label files and bytes written.
+
+        Raises:
+            ValueError: If the concurrency, the chunk size, the executor, the sink or the precision is invalid.
+        """
+        if precision is not None and precision < 0:
+            raise ValueError(f"{precision} is an invalid precision.")
+        if concurrency < 1:
+            raise ValueError(f"{concurrency} is an invalid concurrency.")
+        if chunk_size < 1:
+            raise ValueError(f"{chunk_size} is an invalid chunk size.")
+        TrackletParser._check_async_executor(executor)
+        if isinstance(sink, str):
+            sink = create_sink(sink, output_dir)
+
+        loop = get_running_loop()
+        label_dict: Dict[int, str] = await loop.run_in_executor(
+            executor, TrackletParser._load_frame_list, frame_list
+        )
+        if calibration is not None:
+            tracklets = await loop.run_in_executor(
+                executor,
+                TrackletParser._transform_tracklets,
+                tracklets,
+                calibration,
+            )
+        groups: Dict[str, _LabelGroup] = await loop.run_in_executor(
+            executor,
+            TrackletParser._group_tracklets_by_label_file,
+            tracklets,
+            label_dict,
+        )
+        label_files: List[Tuple[str, _LabelGroup, Optional[str]]] = [
+            (f"{label_file_name}.txt", frame_tracklets, None)
+            for label_file_name, frame_tracklets in groups.items()
+        ]
+        chunks = [
+            label_files[start : start + chunk_size]
+            for start in range(0, len(label_files), chunk_size)
+        ]
+
+        if sink.concurrent:
+            work = partial(
+                TrackletParser._write_label_files,
+                sink=sink,
+                precision=precision,
+            )
+        else:
+            work = partial(
+                TrackletParser._format_label_files, precision=precision
+            )
+
+        await loop.run_in_executor(executor, sink.open)
+        report = WriteReport()
+        pending: Deque["Future[tuple]"] = deque()
+        try:
+            if isinstance(sink, DirectorySink):
+                # A manifest would no longer match the rewritten files
+                await loop.run_in_executor(
+                    executor, sink.remove, LABEL_MANIFEST
+                )
+            for chunk in chunks:
+                # The oldest chunk is finished first to keep the sink order
+                if len(pending) >= concurrency:
+                    report += await TrackletParser._finish_async_chunk(
+                        pending.popleft(), sink, executor
+                    )
+                pending.append(loop.run_in_executor(executor, work, chunk))
+            while pending:
+                report += await TrackletParser._finish_async_chunk(
+                    pending.popleft(), sink, executor
+                )
+        finally:
+            # Running chunks cannot be interrupted and must finish before
+            # the sink is closed
+            if pending:
+                await wait(pending)
+            await loop.run_in_executor(executor, sink.close)
+        return report
+
+    @staticmethod
+    async def _finish_async_chunk(
+        chunk: "Future[tuple]",
+        sink: LabelSink,
+        executor: Optional[Executor],
+    ) -> WriteReport:
+        """Waits for a chunk of an async conversion and writes its label
+        files unless the sink is written concurrently.
+
         Arguments:
-            tracklets (List[Tracklet]): A list of Tracklet objects to be converted.
-            frame_list (str): Path to a file containing the mapping of frame numbers to point cloud file names.
-            output_dir (str): Path to the output directory where the KITTI format label files will be saved.
+            chunk (Future[tuple]): The chunk, which is written by `_write_label_files` for concurrent sinks and formatted by `_format_label_files` otherwise.
+            sink (LabelSink): The opened output sink.
+            executor (Optional[Executor]): The thread pool writing the label files.
+
+        Returns:
+            WriteReport: The number of label files and bytes written.
         """
-        if not path.exists(output_dir):
-            makedirs(output_dir)
+        result = await chunk
+        if sink.concurrent:
+            return result[0]
 
-        label_dict: Dict[int, str] = TrackletParser._load_frame_list(
-            frame_list
+        formatted_files, seconds = result
+        return await get_running_loop().run_in_executor(
+            executor,
+            TrackletParser._write_formatted_files,
+            formatted_files,
+            sink,
+            seconds,
         )
-        frames: List[int] = []
 
+    @staticmethod
+    def convert_kitti_to_tracklets(
+        label_dir: str,
+        frame_list: Union[str, BinaryIO],
+        tracklet_xml: Union[str, BinaryIO],
+    ) -> int:
+        """Converts a directory of KITTI label files back into a tracklet XML
+        file, e.g. to import corrected labels into CVAT.
+
+        The label files are mapped to frames by the frame list in reverse and
+        streamed into the XML file, so memory does not grow with the number
+        of boxes. Every box becomes a track with a single pose, see
+        `tracklet_writer.write_tracklet_xml`.
+
+        Arguments:
+            label_dir (str): The directory of KITTI label files in LiDAR coordinates.
+            frame_list (Union[str, BinaryIO]): Path to a file containing the mapping of frame numbers to point cloud file names, optionally compressed or inside a CVAT export zip archive, or a binary stream of it.
+            tracklet_xml (Union[str, BinaryIO]): The path to the tracklet XML file or a binary stream.
+
+        Returns:
+            int: The number of boxes written
+
+        Raises:
+            FileNotFoundError: If the label directory does not exist.
+            ValueError: If a label file cannot be mapped to a frame or a label line is malformed.
+        """
+
+        return write_tracklet_xml(
+            label_dir,
+            TrackletParser._load_frame_list(frame_list),
+            tracklet_xml,
+        )
+
+    @staticmethod
+    def _write_chunks(
+        label_files: List[Tuple[str, _LabelGroup, Optional[str]]],
+        sink: LabelSink,
+        workers: int,
+        executor: str,
+        precision: Optional[int],
+        incremental: bool,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> List[Tuple[WriteReport, Dict[str, str]]]:
+        """Formats and writes the label files to an opened sink, split into
+        chunks on a worker pool if more than one worker is requested.
+
+        Concurrent sinks are written by the workers themselves. For all
+        other sinks, the workers only format the label files, which are
+        written by the calling thread in the order of the chunks. At most
+        two chunks per worker are in flight, so the formatted label files
+        waiting for the sink do not grow with the export.
+
+        Arguments:
+            label_files (List[Tuple[str, _LabelGroup, Optional[str]]]): The label file names, their tracklets and their previous content hashes.
+            sink (LabelSink): The opened output sink.
+            workers (int): The number of workers.
+            executor (str): The worker pool, either "thread" or "process".
+            precision (Optional[int]): The number of decimals of all floating point values.
+            incremental (bool): Whether to skip label files whose content hash did not change.
+            instrumentation (Optional[Instrumentation]): Records the format and write times and the progress of every chunk.
+
+        Returns:
+            List[Tuple[WriteReport, Dict[str, str]]]: The report and the content hashes per chunk.
+        """
+        write_label_files = partial(
+            TrackletParser._write_label_files,
+            sink=sink,
+            precision=precision,
+            incremental=incremental,
+        )
+        if workers == 1 or len(label_files) <= 1:
+            report, digests, seconds = write_label_files(label_files)
+            TrackletParser._record_chunk(instrumentation, report, seconds)
+            return [(report, digests)]
+
+        chunk_size = -(
+            -len(label_files) // (workers * TrackletParser._CHUNKS_PER_WORKER)
+        )
+        chunks = [
+            label_files[start : start + chunk_size]
+            for start in range(0, len(label_files), chunk_size)
+        ]
+        results: List[Tuple[WriteReport, Dict[str, str]]] = []
+        with TrackletParser._EXECUTORS[executor](max_workers=workers) as pool:
+            if sink.concurrent:
+                for report, digests, seconds in TrackletParser._map_bounded(
+                    pool, write_label_files, chunks, workers
+                ):
+                    TrackletParser._record_chunk(
+                        instrumentation, report, seconds
+                    )
+                    results.append((report, digests))
+                return results
+
+            for formatted_files, seconds in TrackletParser._map_bounded(
+                pool,
+                partial(
+                    TrackletParser._format_label_files, precision=precision
+                ),
+                chunks,
+                workers,
+            ):
+                report = TrackletParser._write_formatted_files(
+                    formatted_files, sink, seconds
+                )
+                TrackletParser._record_chunk(instrumentation, report, seconds)
+                results.append((report, {}))
+            return results
+
+    @staticmethod
+    def _map_bounded(
+        pool: Executor,
+        function: Callable[[_Chunk], _Result],
+        chunks: Iterable[_Chunk],
+        workers: int,
+    ) -> Iterator[_Result]:
+        """Maps a function over chunks on a pool like `Executor.map`, but
+        submits the next chunk only once the oldest one was consumed, so at
+        most `2 * workers` results are held at a time.
+
+        Arguments:
+            pool (Executor): The worker pool.
+            function (Callable[[_Chunk], _Result]): The function to apply.
+            chunks (Iterable[_Chunk]): The chunks in order.
+            workers (int): The number of workers of the pool.
+
+        Returns:
+            Iterator[_Result]: An iterator over the results in the order of the chunks.
+        """
+        pending: Deque["PoolFuture[_Result]"] = deque()
+        try:
+            for chunk in chunks:
+                # The oldest chunk is consumed first to keep the sink order
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+                pending.append(pool.submit(function, chunk))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _write_formatted_files(
+        formatted_files: List[Tuple[str, bytes]],
+        sink: LabelSink,
+        seconds: Dict[str, float],
+    ) -> WriteReport:
+        """Writes a chunk of formatted label files in order.
+
+        Arguments:
+            formatted_files (List[Tuple[str, bytes]]): The UTF-8 encoded labels per label file name.
+            sink (LabelSink): The opened output sink.
+            seconds (Dict[str, float]): The time per stage of the chunk, which receives the time spent writing.
+
+        Returns:
+            WriteReport: The number of label files and bytes written.
+        """
+        report = WriteReport()
+        start = perf_counter()
+        for label_file_name, data in formatted_files:
+            report.files_written += 1
+            report.bytes_written += sink.write(label_file_name, data)
+        seconds["write"] = perf_counter() - start
+        return report
+
+    @staticmethod
+    def _record_chunk(
+        instrumentation: Optional[Instrumentation],
+        report: WriteReport,
+        seconds: Dict[str, float],
+    ) -> None:
+        """Records the times and counters of a written chunk.
+
+        Arguments:
+            instrumentation (Optional[Instrumentation]): The instrumentation or None.
+            report (WriteReport): The report of the chunk.
+            seconds (Dict[str, float]): The time per stage of the chunk.
+        """
+        if instrumentation is None:
+            return
+
+        for stage, stage_seconds in seconds.items():
+            instrumentation.add_time(stage, stage_seconds)
+        instrumentation.count("files_written", report.files_written)
+        instrumentation.count("bytes_written", report.bytes_written)
+        if report.files_skipped:
+            instrumentation.count("files_skipped", report.files_skipped)
+
+    @staticmethod
+    def _write_label_files(
+        label_files: List[Tuple[str, _LabelGroup, Optional[str]]],
+        sink: LabelSink,
+        precision: Optional[int] = None,
+        incremental: bool = False,
+    ) -> Tuple[WriteReport, Dict[str, str], Dict[str, float]]:
+        """Formats and writes a chunk of label files.
+
+        Arguments:
+            label_files (List[Tuple[str, _LabelGroup, Optional[str]]]): The label file names, their tracklets and their previous content hashes.
+            sink (LabelSink): The opened output sink.
+            precision (Optional[int]): The number of decimals of all floating point values.
+            incremental (bool): Whether to skip label files whose content hash did not change.
+
+        Returns:
+            Tuple[WriteReport, Dict[str, str], Dict[str, float]]: The number of label files and bytes written, in incremental mode the content hash per label file name and the time spent formatting and writing.
+        """
+        report = WriteReport()
+        digests: Dict[str, str] = {}
+        seconds = {"format": 0.0, "write": 0.0}
+        for label_file_name, frame_tracklets, previous_digest in label_files:
+            start = perf_counter()
+            data = format_kitti_labels(frame_tracklets, precision).encode(
+                "utf-8"
+            )
+            digest = label_digest(data) if incremental else None
+            formatted = perf_counter()
+            seconds["format"] += formatted - start
+            if incremental:
+                digests[label_file_name] = digest
+                if digest == previous_digest and sink.exists(label_file_name):
+                    report.files_skipped += 1
+                    continue
+
+            report.files_written += 1
+            report.bytes_written += sink.write(label_file_name, data)
+            seconds["write"] += perf_counter() - formatted
+        return report, digests, seconds
+
+    @staticmethod
+    def _format_label_files(
+        label_files: List[Tuple[str, _LabelGroup, Optional[str]]],
+        precision: Optional[int] = None,
+    ) -> Tuple[List[Tuple[str, bytes]], Dict[str, float]]:
+        """Formats a chunk of label files without writing them.
+
+        Arguments:
+            label_files (List[Tuple[str, _LabelGroup, Optional[str]]]): The label file names, their tracklets and their previous content hashes.
+            precision (Optional[int]): The number of decimals of all floating point values.
+
+        Returns:
+            Tuple[List[Tuple[str, bytes]], Dict[str, float]]: The UTF-8 encoded labels per label file name and the time spent formatting.
+        """
+        start = perf_counter()
+        formatted_files = [
+            (
+                label_file_name,
+                format_kitti_labels(frame_tracklets, precision).encode(
+                    "utf-8"
+                ),
+            )
+            for label_file_name, frame_tracklets, _ in label_files
+        ]
+        return formatted_files, {"format": perf_counter() - start}
+
+    @staticmethod
+    def _transform_tracklets(
+        tracklets: Union[Iterable[Tracklet], TrackletTable],
+        calibration: Calibration,
+    ) -> TrackletTable:
+        """Transforms tracklets into camera coordinates in one batch.
+
+        Arguments:
+            tracklets (Union[Iterable[Tracklet], TrackletTable]): The tracklets or the table of tracklets in LiDAR coordinates.
+            calibration (Calibration): The calibration of the LiDAR and the camera.
+
+        Returns:
+            TrackletTable: The table of tracklets in camera coordinates.
+        """
+        if not isinstance(tracklets, TrackletTable):
+            tracklets = TrackletTable.from_tracklets(tracklets)
+
+        return calibration.transform(tracklets)
+
+    @staticmethod
+    def _group_tracklets_by_label_file(
+        tracklets: Union[Iterable[Tracklet], TrackletTable],
+        label_dict: Dict[int, str],
+    ) -> Dict[str, _LabelGroup]:
+        """Groups tracklets by the name of the label file of their frame.
+
+        Frames missing from the frame list are named by their frame number.
+        The tracklets within a label file keep the order of the input. Label
+        files follow the order of the input or, for a table, the ascending
+        frame number.
+
+        Arguments:
+            tracklets (Union[Iterable[Tracklet], TrackletTable]): The tracklets or the table of tracklets to group.
+            label_dict (Dict[int, str]): The mapping of frame numbers to file prefixes.
+
+        Returns:
+            Dict[str, _LabelGroup]: The tracklets per label file name.
+        """
+        if isinstance(tracklets, TrackletTable):
+            table = tracklets.sort()
+            frame_numbers, starts = np.unique(
+                table.frame_number, return_index=True
+            )
+            stops = np.append(starts[1:], len(table))
+            return {
+                str(label_dict.get(frame_number, frame_number)): table[
+                    start:stop
+                ]
+                for frame_number, start, stop in zip(
+                    frame_numbers.tolist(), starts.tolist(), stops.tolist()
+                )
+            }
+
+        groups: Dict[str, List[Tracklet]] = {}
         for tracklet in tracklets:
-            label = TrackletParser._map_tracklet_to_KITTI(tracklet)
             label_file_name = label_dict.get(
                 tracklet.frame_number, tracklet.frame_number
             )
-            label_file = path.join(output_dir, f"{label_file_name}.txt")
-
-            TrackletParser._write_label_to_file(
-                label_file, label, tracklet.frame_number, frames
-            )
+            groups.setdefault(str(label_file_name), []).append(tracklet)
+        return groups
 
     @staticmethod
-    def _load_frame_list(frame_list: str) -> Dict[int, str]:
+    def _load_frame_list(frame_list: Union[str, BinaryIO]) -> Dict[int, str]:
         """Loads the frame list from the given file.
 
         Arguments:
-            frame_list (str): The frame list file path.
+            frame_list (Union[str, BinaryIO]): The frame list file path, a compressed file path, a CVAT export zip archive or a binary stream.
 
         Returns:
             Dict[int, str]: A dictionary mapping frame numbers to file prefixes.
 
+        Raises:
+            ValueError: If a line is malformed or a frame number is listed twice.
+
         Example:
             Input (frame list):
                 0 frame_0000
@@ -170,30 +1489,18 @@ class TrackletParser:
             Output:
                 {0: "frame_0000", 1: "frame_0001", 2: "frame_0002"}
         """
-        if not path.exists(frame_list):
+        try:
+            # The CVAT export includes a frame list containing frame index
+            # and point cloud file mapping which can be used to create label
+            # files with same naming as its corresponding point cloud file
+            return read_frame_list(frame_list)
+        except FileNotFoundError:
             TrackletParser._LOGGER.warning(
                 "CVAT frame list file not found. Label file names will be generated "
                 "using numerical ascending order based on frame numbers."
             )
             return {}
 
-        # The CVAT export includes a frame list containing frame index and
-        # point cloud file mapping which can be used to create label files with
-        # same naming as its corresponding point cloud file
-        label_data = read_table(
-            frame_list,
-            sep=" ",
-            names=["Frame Number", "Point Cloud File"],
-            dtype=str,
-        )
-
-        return dict(
-            zip(
-                map(int, label_data["Frame Number"]),
-                label_data["Point Cloud File"],
-            )
-        )
-
     @staticmethod
     def _map_tracklet_to_KITTI(tracklet: Tracklet) -> str:
         """Maps a tracklet object to KITTI format.
@@ -204,42 +1511,4 @@ class TrackletParser:
         Returns:
             str: The tracklet in KITTI format.
         """
-        information = [
-            tracklet.type,
-            tracklet.truncated,
-            tracklet.occluded,
-            tracklet.alpha,
-            tracklet.bbox["left"],
-            tracklet.bbox["top"],
-            tracklet.bbox["right"],
-            tracklet.bbox["bottom"],
-            tracklet.dimensions["height"],
-            tracklet.dimensions["width"],
-            tracklet.dimensions["length"],
-            tracklet.location["x"],
-            tracklet.location["y"],
-            tracklet.location["z"],
-            tracklet.rotation_z,
-        ]
-        return " ".join(map(str, information))
-
-    @staticmethod
-    def _write_label_to_file(
-        label_file: str, label: str, frame_number: int, frames: List[int]
-    ) -> None:
-        """Writes a label to a specified file, either appending to it or
-        creating a new file.
-
-        Arguments:
-            label_file (str): The path to the file where the label should be written.
-            label (str): The label content to write to the file.
-            frame_number (int): The frame number associated with the label.
-            frames (List[int]): A list of frame numbers to track which frames have been seen.
-        """
-        mode = "a" if frame_number in frames else "w"
-
-        with open(label_file, mode, encoding="utf-8") as kitti_file:
-            kitti_file.write(f"{label}\n")
-
-        if frame_number not in frames:
-            frames.append(frame_number)
+        return format_kitti_label(tracklet)
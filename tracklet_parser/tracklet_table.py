@@ -0,0 +1,687 @@
+from array import array
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from tracklet_parser.track import Track, check_occlusions
+from tracklet_parser.tracklet import BBox, Dimensions, Location, Tracklet
+
+
+class TrackletTable:
+    """A columnar container of tracklets backed by NumPy arrays.
+
+    Every attribute of a tracklet is stored in its own column, which keeps
+    millions of boxes compact and allows vectorized filtering and sorting.
+    Object types are stored as integer codes into `types`.
+
+    ## Example:
+
+    ```python
+    table = TrackletParser.parse_tracklet_table("path/to/tracklet_labels.xml")
+
+    cars = table.where_type("Car")
+    close_cars = cars.filter(cars.location[:, 0] < 20.0)
+    tracklet = close_cars[0]
+    ```
+    """
+
+    COLUMNS: Tuple[str, ...] = (
+        "frame_number",
+        "type_code",
+        "truncated",
+        "occluded",
+        "alpha",
+        "bbox",
+        "dimensions",
+        "location",
+        "rotation_z",
+    )
+    _DTYPES: Dict[str, np.dtype] = {
+        "frame_number": np.dtype(np.int64),
+        "type_code": np.dtype(np.int32),
+        "truncated": np.dtype(np.float64),
+        "occluded": np.dtype(np.int8),
+        "alpha": np.dtype(np.float64),
+        "bbox": np.dtype(np.float64),
+        "dimensions": np.dtype(np.float64),
+        "location": np.dtype(np.float64),
+        "rotation_z": np.dtype(np.float64),
+    }
+    _WIDTHS: Dict[str, int] = {"bbox": 4, "dimensions": 3, "location": 3}
+
+    _types: Tuple[str, ...]
+    _columns: Dict[str, np.ndarray]
+
+    def __init__(self, types: Sequence[str], **columns: np.ndarray):
+        """Creates a table from its columns.
+
+        Arguments:
+            types (Sequence[str]): The object types referenced by `type_code`.
+            **columns (np.ndarray): One array per entry of `COLUMNS`.
+
+        Raises:
+            ValueError: If a column is missing or the column lengths differ.
+        """
+        missing = set(TrackletTable.COLUMNS) - set(columns)
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(sorted(missing))}")
+
+        self._types = tuple(types)
+        self._columns = {}
+        for name in TrackletTable.COLUMNS:
+            column = np.asarray(columns[name], TrackletTable._DTYPES[name])
+            if name in TrackletTable._WIDTHS:
+                column = column.reshape(-1, TrackletTable._WIDTHS[name])
+            self._columns[name] = column
+
+        lengths = {len(column) for column in self._columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length.")
+
+    @classmethod
+    def empty(cls) -> "TrackletTable":
+        """Creates a table without any rows.
+
+        Returns:
+            TrackletTable: The empty table
+        """
+
+        return cls(
+            (),
+            **{name: np.empty(0, cls._DTYPES[name]) for name in cls.COLUMNS},
+        )
+
+    @classmethod
+    def from_tracks(cls, tracks: Iterable[Track]) -> "TrackletTable":
+        """Fills a table with the per-frame boxes of the given tracks without
+        creating intermediate Tracklet objects.
+
+        Arguments:
+            tracks (Iterable[Track]): The tracks to expand.
+
+        Returns:
+            TrackletTable: The table holding one row per track and frame
+
+        Raises:
+            ValueError: If a truncation state is out of range or an occlusion state is no integer in range.
+        """
+        stride = len(Track.POSE_FIELDS)
+        default_pose = array("d", [0.0] * stride)
+        type_codes: Dict[str, int] = {}
+        codes = array("i")
+        first_frames = array("q")
+        counts = array("q")
+        dimensions = array("d")
+        poses = array("d")
+
+        for track in tracks:
+            codes.append(type_codes.setdefault(track.type, len(type_codes)))
+            first_frames.append(track.first_frame)
+            counts.append(len(track))
+            dimensions.extend(track.dimensions)
+            if track.pose_count:
+                poses.frombytes(track.poses.cast("B"))
+            else:
+                poses.extend(default_pose)
+
+        counts_array = np.frombuffer(counts, np.int64)
+        total = int(counts_array.sum())
+        starts = np.repeat(
+            np.cumsum(counts_array) - counts_array, counts_array
+        )
+        pose_array = np.frombuffer(poses, np.float64).reshape(-1, stride)
+
+        truncated = pose_array[:, 5].copy()
+        # The states are validated before the cast, which would wrap them
+        TrackletTable._validate_states(truncated, pose_array[:, 4])
+        occluded = pose_array[:, 4].astype(np.int8)
+
+        return cls(
+            type_codes,
+            frame_number=np.repeat(
+                np.frombuffer(first_frames, np.int64), counts_array
+            )
+            + (np.arange(total) - starts),
+            type_code=np.repeat(np.frombuffer(codes, np.int32), counts_array),
+            truncated=truncated,
+            occluded=occluded,
+            alpha=np.zeros(total),
+            bbox=np.zeros((total, 4)),
+            dimensions=np.repeat(
+                np.frombuffer(dimensions, np.float64).reshape(-1, 3),
+                counts_array,
+                axis=0,
+            ),
+            location=pose_array[:, 0:3].copy(),
+            rotation_z=pose_array[:, 3].copy(),
+        )
+
+    @classmethod
+    def from_tracklets(cls, tracklets: Iterable[Tracklet]) -> "TrackletTable":
+        """Fills a table with the given tracklets.
+
+        Arguments:
+            tracklets (Iterable[Tracklet]): The tracklets to store.
+
+        Returns:
+            TrackletTable: The table holding one row per tracklet
+        """
+        type_codes: Dict[str, int] = {}
+        rows: List[tuple] = []
+        for tracklet in tracklets:
+            rows.append(
+                (
+                    tracklet.frame_number,
+                    type_codes.setdefault(tracklet.type, len(type_codes)),
+                    tracklet.truncated,
+                    tracklet.occluded,
+                    tracklet.alpha,
+                    tracklet.bbox,
+                    tracklet.dimensions,
+                    tracklet.location,
+                    tracklet.rotation_z,
+                )
+            )
+
+        if not rows:
+            return cls.empty()
+        return cls(
+            type_codes,
+            **{
+                name: column
+                for name, column in zip(TrackletTable.COLUMNS, zip(*rows))
+            },
+        )
+
+    @classmethod
+    def concatenate(cls, tables: Iterable["TrackletTable"]) -> "TrackletTable":
+        """Appends the rows of several tables, e.g. of independently parsed
+        shards, merging their object types.
+
+        Arguments:
+            tables (Iterable[TrackletTable]): The tables in order.
+
+        Returns:
+            TrackletTable: The table holding the rows of all tables
+        """
+        tables = list(tables)
+        if not tables:
+            return cls.empty()
+
+        type_codes: Dict[str, int] = {}
+        type_code_columns: List[np.ndarray] = []
+        for table in tables:
+            code_map = np.array(
+                [
+                    type_codes.setdefault(object_type, len(type_codes))
+                    for object_type in table.types
+                ],
+                np.int32,
+            )
+            type_code_columns.append(code_map[table.type_code])
+        return cls(
+            type_codes,
+            **{
+                name: np.concatenate(
+                    [table._columns[name] for table in tables]
+                )
+                for name in TrackletTable.COLUMNS
+                if name != "type_code"
+            },
+            type_code=np.concatenate(type_code_columns),
+        )
+
+    @classmethod
+    def merge(
+        cls, tables: Iterable["TrackletTable"], by: str = "frame_number"
+    ) -> "TrackletTable":
+        """Merges tables which are each sorted by a one-dimensional column,
+        e.g. the frame-sorted tables of independently parsed shards.
+
+        The sorted runs are merged pairwise with binary searches instead of
+        sorting all rows again. Rows with equal keys keep the order of their
+        tables, so the result equals `concatenate(tables).sort(by)`. Tables
+        whose key ranges do not overlap are only concatenated.
+
+        Arguments:
+            tables (Iterable[TrackletTable]): The sorted tables in order.
+            by (str): The column the tables are sorted by.
+
+        Returns:
+            TrackletTable: The sorted table holding the rows of all tables
+
+        Raises:
+            ValueError: If the column is unknown or not one-dimensional.
+        """
+        if by not in cls.COLUMNS or by in cls._WIDTHS:
+            raise ValueError(f"Cannot merge by column '{by}'.")
+
+        tables = list(tables)
+        table = cls.concatenate(tables)
+        keys = table._columns[by]
+        if np.all(keys[1:] >= keys[:-1]):
+            return table
+
+        bounds = np.cumsum([0] + [len(part) for part in tables])
+        runs = [
+            np.arange(start, stop) for start, stop in zip(bounds, bounds[1:])
+        ]
+        while len(runs) > 1:
+            merged_runs = [
+                TrackletTable._merge_runs(keys, left, right)
+                for left, right in zip(runs[0::2], runs[1::2])
+            ]
+            if len(runs) % 2:
+                merged_runs.append(runs[-1])
+            runs = merged_runs
+        return table.filter(runs[0])
+
+    @property
+    def types(self) -> Tuple[str, ...]:
+        """Get the object types referenced by the `type_code` column.
+
+        Returns:
+            Tuple[str, ...]: The object types
+        """
+
+        return self._types
+
+    @property
+    def frame_number(self) -> np.ndarray:
+        """Get the frame number column.
+
+        Returns:
+            np.ndarray: The frame numbers
+        """
+
+        return self._columns["frame_number"]
+
+    @property
+    def type_code(self) -> np.ndarray:
+        """Get the object type column as indices into `types`.
+
+        Returns:
+            np.ndarray: The object type codes
+        """
+
+        return self._columns["type_code"]
+
+    @property
+    def truncated(self) -> np.ndarray:
+        """Get the truncation state column.
+
+        Returns:
+            np.ndarray: The truncation states
+        """
+
+        return self._columns["truncated"]
+
+    @property
+    def occluded(self) -> np.ndarray:
+        """Get the occlusion state column.
+
+        Returns:
+            np.ndarray: The occlusion states
+        """
+
+        return self._columns["occluded"]
+
+    @property
+    def alpha(self) -> np.ndarray:
+        """Get the observation angle column.
+
+        Returns:
+            np.ndarray: The observation angles
+        """
+
+        return self._columns["alpha"]
+
+    @property
+    def bbox(self) -> np.ndarray:
+        """Get the 2D bounding box column with the left, top, right and bottom
+        pixel coordinates.
+
+        Returns:
+            np.ndarray: The 2D bounding boxes of shape (n, 4)
+        """
+
+        return self._columns["bbox"]
+
+    @property
+    def dimensions(self) -> np.ndarray:
+        """Get the 3D object dimension column with height, width and length
+        (in meters).
+
+        Returns:
+            np.ndarray: The 3D object dimensions of shape (n, 3)
+        """
+
+        return self._columns["dimensions"]
+
+    @property
+    def location(self) -> np.ndarray:
+        """Get the 3D object location column with x, y and z in LiDAR
+        coordinates (in meters).
+
+        Returns:
+            np.ndarray: The 3D object locations of shape (n, 3)
+        """
+
+        return self._columns["location"]
+
+    @property
+    def rotation_z(self) -> np.ndarray:
+        """Get the rotation angle column.
+
+        Returns:
+            np.ndarray: The rotation angles
+        """
+
+        return self._columns["rotation_z"]
+
+    def type_mask(self, *object_types: str) -> np.ndarray:
+        """Creates a boolean mask selecting the rows of the given types.
+
+        Arguments:
+            *object_types (str): The object types to select.
+
+        Returns:
+            np.ndarray: The boolean row mask
+        """
+        codes = [
+            code
+            for code, object_type in enumerate(self._types)
+            if object_type in object_types
+        ]
+        return np.isin(self.type_code, codes)
+
+    def where_type(self, *object_types: str) -> "TrackletTable":
+        """Selects the rows of the given object types.
+
+        Arguments:
+            *object_types (str): The object types to select.
+
+        Returns:
+            TrackletTable: The table holding the selected rows
+        """
+
+        return self.filter(self.type_mask(*object_types))
+
+    def filter(self, mask: np.ndarray) -> "TrackletTable":
+        """Selects rows by a boolean mask or an array of row indices.
+
+        Arguments:
+            mask (np.ndarray): The boolean mask or the row indices.
+
+        Returns:
+            TrackletTable: The table holding the selected rows
+        """
+
+        return TrackletTable(
+            self._types,
+            **{name: column[mask] for name, column in self._columns.items()},
+        )
+
+    def replace(self, **columns: np.ndarray) -> "TrackletTable":
+        """Creates a table sharing all but the given columns.
+
+        Arguments:
+            **columns (np.ndarray): The replacing columns by name.
+
+        Returns:
+            TrackletTable: The table holding the replaced columns
+
+        Raises:
+            ValueError: If a column is unknown or its length differs.
+        """
+        unknown = set(columns) - set(TrackletTable.COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(sorted(unknown))}")
+
+        return TrackletTable(self._types, **{**self._columns, **columns})
+
+    def sort(self, by: str = "frame_number") -> "TrackletTable":
+        """Sorts the rows by a one-dimensional column. The sort is stable, so
+        rows with equal keys keep their relative order.
+
+        Arguments:
+            by (str): The column to sort by.
+
+        Returns:
+            TrackletTable: The sorted table
+
+        Raises:
+            ValueError: If the column is unknown or not one-dimensional.
+        """
+        if by not in self._columns or by in TrackletTable._WIDTHS:
+            raise ValueError(f"Cannot sort by column '{by}'.")
+
+        return self.filter(np.argsort(self._columns[by], kind="stable"))
+
+    def to_tracklets(self) -> List[Tracklet]:
+        """Materializes every row as a Tracklet object.
+
+        Returns:
+            List[Tracklet]: The tracklets
+        """
+        tracklets: List[Tracklet] = []
+        for row in zip(
+            self.frame_number.tolist(),
+            self.type_code.tolist(),
+            self.truncated.tolist(),
+            self.occluded.tolist(),
+            self.alpha.tolist(),
+            self.bbox.tolist(),
+            self.dimensions.tolist(),
+            self.location.tolist(),
+            self.rotation_z.tolist(),
+        ):
+            tracklet = Tracklet()
+            tracklet.frame_number = row[0]
+            tracklet.type = self._types[row[1]]
+            tracklet.truncated = row[2]
+            tracklet.occluded = row[3]
+            tracklet.alpha = row[4]
+            tracklet.bbox = row[5]
+            tracklet.dimensions = row[6]
+            tracklet.location = row[7]
+            tracklet.rotation_z = row[8]
+            tracklets.append(tracklet)
+        return tracklets
+
+    def __len__(self) -> int:
+        """Get the number of rows.
+
+        Returns:
+            int: The number of rows
+        """
+
+        return len(self._columns["frame_number"])
+
+    def __getitem__(
+        self, index: Union[int, slice, np.ndarray]
+    ) -> Union["TrackletView", "TrackletTable"]:
+        """Accesses a single row as a TrackletView or selects several rows.
+
+        Arguments:
+            index (Union[int, slice, np.ndarray]): The row index, a slice, a
+                boolean mask or an array of row indices.
+
+        Returns:
+            Union[TrackletView, TrackletTable]: The row view or the table of
+                selected rows
+
+        Raises:
+            IndexError: If the row index is out of range.
+        """
+        if isinstance(index, (int, np.integer)):
+            if not -len(self) <= index < len(self):
+                raise IndexError(f"Row index {index} is out of range.")
+            return TrackletView(self, int(index) % len(self))
+        return self.filter(index)
+
+    def __iter__(self) -> Iterator["TrackletView"]:
+        """Iterate over lightweight views of all rows.
+
+        Returns:
+            Iterator[TrackletView]: An iterator over the row views
+        """
+
+        return (TrackletView(self, index) for index in range(len(self)))
+
+    @staticmethod
+    def _merge_runs(
+        keys: np.ndarray, left: np.ndarray, right: np.ndarray
+    ) -> np.ndarray:
+        """Merges two runs of row indices whose keys are sorted, keeping the
+        rows of the left run first among equal keys.
+
+        Arguments:
+            keys (np.ndarray): The sort keys of all rows.
+            left (np.ndarray): The row indices of the first run.
+            right (np.ndarray): The row indices of the second run.
+
+        Returns:
+            np.ndarray: The row indices of both runs in key order
+        """
+        left_keys = keys[left]
+        right_keys = keys[right]
+        merged = np.empty(len(left) + len(right), left.dtype)
+        merged[
+            np.arange(len(left))
+            + np.searchsorted(right_keys, left_keys, side="left")
+        ] = left
+        merged[
+            np.arange(len(right))
+            + np.searchsorted(left_keys, right_keys, side="right")
+        ] = right
+        return merged
+
+    @staticmethod
+    def _validate_states(truncated: np.ndarray, occluded: np.ndarray):
+        """Validates the truncation and occlusion columns.
+
+        Arguments:
+            truncated (np.ndarray): The truncation states
+            occluded (np.ndarray): The occlusion states as floats
+
+        Raises:
+            ValueError: If a truncation state is out of range or an occlusion state is no integer in range.
+        """
+        # NaN fails both comparisons and is rejected as well
+        invalid = ~((truncated >= 0) & (truncated <= 1))
+        if invalid.any():
+            raise ValueError(
+                f"{truncated[invalid][0]} is an unknown truncation"
+                " representative."
+            )
+        invalid = (occluded < 0) | (occluded > 3) | (occluded % 1 != 0)
+        if invalid.any():
+            check_occlusions(occluded[invalid][:1].tolist())
+
+
+class TrackletView:
+    """A read-only view of a single row of a TrackletTable.
+
+    The view mirrors the getters of Tracklet without copying the row, so it
+    can be passed wherever a tracklet is only read.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    _table: TrackletTable
+    _index: int
+
+    def __init__(self, table: TrackletTable, index: int):
+        self._table = table
+        self._index = index
+
+    @property
+    def frame_number(self) -> int:
+        """Get the frame number.
+
+        Returns:
+            int: The frame number
+        """
+
+        return int(self._table.frame_number[self._index])
+
+    @property
+    def type(self) -> str:
+        """Get the object type.
+
+        Returns:
+            str: The object type
+        """
+
+        return self._table.types[self._table.type_code[self._index]]
+
+    @property
+    def truncated(self) -> float:
+        """Get the truncation state.
+
+        Returns:
+            float: The truncation state
+        """
+
+        return float(self._table.truncated[self._index])
+
+    @property
+    def occluded(self) -> int:
+        """Get the occlusion state.
+
+        Returns:
+            int: The occlusion state
+        """
+
+        return int(self._table.occluded[self._index])
+
+    @property
+    def alpha(self) -> float:
+        """Get the observation angle.
+
+        Returns:
+            float: The observation angle
+        """
+
+        return float(self._table.alpha[self._index])
+
+    @property
+    def bbox(self) -> BBox:
+        """Get the 2D bounding box.
+
+        Returns:
+            BBox: The 2D bounding box
+        """
+
+        return BBox(*self._table.bbox[self._index].tolist())
+
+    @property
+    def dimensions(self) -> Dimensions:
+        """Get the 3D object dimensions.
+
+        Returns:
+            Dimensions: The 3D object dimensions
+        """
+
+        return Dimensions(*self._table.dimensions[self._index].tolist())
+
+    @property
+    def location(self) -> Location:
+        """Get the 3D object location.
+
+        Returns:
+            Location: The 3D object location
+        """
+
+        return Location(*self._table.location[self._index].tolist())
+
+    @property
+    def rotation_z(self) -> float:
+        """Get the rotation angle.
+
+        Returns:
+            float: The rotation angle
+        """
+
+        return float(self._table.rotation_z[self._index])
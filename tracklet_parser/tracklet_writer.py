@@ -0,0 +1,255 @@
+from os import makedirs, path, remove, replace, scandir
+from typing import BinaryIO, Dict, List, Tuple, Union
+from xml.sax.saxutils import escape
+
+# Number of fields of a KITTI label line, without an optional score
+_KITTI_FIELDS: int = 15
+_HEADER: bytes = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes" ?>\n'
+    b"<!DOCTYPE boost_serialization>\n"
+    b'<boost_serialization signature="serialization::archive" version="9">\n'
+    b'<tracklets class_id="0" tracking_level="0" version="0">\n'
+)
+_FOOTER: bytes = b"</tracklets>\n</boost_serialization>\n"
+
+
+def _track_template(item: str, poses: str, pose: str) -> str:
+    """Creates the `%` template of a track with a single pose.
+
+    Boost serialization describes every class on its first occurrence, so
+    the first track carries the class attributes of the track, its poses
+    and the pose.
+
+    Arguments:
+        item (str): The attributes of the track item.
+        poses (str): The attributes of the poses.
+        pose (str): The attributes of the pose item.
+
+    Returns:
+        str: The template of the object type, the height, width and length, the first frame, the x, y and z coordinates, the yaw, the occlusion and the truncation.
+    """
+
+    return (
+        f"  <item{item}>\n"
+        "    <objectType>%s</objectType>\n"
+        "    <h>%s</h>\n"
+        "    <w>%s</w>\n"
+        "    <l>%s</l>\n"
+        "    <first_frame>%d</first_frame>\n"
+        f"    <poses{poses}>\n"
+        "      <count>1</count>\n"
+        "      <item_version>2</item_version>\n"
+        f"      <item{pose}>\n"
+        "        <tx>%s</tx>\n"
+        "        <ty>%s</ty>\n"
+        "        <tz>%s</tz>\n"
+        "        <rx>0</rx>\n"
+        "        <ry>0</ry>\n"
+        "        <rz>%s</rz>\n"
+        "        <state>1</state>\n"
+        "        <occlusion>%s</occlusion>\n"
+        "        <occlusion_kf>1</occlusion_kf>\n"
+        "        <truncation>%s</truncation>\n"
+        "        <amt_occlusion>-1</amt_occlusion>\n"
+        "        <amt_occlusion_kf>-1</amt_occlusion_kf>\n"
+        "        <amt_border_l>-1</amt_border_l>\n"
+        "        <amt_border_r>-1</amt_border_r>\n"
+        "        <amt_border_kf>-1</amt_border_kf>\n"
+        "      </item>\n"
+        "    </poses>\n"
+        "    <finished>1</finished>\n"
+        "  </item>\n"
+    )
+
+
+_FIRST_TRACK: str = _track_template(
+    ' class_id="1" tracking_level="0" version="1"',
+    ' class_id="2" tracking_level="0" version="0"',
+    ' class_id="3" tracking_level="0" version="2"',
+)
+_TRACK: str = _track_template("", "", "")
+
+
+def write_tracklet_xml(
+    label_dir: str,
+    label_dict: Dict[int, str],
+    tracklet_xml: Union[str, BinaryIO],
+) -> int:
+    """Writes the KITTI label files of a directory as a tracklet XML file in
+    the boost serialization layout of CVAT.
+
+    KITTI labels do not identify objects across frames, so every box
+    becomes a track with a single pose. The label files are expected in the
+    LiDAR coordinates written by `TrackletParser.convert_tracklets_to_kitti`
+    without a calibration; the yaw is taken from the rotation field. The
+    numbers are copied verbatim from the label files.
+
+    The file is written in two streaming passes: the first counts the boxes
+    of every label file, since the count precedes the tracks, and the
+    second writes the tracks label file by label file. Only a single label
+    file is held in memory at a time.
+
+    Arguments:
+        label_dir (str): The directory of KITTI label files (`*.txt`).
+        label_dict (Dict[int, str]): The mapping of frame numbers to label file names without extension, e.g. from a CVAT frame list. Label files missing from it must be named by their frame number.
+        tracklet_xml (Union[str, BinaryIO]): The path to the tracklet XML file, which is replaced once complete, or a binary stream, e.g. `sys.stdout.buffer`.
+
+    Returns:
+        int: The number of boxes written
+
+    Raises:
+        FileNotFoundError: If the label directory does not exist.
+        ValueError: If a label file cannot be mapped to a frame, a label line is malformed or a label file changes between the passes.
+    """
+    label_files = _find_label_files(label_dir, label_dict)
+    counts = [_count_boxes(label_file) for _, label_file in label_files]
+
+    if not isinstance(tracklet_xml, str):
+        _write_tracks(tracklet_xml, label_files, counts)
+        return sum(counts)
+
+    parent = path.dirname(tracklet_xml)
+    if parent:
+        makedirs(parent, exist_ok=True)
+    temporary_file = f"{tracklet_xml}.tmp"
+    try:
+        with open(temporary_file, "wb") as xml_stream:
+            _write_tracks(xml_stream, label_files, counts)
+        replace(temporary_file, tracklet_xml)
+    except (OSError, ValueError):
+        if path.exists(temporary_file):
+            remove(temporary_file)
+        raise
+    return sum(counts)
+
+
+def _find_label_files(
+    label_dir: str, label_dict: Dict[int, str]
+) -> List[Tuple[int, str]]:
+    """Finds the label files of a directory and their frame numbers.
+
+    Arguments:
+        label_dir (str): The directory of KITTI label files.
+        label_dict (Dict[int, str]): The mapping of frame numbers to label file names without extension.
+
+    Returns:
+        List[Tuple[int, str]]: The frame number and the path of every label file sorted by frame number.
+
+    Raises:
+        FileNotFoundError: If the label directory does not exist.
+        ValueError: If a label file cannot be mapped to a frame.
+    """
+    frame_numbers = {name: number for number, name in label_dict.items()}
+    label_files: List[Tuple[int, str]] = []
+    with scandir(label_dir) as entries:
+        for entry in entries:
+            name, extension = path.splitext(entry.name)
+            if extension != ".txt" or not entry.is_file():
+                continue
+            frame_number = frame_numbers.get(name)
+            if frame_number is None:
+                try:
+                    frame_number = int(name)
+                except ValueError as error:
+                    raise ValueError(
+                        f"{entry.name} is neither in the frame list nor"
+                        " named by a frame number."
+                    ) from error
+            label_files.append((frame_number, entry.path))
+    label_files.sort()
+    return label_files
+
+
+def _count_boxes(label_file: str) -> int:
+    """Counts the boxes of a label file.
+
+    Arguments:
+        label_file (str): The path to the label file.
+
+    Returns:
+        int: The number of non-empty lines
+    """
+    with open(label_file, "rb") as label_stream:
+        return sum(1 for line in label_stream if line.strip())
+
+
+def _write_tracks(
+    xml_stream: BinaryIO,
+    label_files: List[Tuple[int, str]],
+    counts: List[int],
+) -> None:
+    """Writes the tracklet XML document, one label file at a time.
+
+    Arguments:
+        xml_stream (BinaryIO): The binary output stream.
+        label_files (List[Tuple[int, str]]): The frame number and the path of every label file.
+        counts (List[int]): The number of boxes of every label file.
+
+    Raises:
+        ValueError: If a label line is malformed or a label file changed since its boxes were counted.
+    """
+    xml_stream.write(_HEADER)
+    xml_stream.write(
+        f"  <count>{sum(counts)}</count>\n"
+        "  <item_version>1</item_version>\n".encode("utf-8")
+    )
+    template = _FIRST_TRACK
+    for (frame_number, label_file), count in zip(label_files, counts):
+        tracks = _format_tracks(label_file, frame_number, template)
+        if len(tracks) != count:
+            raise ValueError(f"{label_file} changed while being converted.")
+        if tracks:
+            xml_stream.write("".join(tracks).encode("utf-8"))
+            template = _TRACK
+    xml_stream.write(_FOOTER)
+    xml_stream.flush()
+
+
+def _format_tracks(
+    label_file: str, frame_number: int, first_template: str
+) -> List[str]:
+    """Formats every box of a label file as a track.
+
+    Arguments:
+        label_file (str): The path to the label file.
+        frame_number (int): The frame number of the label file.
+        first_template (str): The template of the first track.
+
+    Returns:
+        List[str]: The formatted tracks
+
+    Raises:
+        ValueError: If a label line is malformed.
+    """
+    tracks: List[str] = []
+    template = first_template
+    with open(label_file, encoding="utf-8") as label_stream:
+        for line_number, line in enumerate(label_stream, 1):
+            fields = line.split()
+            if not fields:
+                continue
+            try:
+                if len(fields) not in (_KITTI_FIELDS, _KITTI_FIELDS + 1):
+                    raise ValueError(f"{len(fields)} fields")
+                int(fields[2])
+                for field in fields[3:_KITTI_FIELDS]:
+                    float(field)
+                float(fields[1])
+            except ValueError as error:
+                raise ValueError(
+                    f"Line {line_number} of {label_file} is malformed."
+                ) from error
+
+            tracks.append(
+                template
+                % (
+                    escape(fields[0]),
+                    *fields[8:11],
+                    frame_number,
+                    *fields[11:15],
+                    fields[2],
+                    fields[1],
+                )
+            )
+            template = _TRACK
+    return tracks
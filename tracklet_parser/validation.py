@@ -0,0 +1,168 @@
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from tracklet_parser.tracklet import Dimensions
+from tracklet_parser.tracklet_table import TrackletTable
+
+
+@dataclass
+class ValidationReport:
+    """Summarizes the quality checks and statistics of a set of boxes."""
+
+    boxes: int = 0
+    # Boxes with a NaN in any of their floating point fields
+    nan_boxes: int = 0
+    # Boxes with a height, width or length of zero or less
+    non_positive_dimensions: int = 0
+    # Boxes equal to another box of the same frame in type, dimensions,
+    # location and rotation, e.g. of a track annotated twice
+    duplicate_boxes: int = 0
+    # Frame numbers with boxes which are missing from the frame list
+    missing_frames: List[int] = field(default_factory=list)
+    class_counts: Dict[str, int] = field(default_factory=dict)
+    # The bin edges of the size histograms per dimension
+    size_bin_edges: Dict[str, List[float]] = field(default_factory=dict)
+    # The box counts per bin by class and dimension
+    size_histograms: Dict[str, Dict[str, List[int]]] = field(
+        default_factory=dict
+    )
+
+    @property
+    def valid(self) -> bool:
+        """Get whether all checks passed.
+
+        Returns:
+            bool: Whether no box failed a check
+        """
+
+        return not self.errors()
+
+    def errors(self) -> List[str]:
+        """Describes the failed checks.
+
+        Returns:
+            List[str]: One message per failed check
+        """
+        errors: List[str] = []
+        if self.nan_boxes:
+            errors.append(f"{self.nan_boxes} boxes contain NaN values")
+        if self.non_positive_dimensions:
+            errors.append(
+                f"{self.non_positive_dimensions} boxes have non-positive"
+                " dimensions"
+            )
+        if self.duplicate_boxes:
+            errors.append(f"{self.duplicate_boxes} boxes are duplicates")
+        if self.missing_frames:
+            errors.append(
+                f"{len(self.missing_frames)} frames are missing from the"
+                f" frame list, e.g. {self.missing_frames[0]}"
+            )
+        return errors
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the report into JSON serializable types.
+
+        Returns:
+            Dict[str, Any]: The report
+        """
+
+        return asdict(self)
+
+
+class ValidationError(ValueError):
+    """Raised if boxes fail the quality checks before they are written."""
+
+    report: ValidationReport
+
+    def __init__(self, report: ValidationReport):
+        super().__init__(f"Validation failed: {'; '.join(report.errors())}.")
+        self.report = report
+
+
+def validate_table(
+    table: TrackletTable,
+    label_dict: Optional[Dict[int, str]] = None,
+    bins: int = 10,
+) -> ValidationReport:
+    """Checks a table of boxes and computes its statistics in vectorized
+    passes over its columns.
+
+    Arguments:
+        table (TrackletTable): The boxes to validate.
+        label_dict (Optional[Dict[int, str]]): The frame list to check the frame numbers against, or None or an empty frame list to skip the check.
+        bins (int): The number of bins of the size histograms.
+
+    Returns:
+        ValidationReport: The results of the checks and the statistics
+
+    Raises:
+        ValueError: If the number of bins is invalid.
+    """
+    if bins < 1:
+        raise ValueError(f"{bins} is an invalid number of bins.")
+
+    values = np.column_stack(
+        (
+            table.truncated,
+            table.alpha,
+            table.rotation_z,
+            table.bbox,
+            table.dimensions,
+            table.location,
+        )
+    )
+    report = ValidationReport(
+        boxes=len(table),
+        nan_boxes=int(np.isnan(values).any(axis=1).sum()),
+        non_positive_dimensions=int((table.dimensions <= 0).any(axis=1).sum()),
+    )
+
+    if len(table):
+        # Adding zero turns -0.0 into 0.0, so that equal rows of the
+        # contiguous array are equal bytes and are compared as such
+        boxes = (
+            np.column_stack(
+                (
+                    table.frame_number,
+                    table.type_code,
+                    table.dimensions,
+                    table.location,
+                    table.rotation_z,
+                )
+            )
+            + 0.0
+        )
+        rows = boxes.view(
+            np.dtype((np.void, boxes.itemsize * boxes.shape[1]))
+        ).ravel()
+        report.duplicate_boxes = len(table) - len(np.unique(rows))
+
+    if label_dict:
+        report.missing_frames = np.setdiff1d(
+            table.frame_number,
+            np.fromiter(label_dict, np.int64, len(label_dict)),
+        ).tolist()
+
+    counts = np.bincount(table.type_code, minlength=len(table.types))
+    report.class_counts = {
+        object_type: int(count)
+        for object_type, count in zip(table.types, counts)
+        if count
+    }
+
+    finite = np.isfinite(table.dimensions)
+    for index, dimension in enumerate(Dimensions._fields):
+        column = table.dimensions[:, index]
+        edges = np.histogram_bin_edges(column[finite[:, index]], bins)
+        report.size_bin_edges[dimension] = edges.tolist()
+        for code, object_type in enumerate(table.types):
+            if object_type not in report.class_counts:
+                continue
+            selected = finite[:, index] & (table.type_code == code)
+            histogram = report.size_histograms.setdefault(object_type, {})
+            bin_counts, _ = np.histogram(column[selected], edges)
+            histogram[dimension] = bin_counts.tolist()
+    return report